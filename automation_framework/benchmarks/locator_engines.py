@@ -0,0 +1,92 @@
+# python
+"""
+Compare XPath vs compiled CSS resolution time for every registered locator.
+
+Usage:
+    python -m automation_framework.benchmarks.locator_engines [--snapshot inventory] [--iterations 200]
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from playwright.sync_api import Page, sync_playwright
+
+from automation_framework.config import global_config as gc
+from automation_framework.pages.locators.registry import get_registry
+
+
+
+def _time_count(page: Page, selector: str, iterations: int) -> tuple[float, int]:
+    locator = page.locator(selector)
+    matched = locator.count()  # warm the selector engine
+    samples: List[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        locator.count()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1e6, matched
+
+
+def run(snapshot: str, iterations: int) -> List[Dict]:
+    html = (gc.DOM_SNAPSHOTS_DIR / f"{snapshot}.html").read_text(encoding="utf-8")
+    rows: List[Dict] = []
+    with sync_playwright() as pw:
+        browser = pw.chromium.launch(headless=True)
+        try:
+            page = browser.new_page()
+            page.set_content(html)
+            for spec in get_registry():
+                if not (spec.xpath and spec.css):
+                    continue
+                xpath_us, xpath_count = _time_count(page, spec.xpath, iterations)
+                css_us, css_count = _time_count(page, spec.css, iterations)
+                rows.append(
+                    {
+                        "names": spec.names,
+                        "xpath": spec.xpath,
+                        "css": spec.css,
+                        "xpath_median_us": round(xpath_us, 1),
+                        "css_median_us": round(css_us, 1),
+                        "speedup": round(xpath_us / css_us, 2) if css_us else None,
+                        "xpath_matches": xpath_count,
+                        "css_matches": css_count,
+                    }
+                )
+        finally:
+            browser.close()
+    return rows
+
+
+def _print_table(rows: List[Dict]) -> None:
+    print(f"{'locator':<48} {'xpath µs':>9} {'css µs':>9} {'speedup':>8} {'matches':>9}")
+    for row in sorted(rows, key=lambda r: r["speedup"] or 0, reverse=True):
+        matches = f"{row['xpath_matches']}/{row['css_matches']}"
+        flag = "" if row["xpath_matches"] == row["css_matches"] else "  MISMATCH"
+        print(
+            f"{row['names'][0]:<48} {row['xpath_median_us']:>9} {row['css_median_us']:>9} "
+            f"{row['speedup']:>8} {matches:>9}{flag}"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--snapshot", default="inventory", help="DOM snapshot name under resources/dom_snapshots")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--json", type=Path, help="Optional path to write raw results as JSON")
+    args = parser.parse_args(argv)
+
+    rows = run(args.snapshot, args.iterations)
+    _print_table(rows)
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps(rows, indent=2), encoding="utf-8")
+    mismatches = [row for row in rows if row["xpath_matches"] != row["css_matches"]]
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
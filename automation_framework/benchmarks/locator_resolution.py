@@ -0,0 +1,206 @@
+# python
+"""
+Time resolution of every locator constant against recorded DOM snapshots.
+
+Each snapshot under resources/dom_snapshots is loaded into a local page and every registered
+locator is counted `--iterations` times (raw form and, when different, its compiled CSS form).
+The report shows p50/p95 per locator and flags:
+  - over-match: more matches than declared in expected_matches.json (or more than one when
+    undeclared), i.e. selectors that would trip Playwright strict mode or pick the wrong node;
+  - missing: declared matches but nothing found;
+  - fragile: exact @class matches whose value carries leading/trailing whitespace.
+Runs are appended to reports/benchmarks/locator_resolution.jsonl with the git commit so the
+latest run is compared against the previous commit's numbers.
+
+Usage:
+    python -m automation_framework.benchmarks.locator_resolution [--iterations 100] [--snapshot cart ...]
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from playwright.sync_api import Page, sync_playwright
+
+from automation_framework.config import global_config as gc
+from automation_framework.pages.locators.registry import LocatorSpec, get_registry
+
+HISTORY_FILE = gc.BENCHMARKS_DIR / "locator_resolution.jsonl"
+EXPECTED_FILE = gc.DOM_SNAPSHOTS_DIR / "expected_matches.json"
+_FRAGILE_CLASS_RE = re.compile(r"""@class\s*=\s*(['"])(\s[^'"]*|[^'"]*\s)\1""")
+
+
+def _percentiles(samples: List[float]) -> tuple[float, float]:
+    ordered = sorted(samples)
+    p50 = statistics.median(ordered)
+    p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+    return p50 * 1e6, p95 * 1e6
+
+
+def _measure(page: Page, selector: str, iterations: int) -> Dict:
+    locator = page.locator(selector)
+    matches = locator.count()
+    samples: List[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        locator.count()
+        samples.append(time.perf_counter() - start)
+    p50, p95 = _percentiles(samples)
+    return {"p50_us": round(p50, 1), "p95_us": round(p95, 1), "matches": matches}
+
+
+def _expected_for(spec: LocatorSpec, expected: Dict[str, int]) -> Optional[int]:
+    for name in spec.names:
+        if name in expected:
+            return expected[name]
+    return None
+
+
+def _flags(spec: LocatorSpec, matches: int, expected: Optional[int]) -> List[str]:
+    flags: List[str] = []
+    if expected is not None:
+        if matches > expected:
+            flags.append(f"over-match({matches}>{expected})")
+        elif expected > 0 and matches == 0:
+            flags.append("missing")
+    elif matches > 1:
+        flags.append(f"over-match({matches}>1)")
+    if (matches or expected) and spec.xpath and _FRAGILE_CLASS_RE.search(spec.xpath):
+        flags.append("fragile-class-whitespace")
+    return flags
+
+
+def run(snapshots: List[str], iterations: int) -> Dict[str, Dict[str, Dict]]:
+    expected_all = json.loads(EXPECTED_FILE.read_text(encoding="utf-8")) if EXPECTED_FILE.exists() else {}
+    registry = get_registry()
+    results: Dict[str, Dict[str, Dict]] = {}
+    with sync_playwright() as pw:
+        browser = pw.chromium.launch(headless=True)
+        try:
+            page = browser.new_page()
+            for snapshot in snapshots:
+                page.set_content((gc.DOM_SNAPSHOTS_DIR / f"{snapshot}.html").read_text(encoding="utf-8"))
+                expected = expected_all.get(snapshot, {})
+                per_locator: Dict[str, Dict] = {}
+                for spec in registry:
+                    row = _measure(page, spec.raw, iterations)
+                    if spec.xpath and spec.css:
+                        compiled = _measure(page, spec.css, iterations)
+                        row["css_p50_us"] = compiled["p50_us"]
+                        row["css_p95_us"] = compiled["p95_us"]
+                    row["flags"] = _flags(spec, row["matches"], _expected_for(spec, expected))
+                    per_locator[spec.names[0]] = row
+                results[snapshot] = per_locator
+        finally:
+            browser.close()
+    return results
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=gc.REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except Exception:
+        return os.environ.get("GITHUB_SHA", "unknown")[:7]
+
+
+def _previous_run(history: Path, commit: str) -> Optional[Dict]:
+    if not history.exists():
+        return None
+    previous = None
+    with history.open(encoding="utf-8") as fh:
+        for line in fh:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if entry.get("commit") != commit:
+                previous = entry
+    return previous
+
+
+def _append_history(history: Path, entry: Dict) -> None:
+    history.parent.mkdir(parents=True, exist_ok=True)
+    with history.open("a", encoding="utf-8") as fh:
+        fh.write(json.dumps(entry, separators=(",", ":")) + "\n")
+
+
+def compare(current: Dict, previous: Dict, tolerance: float) -> List[str]:
+    """Return human-readable regressions (p95 slower than tolerance, or match count changes)."""
+    regressions: List[str] = []
+    for snapshot, rows in current["results"].items():
+        old_rows = previous["results"].get(snapshot, {})
+        for name, row in rows.items():
+            old = old_rows.get(name)
+            if not old:
+                continue
+            if old["matches"] != row["matches"]:
+                regressions.append(f"{snapshot}:{name} matches {old['matches']} -> {row['matches']}")
+            if old["p95_us"] and row["p95_us"] > old["p95_us"] * (1 + tolerance):
+                regressions.append(
+                    f"{snapshot}:{name} p95 {old['p95_us']}µs -> {row['p95_us']}µs"
+                )
+    return regressions
+
+
+def _print_report(results: Dict[str, Dict[str, Dict]]) -> None:
+    for snapshot, rows in results.items():
+        print(f"\n== {snapshot} ==")
+        print(f"{'locator':<52} {'p50 µs':>8} {'p95 µs':>8} {'css p50':>8} {'matches':>7}  flags")
+        for name, row in sorted(rows.items(), key=lambda item: item[1]["p95_us"], reverse=True):
+            if row["matches"] == 0 and not row["flags"]:
+                continue  # locator belongs to another page
+            print(
+                f"{name:<52} {row['p50_us']:>8} {row['p95_us']:>8} "
+                f"{row.get('css_p50_us', '-'):>8} {row['matches']:>7}  {', '.join(row['flags'])}"
+            )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Locator resolution benchmark over DOM snapshots")
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--snapshot", action="append", help="Snapshot name(s); default: all")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed p95 slowdown vs previous commit")
+    parser.add_argument("--history", type=Path, default=HISTORY_FILE, help="JSONL history file to compare/append")
+    parser.add_argument("--no-save", action="store_true", help="Do not append this run to the history file")
+    args = parser.parse_args(argv)
+
+    snapshots = args.snapshot or sorted(path.stem for path in Path(gc.DOM_SNAPSHOTS_DIR).glob("*.html"))
+    results = run(snapshots, args.iterations)
+    _print_report(results)
+
+    commit = _git_commit()
+    entry = {
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "iterations": args.iterations,
+        "results": results,
+    }
+    previous = _previous_run(args.history, commit)
+    regressions = compare(entry, previous, args.tolerance) if previous else []
+    if previous:
+        print(f"\nCompared with {previous['commit']} ({previous['timestamp']}): {len(regressions)} regression(s)")
+        for line in regressions:
+            print(f"  REGRESSION {line}")
+    if not args.no_save:
+        _append_history(args.history, entry)
+        print(f"Results appended to {args.history}")
+
+    flagged = sum(1 for rows in results.values() for row in rows.values() if row["flags"])
+    print(f"{flagged} flagged locator/snapshot pair(s)")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
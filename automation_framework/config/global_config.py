@@ -4,6 +4,16 @@ from pathlib import Path
 
 # --- Endpoints ---
 SAUCE_DEMO_URL = os.environ.get('SAUCE_DEMO_URL', 'https://www.saucedemo.com/')
+API_BASE_URL = os.environ.get('API_BASE_URL', SAUCE_DEMO_URL)
+
+# --- API client ---
+API_POOL_CONNECTIONS = os.environ.get('API_POOL_CONNECTIONS', '10')  # per-host connection pools kept alive
+API_POOL_MAXSIZE = os.environ.get('API_POOL_MAXSIZE', '20')  # keep-alive connections per host
+API_RETRIES = os.environ.get('API_RETRIES', '3')  # extra attempts for idempotent requests
+API_RETRY_BACKOFF = os.environ.get('API_RETRY_BACKOFF', '0.5')  # exponential backoff multiplier, seconds
+API_TIMEOUT = os.environ.get('API_TIMEOUT', '30')  # default per-request timeout, seconds
+API_ATTACH = os.environ.get('API_ATTACH', 'true')  # attach request/response previews to Allure
+API_BATCH_WORKERS = os.environ.get('API_BATCH_WORKERS', '8')  # threads per request_batch (capped at API_POOL_MAXSIZE)
 
 # --- Credentials ---
 STANDART_USERNAME = os.environ.get('STANDART_USERNAME', 'standard_user')
@@ -17,6 +27,47 @@ PASSWORD = os.environ.get('PASSWORD', 'secret_sauce')
 # --- UI / Browser ---
 HEADLESS = os.environ.get('HEADLESS', 'true')
 PW_TRACE = os.environ.get('PW_TRACE', 'on')  # on, off, always, on-failure
+# Comma-separated browser-server endpoints (ws://host:port/); empty launches a local browser
+PW_GRID_ENDPOINTS = os.environ.get('PW_GRID_ENDPOINTS', '')
+PW_GRID_HEALTH_INTERVAL = os.environ.get('PW_GRID_HEALTH_INTERVAL', '10')  # seconds
+PW_WARMUP = os.environ.get('PW_WARMUP', 'true')  # launch browser + login in background during collection
+LOCATOR_ENGINE = os.environ.get('LOCATOR_ENGINE', 'css')  # css: use compiled CSS forms of XPath locators; xpath: raw
+PW_STRICT_WAITS = os.environ.get('PW_STRICT_WAITS', 'false')  # explicit visibility checks before helper actions
+CHECKPOINT_TTL = os.environ.get('CHECKPOINT_TTL', '600')  # seconds a captured flow checkpoint stays reusable
+LOGIN_BATCH = os.environ.get('LOGIN_BATCH', 'false')  # run data-driven login cases concurrently in one browser
+LOGIN_BATCH_CONCURRENCY = os.environ.get('LOGIN_BATCH_CONCURRENCY', '')  # max open contexts; empty = CPU count
+
+# --- Failure captures (overridable per test with @pytest.mark.capture(...)) ---
+CAPTURE_MODE = os.environ.get('CAPTURE_MODE', 'viewport')  # viewport, full, element, off
+CAPTURE_FORMAT = os.environ.get('CAPTURE_FORMAT', 'jpeg')  # png, jpeg, webp (webp needs Pillow)
+CAPTURE_QUALITY = os.environ.get('CAPTURE_QUALITY', '80')  # jpeg/webp quality
+CAPTURE_SCALE = os.environ.get('CAPTURE_SCALE', '1.0')  # <1 downscales with Pillow
+CAPTURE_ELEMENT = os.environ.get('CAPTURE_ELEMENT', '')  # selector clipped in 'element' mode
+CAPTURE_DOM = os.environ.get('CAPTURE_DOM', 'html')  # html (shown inline by Allure), gzip (smaller, downloaded), off
+ARTIFACT_DEDUPE = os.environ.get('ARTIFACT_DEDUPE', 'true')  # collapse identical Allure attachments at session end
+ARTIFACT_RETENTION_DAYS = os.environ.get('ARTIFACT_RETENTION_DAYS', '7')  # artifact-store references kept this long
+ATTACH_PRETTY_MAX_KB = os.environ.get('ATTACH_PRETTY_MAX_KB', '256')  # larger JSON attachments stay compact
+ATTACH_FILE_MIN_KB = os.environ.get('ATTACH_FILE_MIN_KB', '64')  # larger attachments are streamed to a file
+ATTACH_GZIP_MIN_KB = os.environ.get('ATTACH_GZIP_MIN_KB', '1024')  # gzip streamed attachments above this; 0 = never
+ATTACH_MAX_KB = os.environ.get('ATTACH_MAX_KB', '10240')  # truncate text/JSON attachments above this; 0 = no limit
+
+# --- Visual comparisons ---
+VISUAL_UPDATE_BASELINES = os.environ.get('VISUAL_UPDATE_BASELINES', 'false')  # re-record instead of comparing
+VISUAL_REQUIRE_BASELINES = os.environ.get('VISUAL_REQUIRE_BASELINES', 'false')  # missing baseline fails instead of skipping (CI)
+VISUAL_THRESHOLD = os.environ.get('VISUAL_THRESHOLD', '0.1')  # per-pixel channel delta (0-1) counted as changed
+VISUAL_MAX_DIFF_RATIO = os.environ.get('VISUAL_MAX_DIFF_RATIO', '0.0001')  # share of changed pixels tolerated
+VISUAL_WORKERS = os.environ.get('VISUAL_WORKERS', '4')  # threads decoding/diffing screenshots
+
+# --- Synthetic data pools ---
+DATA_POOL_SIZE = os.environ.get('DATA_POOL_SIZE', '10000')  # identities generated per pool
+DATA_POOL_SEED = os.environ.get('DATA_POOL_SEED', '1337')
+DATA_POOL_FILE = os.environ.get('DATA_POOL_FILE', '')  # replay a saved pool instead of generating one
+
+# --- Logging ---
+LOG_CONSOLE_LEVEL = os.environ.get('LOG_CONSOLE_LEVEL', '')  # live console log level; empty keeps pytest.ini's log_cli_level
+LOG_FILE_LEVEL = os.environ.get('LOG_FILE_LEVEL', 'DEBUG')  # per-test files under reports/logs
+LOG_JSONL = os.environ.get('LOG_JSONL', 'true')  # structured JSONL records + offset index per worker
+LOG_JSONL_MAX_MB = os.environ.get('LOG_JSONL_MAX_MB', '64')  # roll the worker's JSONL file at this size
 
 # Database properties
 DB_HOST = os.environ.get('DB_HOST', '192.168.000.00')
@@ -24,15 +75,30 @@ DEV_NODE = os.environ.get('DEV_NODE', 'Test')
 DB_PORT = os.environ.get('DB_PORT', '3036')
 DB_USERNAME = os.environ.get('DB_USERNAME', 'admin')
 DB_PASSWORD = os.environ.get('DB_PASSWORD', 'root')
+DB_NAME = os.environ.get('DB_NAME', '')  # database used by the db_pool fixture
+DB_POOL = os.environ.get('DB_POOL', 'true')  # db_connection borrows from a per-process pool
+DB_POOL_MIN = os.environ.get('DB_POOL_MIN', '1')  # connections opened when a pool is created
+DB_POOL_MAX = os.environ.get('DB_POOL_MAX', '5')
+DB_POOL_IDLE_TIMEOUT = os.environ.get('DB_POOL_IDLE_TIMEOUT', '300')  # seconds before an idle connection is closed
+DB_POOL_CHECKOUT_TIMEOUT = os.environ.get('DB_POOL_CHECKOUT_TIMEOUT', '30')  # seconds to wait for a free connection
 
 # --- DATA ---
 BASE_DIR = Path(__file__).parent.parent  # automation_framework dir
 REPO_ROOT = BASE_DIR.parent
 DATA_DIR = BASE_DIR / "resources" / "test_data"
 RESOURCE_DIR = BASE_DIR / "resources"
+DOM_SNAPSHOTS_DIR = RESOURCE_DIR / "dom_snapshots"
 REPORTS_DIR = BASE_DIR / "reports"
 ALLURE_REPORT_DIR = REPORTS_DIR / "allure-report"
 ALLURE_RESULTS_DIR = REPORTS_DIR / "allure-results"
 PLAYWRIGHT_TRACES_DIR = REPORTS_DIR / "playwright-traces"
+BENCHMARKS_DIR = REPORTS_DIR / "benchmarks"
+CHECKPOINTS_DIR = REPORTS_DIR / "checkpoints"
+DATA_CACHE_DIR = REPORTS_DIR / "data-cache"  # parsed test-data files, keyed by source mtime/hash
+DATA_POOLS_DIR = REPORTS_DIR / "data-pools"
+VISUAL_BASELINES_DIR = RESOURCE_DIR / "visual_baselines"
+VISUAL_DIFFS_DIR = REPORTS_DIR / "visual-diffs"
+ARTIFACT_STORE_DIR = REPORTS_DIR / "artifact-store"  # content-addressed failure artifacts
+STRUCTURED_LOGS_DIR = REPORTS_DIR / "logs" / "structured"
 PYTEST_HTML_REPORT_FILE = REPORTS_DIR / "html-report" / "pytest-report.html"
 JUNIT_XML_REPORT_FILE = REPORTS_DIR / "junit" / "pytest-junit.xml"
@@ -6,18 +6,36 @@ import pathlib
 import re
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from urllib.parse import urljoin
 
 import allure
+import allure_commons
 import pytest
-import requests
 from allure_commons.types import AttachmentType
 from playwright.sync_api import sync_playwright
 from automation_framework.config import global_config as gc
+from automation_framework.helpers.api import HTTP_LOGGER, ApiClient, BrowserApi
+from automation_framework.helpers.fe.base_helper import log_timing_summary
 from automation_framework.pages import LoginPage
 from automation_framework.pages import BurgerMenuKeywords
+from automation_framework.pages.keywords.cart_and_checkout_keywords import seed_cart
 from automation_framework.pages.locators import burger_menu_locators as burger_locators
+from automation_framework.utils.browser import ui_context_options
+from automation_framework.utils.browser_grid import BrowserGrid, grid_enabled, parse_grid_endpoints
+from automation_framework.utils.allure_utils import attach_bytes, attach_file, attach_json, pop_attachment_bytes
+from automation_framework.utils.artifact_store import AllureBlobLinker, dedupe_allure_results, get_store
+from automation_framework.utils.capture import CapturePolicy, capture_failure, capture_stats
+from automation_framework.utils.checkpoints import CheckpointStore
+from automation_framework.utils.data import identity_pool as load_identity_pool
+from automation_framework.utils.dbutils import close_pools, get_pool
+from automation_framework.utils.flags import as_bool
+from automation_framework.utils.log_routing import StructuredLogSink, TestLogRouter
+from automation_framework.utils.data_providers import parametrize_from_marker
+from automation_framework.utils.visual import BaselineStore, VisualChecker
+from automation_framework.utils.warmup import BrowserWarmup
 
 # Ensure repo root is on PYTHONPATH when tests are run from inside automation_framework
 ROOT_DIR = pathlib.Path(__file__).resolve().parents[1]
@@ -25,20 +43,11 @@ if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
 
-HTTP_LOGGER = logging.getLogger("automation_framework.http")
-_SENSITIVE_HEADER_KEYS = {"authorization", "proxy-authorization"}
-_MAX_LOG_BODY_CHARS = int(os.getenv("HTTP_LOG_MAX_BODY", "2000"))
-
-
 def _ensure_dir(path: pathlib.Path) -> pathlib.Path:
     path.mkdir(parents=True, exist_ok=True)
     return path
 
 
-def _bool_str(value) -> bool:
-    return str(value).lower() in {"1", "true", "yes", "on"}
-
-
 def _resolve_report_path(
     config, attr_name: str, default_path: pathlib.Path
 ) -> pathlib.Path:
@@ -60,22 +69,11 @@ def _get_playwright_traces_dir(config) -> pathlib.Path:
     return _ensure_dir(traces_dir)
 
 
-def _scrub_headers(headers):
-    if not headers:
-        return {}
-    sanitized = {}
-    for key, value in headers.items():
-        if key.lower() in _SENSITIVE_HEADER_KEYS:
-            sanitized[key] = "***"
-        else:
-            sanitized[key] = value
-    return sanitized
-
-
-
-class LoggingSession(requests.Session):
-    def __init__(self):
-        super().__init__()
+@pytest.hookimpl(trylast=True)
+def pytest_generate_tests(metafunc):
+    # @pytest.mark.data_provider(...): rows are streamed from the cached data file at collection.
+    # trylast: ids follow browser_name, as with @pytest.mark.parametrize ("[chromium-standard]")
+    parametrize_from_marker(metafunc)
 
 
 @pytest.hookimpl(tryfirst=True)
@@ -87,6 +85,9 @@ def pytest_configure(config):
         config, "allure_report_dir", pathlib.Path(gc.ALLURE_RESULTS_DIR)
     )
     config._allure_results_dir = allure_results_dir
+    # Attachments taken from the artifact store are hard links to its blobs, not second copies
+    config._allure_blob_linker = AllureBlobLinker(allure_results_dir, get_store())
+    allure_commons.plugin_manager.register(config._allure_blob_linker)
 
     html_report_file = _resolve_report_path(
         config, "htmlpath", pathlib.Path(gc.PYTEST_HTML_REPORT_FILE)
@@ -105,19 +106,32 @@ def pytest_configure(config):
     config._playwright_traces_dir = _ensure_dir(pathlib.Path(gc.PLAYWRIGHT_TRACES_DIR))
     _ensure_dir(pathlib.Path(gc.ALLURE_REPORT_DIR))
 
-    if not HTTP_LOGGER.handlers:
-        handler = logging.StreamHandler()
-        handler.setFormatter(
-            logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    # Console (live log) level can differ from the per-test file level; --log-cli-level still wins
+    if gc.LOG_CONSOLE_LEVEL and config.getoption("log_cli_level", None) is None:
+        config.option.log_cli_level = gc.LOG_CONSOLE_LEVEL.upper()
+    structured = None
+    if as_bool(gc.LOG_JSONL):
+        # Controller picks the run id before workers spawn so every worker's records share it
+        run_id = os.environ.setdefault("PYTEST_RUN_ID", datetime.now().strftime("%Y%m%dT%H%M%S"))
+        structured = StructuredLogSink(
+            pathlib.Path(gc.STRUCTURED_LOGS_DIR),
+            worker=os.environ.get("PYTEST_XDIST_WORKER", "main"),
+            run_id=run_id,
+            max_bytes=int(float(gc.LOG_JSONL_MAX_MB) * 1024 * 1024),
         )
-        HTTP_LOGGER.addHandler(handler)
+    config._log_router = TestLogRouter(
+        file_level=logging.getLevelName(gc.LOG_FILE_LEVEL.upper()), structured=structured
+    ).start()
+
+    # HTTP records propagate to the root logger: console via pytest, per-test files and JSONL via the router
     HTTP_LOGGER.setLevel(logging.INFO)
-    HTTP_LOGGER.propagate = False
 
     # Write Allure environment.properties for better context in reports
     env_props = {
         "HAUD_BASE_URL": gc.SAUCE_DEMO_URL.rstrip("/"),
-        "HEADLESS": _bool_str(gc.HEADLESS),
+        "HEADLESS": as_bool(gc.HEADLESS),
+        "PW_STRICT_WAITS": as_bool(gc.PW_STRICT_WAITS),
+        "PW_GRID_ENDPOINTS": gc.PW_GRID_ENDPOINTS,
         "PYTEST_ADDOPTS": os.environ.get("PYTEST_ADDOPTS", ""),
     }
     lines = [f"{k}={v}" for k, v in env_props.items()]
@@ -125,6 +139,46 @@ def pytest_configure(config):
         "\n".join(lines), encoding="utf-8"
     )
 
+    config._browser_warmup = None
+    if _should_warm_up(config):
+        config._browser_warmup = BrowserWarmup(
+            gc.SAUCE_DEMO_URL,
+            gc.STANDART_USERNAME,
+            gc.PASSWORD,
+            headless=as_bool(gc.HEADLESS),
+        ).start()
+
+
+def pytest_collection_finish(session):
+    warmup = getattr(session.config, "_browser_warmup", None)
+    if warmup is not None:
+        # logged_in_page, checkpoint_fork, ... all reach the login through auth_storage_state
+        warmup.set_needed(any("auth_storage_state" in item.fixturenames for item in session.items))
+
+
+def pytest_unconfigure(config):
+    close_pools()
+    linker = getattr(config, "_allure_blob_linker", None)
+    if linker is not None:
+        allure_commons.plugin_manager.unregister(linker)
+    warmup = getattr(config, "_browser_warmup", None)
+    if warmup is not None:
+        warmup.cleanup()
+    router = getattr(config, "_log_router", None)
+    if router is not None:
+        router.stop()
+
+
+def _should_warm_up(config) -> bool:
+    if not as_bool(gc.PW_WARMUP) or grid_enabled():
+        return False
+    if config.getoption("collectonly", False) or config.getoption("help", False):
+        return False
+    # xdist controller only distributes tests; each worker warms up on its own
+    if getattr(config.option, "numprocesses", None) and not hasattr(config, "workerinput"):
+        return False
+    return True
+
 
 @pytest.fixture(scope="session")
 def creds():
@@ -141,6 +195,18 @@ def creds():
     return {"base_url": base_url, "username": username, "password": password}
 
 
+@pytest.fixture(scope="session")
+def identity_pool():
+    """Pre-generated checkout identities; each xdist worker draws from its own stride."""
+    return load_identity_pool()
+
+
+@pytest.fixture()
+def identity(identity_pool):
+    """A checkout identity no other test in the session (or worker) receives."""
+    return identity_pool.take()
+
+
 @pytest.fixture(scope="session")
 def pw():
     with sync_playwright() as p:
@@ -151,8 +217,17 @@ def pw():
 def browser(pw):
     # Default to headful; set HEADLESS=1 to run headless in CI.
     # headless = os.environ.get("HEADLESS", "").lower() in {"1", "true", "yes", "on"}
-    headless = _bool_str(gc.HEADLESS)
-    browser = pw.chromium.launch(headless=headless, args=["--start-maximized"])
+    headless = as_bool(gc.HEADLESS)
+    if grid_enabled():
+        # Grid mode: contexts are scheduled over remote browser servers (PW_GRID_ENDPOINTS)
+        browser = BrowserGrid(
+            pw,
+            parse_grid_endpoints(gc.PW_GRID_ENDPOINTS),
+            headless=headless,
+            health_interval=float(gc.PW_GRID_HEALTH_INTERVAL),
+        )
+    else:
+        browser = pw.chromium.launch(headless=headless, args=["--start-maximized"])
     yield browser
     browser.close()
 
@@ -160,7 +235,7 @@ def browser(pw):
 @pytest.fixture(scope="session")
 def ui_context(browser):
     # headless = os.environ.get("HEADLESS", "").lower() in {"1", "true", "yes", "on"}
-    headless = _bool_str(gc.HEADLESS)
+    headless = as_bool(gc.HEADLESS)
     if headless:
         context = browser.new_context(viewport={"width": 1920, "height": 1080})
     else:
@@ -234,9 +309,7 @@ def page(ui_context, request):
             else:
                 if trace_path and failed:
                     try:
-                        allure.attach.file(
-                            str(trace_path), name="playwright-trace", extension="zip"
-                        )
+                        attach_file(trace_path, name="playwright-trace", extension="zip")
                     except Exception:
                         pass
         else:
@@ -271,26 +344,29 @@ def per_test_file_logger(request):
     suite_dir = _ensure_dir(base_logs_dir / suite_name)
     log_file = suite_dir / f"{test_name}.log"
 
-    handler = logging.FileHandler(log_file, mode="w", encoding="utf-8")
-    handler.setFormatter(
-        logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
-    )
-
-    root_logger = logging.getLogger()
-    root_logger.addHandler(handler)
+    # Records are tagged with this file and written by the router's background thread
+    router = request.config._log_router
+    router.watch(request.module.__name__)
+    router.begin(log_file, request.node.nodeid)
 
     yield
 
-    root_logger.removeHandler(handler)
-    handler.close()
+    # Teardown of this autouse fixture runs after page/trace teardown, so the total is complete
+    attached = pop_attachment_bytes(request.node.nodeid)
+    if attached:
+        request.node.user_properties.append(("attachment_bytes", attached))
+        logging.getLogger(__name__).debug("Allure attachments: %d bytes", attached, extra={"attachment_bytes": attached})
 
+    records, overhead = router.end()
+    request.node.user_properties.append(("log_overhead_ms", round(overhead * 1000, 2)))
+    logging.getLogger(__name__).debug(
+        "Per-test logging overhead: %.2fms for %d record(s)", overhead * 1000, records
+    )
 
-def _attach_ui_artifacts_when_failed(item, report):
-    try:
-        page = item.funcargs.get("page")
-    except Exception:
-        page = None
 
+def _attach_ui_artifacts_when_failed(item, report):
+    funcargs = getattr(item, "funcargs", {}) or {}
+    page = funcargs.get("page") or funcargs.get("logged_in_page")
     if page is None:
         return
 
@@ -302,19 +378,19 @@ def _attach_ui_artifacts_when_failed(item, report):
     except Exception:
         pass
 
-    # Attach screenshot
-    try:
-        png = page.screenshot(full_page=True)
-        allure.attach(png, name="screenshot", attachment_type=AttachmentType.PNG)
-    except Exception:
-        pass
-
-    # Attach page content (can be large; keep as text)
+    # Screenshot extent/encoding and DOM form follow CAPTURE_* or the test's capture marker
     try:
-        html = page.content()
-        allure.attach(html, name="page_source", attachment_type=AttachmentType.HTML)
-    except Exception:
-        pass
+        policy = CapturePolicy.for_item(item)
+    except ValueError as exc:
+        logging.getLogger(__name__).warning("Invalid capture policy: %s", exc)
+        return
+    artifacts = capture_failure(page, policy)
+    for artifact in artifacts:
+        attach_bytes(artifact.body, artifact.name, artifact.mime, artifact.extension)
+    stats = capture_stats(artifacts)
+    if stats:
+        item.user_properties.append(("failure_capture", stats))
+        attach_json(stats, name="failure_capture_stats")
 
 
 @pytest.hookimpl(hookwrapper=True, tryfirst=True)
@@ -359,15 +435,33 @@ def pytest_runtest_makereport(item, call):
                 )
 
 
+def _compact_artifacts(results_dir: pathlib.Path) -> None:
+    logger = logging.getLogger(__name__)
+    try:
+        store = get_store()
+        if as_bool(gc.ARTIFACT_DEDUPE):
+            removed, saved = dedupe_allure_results(results_dir, store)
+            if removed:
+                print(f"Deduplicated {removed} Allure attachment(s), saved {saved / 1024:.0f} KiB")
+        store.prune(float(gc.ARTIFACT_RETENTION_DAYS))
+    except Exception:
+        logger.warning("Artifact compaction failed", exc_info=True)
+
+
 def pytest_sessionfinish(session, exitstatus):
     results_dir = pathlib.Path(gc.ALLURE_RESULTS_DIR).resolve()
     report_hint = f"Allure results saved to: {results_dir}\nGenerate report: allure serve {results_dir}"
     print(report_hint)
     try:
         logging.getLogger(__name__).info(report_hint)
+        log_timing_summary()
     except Exception:
         pass
 
+    # Workers share the results dir and the store; only the controller (or a plain run) compacts
+    if not hasattr(session.config, "workerinput"):
+        _compact_artifacts(getattr(session.config, "_allure_results_dir", results_dir))
+
     # Auto-generate Allure report
     import subprocess
     try:
@@ -384,10 +478,17 @@ def pytest_sessionfinish(session, exitstatus):
 
 
 @pytest.fixture(scope="session")
-def auth_storage_state(tmp_path_factory, browser, creds):
+def auth_storage_state(request, tmp_path_factory, creds):
     """Log in once and persist storage state for reuse in logged_in_page."""
+    warmup = getattr(request.config, "_browser_warmup", None)
+    if warmup is not None:
+        warmed_state = warmup.join(timeout=60)
+        if warmed_state:
+            return warmed_state
+
+    browser = request.getfixturevalue("browser")
     state_path = Path(tmp_path_factory.mktemp("auth")) / "state.json"
-    headless = _bool_str(gc.HEADLESS)
+    headless = as_bool(gc.HEADLESS)
     context = (
         browser.new_context(no_viewport=True)
         if not headless
@@ -405,27 +506,140 @@ def auth_storage_state(tmp_path_factory, browser, creds):
     return str(state_path)
 
 
+def _open_logged_in_page(browser, auth_storage_state):
+    context = browser.new_context(storage_state=auth_storage_state, **ui_context_options())
+    context.base_url = gc.SAUCE_DEMO_URL.rstrip("/")  # Add base_url attribute to context
+    page = context.new_page()
+    page.goto(urljoin(gc.SAUCE_DEMO_URL, "inventory.html"), wait_until="networkidle")
+    return page
+
+
 @pytest.fixture()
 def logged_in_page(browser, auth_storage_state):
     """Yields a page already authenticated via stored session state."""
-    headless = _bool_str(gc.HEADLESS)
-    context = (
-        browser.new_context(storage_state=auth_storage_state, no_viewport=True)
-        if not headless
-        else browser.new_context(
-            storage_state=auth_storage_state, viewport={"width": 1920, "height": 1080}
-        )
-    )
-    context.base_url = "https://www.saucedemo.com"  # Add base_url attribute to context
-    page = context.new_page()
-    page.goto("https://www.saucedemo.com/inventory.html", wait_until="networkidle")
+    page = _open_logged_in_page(browser, auth_storage_state)
     yield page
+    page.context.close()
+
+
+@pytest.fixture(scope="session")
+def checkpoints():
+    return CheckpointStore(gc.CHECKPOINTS_DIR, ttl=float(gc.CHECKPOINT_TTL))
+
+
+@pytest.fixture()
+def checkpoint_fork(browser, auth_storage_state, checkpoints):
+    """
+    fork(name, prefix, depends=()) -> (page, data).
+
+    The prefix runs once on a fresh logged-in page (per session, or reused from disk while its
+    fingerprint and TTL hold); each call returns a new context restored from its end state.
+    """
+    pages = []
+
+    def fork(name, prefix, depends=()):
+        checkpoint = checkpoints.ensure(
+            name, prefix, lambda: _open_logged_in_page(browser, auth_storage_state), depends
+        )
+        page = checkpoints.fork(browser, checkpoint, **ui_context_options())
+        page.context.base_url = gc.SAUCE_DEMO_URL.rstrip("/")
+        pages.append(page)
+        return page, checkpoint.data
+
+    yield fork
+    for page in pages:
+        page.context.close()
+
+
+@pytest.fixture(scope="session")
+def visual_executor():
+    """Threads that decode and diff screenshots while tests keep driving the browser."""
+    executor = ThreadPoolExecutor(max_workers=int(gc.VISUAL_WORKERS), thread_name_prefix="visual")
+    yield executor
+    executor.shutdown(wait=True)
+
+
+@pytest.fixture(scope="session")
+def api_client():
+    """Pooled keep-alive HTTP client with retries, timing and Allure request/response previews."""
+    client = ApiClient()
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def db_pool():
+    """
+    This worker's connection pool for DB_NAME: `with db_pool.connection() as conn: ...`.
+    Pools are closed at unconfigure, so helpers using db_connection() share the same one.
+    """
+    if not gc.DB_NAME:
+        pytest.skip("DB_NAME is not set")
+    return get_pool(database=gc.DB_NAME)
+
+
+@pytest.fixture()
+def browser_api(browser):
+    """
+    BrowserApi on a fresh context: log in, seed the cart or reset state over HTTP and cookies,
+    then `browser_api.open(path)` a page that sees that state.
+    """
+    context = browser.new_context(**ui_context_options())
+    context.base_url = gc.SAUCE_DEMO_URL.rstrip("/")
+    yield BrowserApi(context, base_url=gc.SAUCE_DEMO_URL)
     context.close()
 
 
+@pytest.fixture()
+def visual(visual_executor):
+    """Per-test visual checker; pending comparisons are verified and diffs attached at teardown."""
+    checker = VisualChecker(
+        BaselineStore(gc.VISUAL_BASELINES_DIR, update=as_bool(gc.VISUAL_UPDATE_BASELINES)),
+        visual_executor,
+        threshold=float(gc.VISUAL_THRESHOLD),
+        max_diff_ratio=float(gc.VISUAL_MAX_DIFF_RATIO),
+        require_baselines=as_bool(gc.VISUAL_REQUIRE_BASELINES),
+    )
+    yield checker
+    try:
+        if checker.pending:
+            checker.verify()
+    except pytest.skip.Exception as exc:
+        logging.getLogger(__name__).warning("Visual checks not verified by the test: %s", exc)
+    finally:
+        for result in checker.results:
+            if result.diff_path is not None:
+                kind = "candidate" if result.missing else "diff"
+                attach_file(result.diff_path, f"visual_{kind}_{result.name}", AttachmentType.PNG.mime_type, "png")
+
+
+@pytest.fixture()
+def seeded_cart(request, logged_in_page):
+    """
+    CartKeywords on a page whose cart was written straight to storage, opened at the requested step.
+    Parametrize indirectly: {"products": [4, 0], "step": "checkout-step-one"}; defaults to [4] on cart.
+    """
+    params = getattr(request, "param", None) or {}
+    return seed_cart(
+        logged_in_page,
+        params.get("products", [4]),
+        step=params.get("step", "cart"),
+    )
+
+
 @pytest.fixture(autouse=True)
-def reset_after_test(logged_in_page):
+def reset_after_test(request):
+    # Only tests that use logged_in_page (directly or via keyword fixtures) need a reset
+    if "logged_in_page" not in request.fixturenames:
+        yield
+        return
+    logged_in_page = request.getfixturevalue("logged_in_page")
     yield
+    # Skip when no keyword changed the cart during the test (see CartModel.touched)
+    cart_model = getattr(logged_in_page, "_cart_model", None)
+    if cart_model is None or not cart_model.touched:
+        logging.getLogger(__name__).debug("Cart untouched; skipping app state reset")
+        return
     # Reset app state after each test, only if on a page with burger menu
     menu = BurgerMenuKeywords(logged_in_page)
     if menu.page.locator(burger_locators.BURGER_MENU).is_visible():
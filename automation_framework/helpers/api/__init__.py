@@ -0,0 +1,22 @@
+from .api_client import (
+    HTTP_LOGGER,
+    ApiClient,
+    BatchResult,
+    LoggingSession,
+    assert_batch,
+    latency_summary,
+    scrub_headers,
+)
+from .browser_api import SESSION_COOKIE, BrowserApi
+
+__all__ = [
+    "ApiClient",
+    "BatchResult",
+    "BrowserApi",
+    "HTTP_LOGGER",
+    "LoggingSession",
+    "SESSION_COOKIE",
+    "assert_batch",
+    "latency_summary",
+    "scrub_headers",
+]
@@ -0,0 +1,322 @@
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Union
+from urllib.parse import urljoin
+
+import requests
+from requests.adapters import HTTPAdapter
+from tenacity import (
+    RetryError,
+    Retrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+)
+
+from automation_framework.config import global_config as gc
+from automation_framework.utils.allure_utils import attach_json, attach_request, attach_response
+from automation_framework.utils.flags import as_bool
+
+HTTP_LOGGER = logging.getLogger("automation_framework.http")
+_SENSITIVE_HEADER_KEYS = {"authorization", "proxy-authorization", "cookie", "set-cookie", "x-api-key"}
+_MAX_LOG_BODY_CHARS = int(os.getenv("HTTP_LOG_MAX_BODY", "2000"))
+_RETRY_STATUSES = {429, 502, 503, 504}
+_IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+_CHUNK = 64 * 1024
+# Allure attaches to the test running on the calling thread; batch workers skip per-request attachments
+_BATCH = threading.local()
+
+
+def scrub_headers(headers):
+    """Copy of `headers` with credentials and cookies masked, safe to log or attach."""
+    if not headers:
+        return {}
+    sanitized = {}
+    for key, value in headers.items():
+        if key.lower() in _SENSITIVE_HEADER_KEYS:
+            sanitized[key] = "***"
+        else:
+            sanitized[key] = value
+    return sanitized
+
+
+def _preview(body: Any, limit: int = _MAX_LOG_BODY_CHARS) -> str:
+    """First `limit` characters of a request/response body, without copying the rest."""
+    if body is None:
+        return ""
+    if isinstance(body, (bytes, bytearray, memoryview)):
+        head = bytes(memoryview(body)[:limit]).decode("utf-8", errors="replace")
+        total = len(body)
+    elif isinstance(body, str):
+        head, total = body[:limit], len(body)
+    else:  # file-like or generator bodies are streamed by requests; never read them here
+        return f"<{type(body).__name__} body>"
+    return head if total <= limit else f"{head}... [truncated {total - limit} of {total}]"
+
+
+class _RetryableStatus(Exception):
+    def __init__(self, response: requests.Response):
+        super().__init__(f"HTTP {response.status_code}")
+        self.response = response
+
+
+def _should_retry(exc: BaseException) -> bool:
+    return isinstance(exc, (requests.ConnectionError, requests.Timeout, _RetryableStatus))
+
+
+class BatchResult(NamedTuple):
+    index: int
+    method: str
+    url: str
+    response: Optional[requests.Response]
+    error: Optional[BaseException]
+    latency_ms: float
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.response is not None and self.response.ok
+
+
+BatchRequest = Union[Sequence, Dict[str, Any]]
+
+
+def _unpack(spec: BatchRequest):
+    if isinstance(spec, dict):
+        spec = dict(spec)
+        return spec.pop("method", "GET"), spec.pop("url"), spec
+    method, url, *rest = spec
+    return method, url, dict(rest[0]) if rest else {}
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def latency_summary(results: Sequence[BatchResult]) -> Dict[str, Any]:
+    latencies = sorted(result.latency_ms for result in results)
+    if not latencies:
+        return {"requests": 0}
+    return {
+        "requests": len(latencies),
+        "failed": sum(1 for result in results if not result.ok),
+        "p50_ms": round(_percentile(latencies, 0.50), 2),
+        "p95_ms": round(_percentile(latencies, 0.95), 2),
+        "max_ms": round(latencies[-1], 2),
+    }
+
+
+def assert_batch(
+    results: Sequence[BatchResult],
+    *,
+    expect_ok: bool = True,
+    p95_ms: Optional[float] = None,
+    max_ms: Optional[float] = None,
+    name: str = "api_batch",
+) -> Dict[str, Any]:
+    """
+    Attach the batch's p50/p95/max latency (and every failed request) to Allure, then assert
+    all requests succeeded and the latency budgets hold. Returns the summary.
+    """
+    summary = latency_summary(results)
+    failures = [
+        {
+            "index": result.index,
+            "method": result.method,
+            "url": result.url,
+            "status": getattr(result.response, "status_code", None),
+            "error": repr(result.error) if result.error else None,
+            "latency_ms": result.latency_ms,
+        }
+        for result in results
+        if not result.ok
+    ]
+    attach_json(dict(summary, failures=failures), name=f"{name}_latency")
+    HTTP_LOGGER.info("Batch of %d requests: %s", len(results), summary, extra={"batch": summary})
+
+    problems = []
+    if expect_ok and failures:
+        problems.append(f"{len(failures)} of {len(results)} requests failed: {failures[:5]}")
+    if p95_ms is not None and summary.get("p95_ms", 0) > p95_ms:
+        problems.append(f"p95 {summary['p95_ms']}ms exceeds {p95_ms}ms")
+    if max_ms is not None and summary.get("max_ms", 0) > max_ms:
+        problems.append(f"max {summary['max_ms']}ms exceeds {max_ms}ms")
+    if problems:
+        raise AssertionError(f"{name}: " + "; ".join(problems))
+    return summary
+
+
+class LoggingSession(requests.Session):
+    """
+    requests.Session with tuned connection pooling, tenacity retries, per-request timing and
+    scrubbed, size-capped logging.
+
+    Idempotent requests are retried on connection errors, timeouts and 429/502/503/504 with
+    exponential backoff. Every response gets `duration_ms` (all attempts) and `attempts`.
+    Logged bodies are capped previews, attachments follow the ATTACH_* size limits, and
+    `stream=True` responses are left unread.
+    """
+
+    def __init__(
+        self,
+        *,
+        pool_connections: int = int(gc.API_POOL_CONNECTIONS),
+        pool_maxsize: int = int(gc.API_POOL_MAXSIZE),
+        retries: int = int(gc.API_RETRIES),
+        backoff: float = float(gc.API_RETRY_BACKOFF),
+        timeout: float = float(gc.API_TIMEOUT),
+        attach: bool = as_bool(gc.API_ATTACH),
+    ):
+        super().__init__()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=0)
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+        self.headers["Connection"] = "keep-alive"
+        self.pool_maxsize = pool_maxsize
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.attach = attach
+
+    def _send_once(self, method: str, url: str, retry_status: bool, *args, **kwargs) -> requests.Response:
+        response = super().request(method, url, *args, **kwargs)
+        if retry_status and response.status_code in _RETRY_STATUSES:
+            if kwargs.get("stream"):
+                response.close()  # unread body: release the pooled connection before backing off
+            raise _RetryableStatus(response)
+        return response
+
+    def request(self, method, url, *args, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        method = method.upper()
+        idempotent = method in _IDEMPOTENT_METHODS
+        retrying = Retrying(
+            stop=stop_after_attempt(self.retries + 1 if idempotent else 1),
+            wait=wait_exponential(multiplier=self.backoff, max=10),
+            retry=retry_if_exception(_should_retry),
+            reraise=False,
+        )
+        started = time.perf_counter()
+        attempts = 0
+        try:
+            for attempt in retrying:
+                with attempt:
+                    attempts = attempt.retry_state.attempt_number
+                    response = self._send_once(method, url, idempotent, *args, **kwargs)
+        except RetryError as exc:
+            last = exc.last_attempt.exception()
+            if isinstance(last, _RetryableStatus):
+                response = last.response  # out of retries: hand back the last error response
+            else:
+                self._log_failure(method, url, attempts, started, last)
+                raise last from None
+        except requests.RequestException as exc:
+            self._log_failure(method, url, attempts, started, exc)
+            raise
+        response.duration_ms = round((time.perf_counter() - started) * 1000, 2)
+        response.attempts = attempts
+        self._log(response, kwargs)
+        return response
+
+    def _log_failure(self, method: str, url: str, attempts: int, started: float, exc: BaseException) -> None:
+        HTTP_LOGGER.error(
+            "%s %s failed after %d attempt(s): %s",
+            method,
+            url,
+            attempts,
+            exc,
+            extra={"method": method, "url": url, "attempts": attempts,
+                   "duration_ms": round((time.perf_counter() - started) * 1000, 2)},
+        )
+
+    def _log(self, response: requests.Response, kwargs: Dict[str, Any]) -> None:
+        request = response.request
+        streamed = kwargs.get("stream", False)
+        body_preview = "<streamed>" if streamed else _preview(response.content)
+        HTTP_LOGGER.info(
+            "%s %s -> %s in %.0fms",
+            request.method,
+            request.url,
+            response.status_code,
+            response.duration_ms,
+            extra={
+                "method": request.method,
+                "url": request.url,
+                "status": response.status_code,
+                "duration_ms": response.duration_ms,
+                "attempts": response.attempts,
+                "request_headers": scrub_headers(request.headers),
+                "request_body": _preview(request.body),
+                "response_body": body_preview,
+            },
+        )
+        if self.attach and not getattr(_BATCH, "active", False):
+            try:
+                attach_request(request.method, request.url, scrub_headers(request.headers), _preview(request.body))
+                attach_response(response)
+            except Exception:
+                HTTP_LOGGER.debug("Allure attachment skipped", exc_info=True)
+
+    def request_batch(self, requests_: Iterable[BatchRequest], max_workers: Optional[int] = None) -> List[BatchResult]:
+        """
+        Send independent requests concurrently on a bounded thread pool sharing this session's
+        connection pool. Each item is `(method, url[, kwargs])` or a dict with `method`, `url`
+        and request kwargs. Results come back in input order; a request that raised is returned
+        with its `error` instead of aborting the batch.
+        """
+        specs = [_unpack(spec) for spec in requests_]
+        if not specs:
+            return []
+        # More threads than pooled connections would only queue on the pool
+        workers = min(len(specs), max_workers or int(gc.API_BATCH_WORKERS), self.pool_maxsize)
+
+        def send(index: int) -> BatchResult:
+            method, url, kwargs = specs[index]
+            _BATCH.active = True
+            started = time.perf_counter()
+            try:
+                response, error = self.request(method, url, **kwargs), None
+            except Exception as exc:  # one bad item (invalid kwargs, bad URL) must not abort the batch
+                response, error = None, exc
+            finally:
+                _BATCH.active = False
+            latency = getattr(response, "duration_ms", None) or round((time.perf_counter() - started) * 1000, 2)
+            return BatchResult(index, method.upper(), url, response, error, latency)
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="api-batch") as pool:
+            return list(pool.map(send, range(len(specs))))
+
+    def download(self, url: str, destination, **kwargs) -> requests.Response:
+        """Stream a (possibly huge) body to `destination` in chunks instead of into memory."""
+        response = self.request("GET", url, stream=True, **kwargs)
+        with response, open(destination, "wb") as handle:
+            for chunk in response.iter_content(chunk_size=_CHUNK):
+                handle.write(chunk)
+        return response
+
+
+class ApiClient(LoggingSession):
+    """LoggingSession bound to a base URL; relative paths are joined onto it."""
+
+    def __init__(self, base_url: str = gc.API_BASE_URL, **session_kwargs):
+        super().__init__(**session_kwargs)
+        self.base_url = base_url if base_url.endswith("/") else f"{base_url}/"
+
+    def url(self, path: str) -> str:
+        return urljoin(self.base_url, path.lstrip("/")) if not path.startswith(("http://", "https://")) else path
+
+    def request(self, method, url, *args, **kwargs):
+        return super().request(method, self.url(url), *args, **kwargs)
+
+
+__all__ = [
+    "ApiClient",
+    "BatchResult",
+    "HTTP_LOGGER",
+    "LoggingSession",
+    "assert_batch",
+    "latency_summary",
+    "scrub_headers",
+]
@@ -0,0 +1,126 @@
+import itertools
+import json
+import time
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import urljoin, urlsplit
+
+from playwright.sync_api import APIResponse, BrowserContext, Page
+
+from automation_framework.config import global_config as gc
+from automation_framework.pages.keywords.base_keywords import CART_STORAGE_KEY, SESSION_COOKIE
+
+from .api_client import HTTP_LOGGER, scrub_headers
+
+# Runs before the app's scripts on every document of the app's origin, but writes the cart only
+# while its sequence number is newer than the last one applied, so later add/remove clicks in the
+# UI are not overwritten and an older seed never replaces a newer one.
+_SEED_STORAGE_JS = """
+(([origin, storageKey, value, seq]) => {
+  try {
+    if (window.location.origin !== origin) return;
+    if (Number(window.localStorage.getItem('__api_seed') || 0) >= seq) return;
+    if (value === null) window.localStorage.removeItem(storageKey);
+    else window.localStorage.setItem(storageKey, value);
+    window.localStorage.setItem('__api_seed', String(seq));
+  } catch (e) {}
+})(%s)
+"""
+
+
+class BrowserApi:
+    """
+    HTTP access through the test's browser context (`context.request`).
+
+    Requests share the context's cookie jar in both directions: cookies set here (e.g. the
+    login session) are sent by the UI, and cookies the app sets are sent with these requests.
+    Setup steps (login, cart seeding, state reset) and backend checks therefore run without
+    loading pages, while staying visible to the UI once a page is opened.
+    """
+
+    def __init__(self, context: BrowserContext, base_url: str = gc.SAUCE_DEMO_URL):
+        self.context = context
+        self.base_url = base_url if base_url.endswith("/") else f"{base_url}/"
+        self.request = context.request
+        self._seed_seq = itertools.count(1)
+
+    def url(self, path: str) -> str:
+        return path if path.startswith(("http://", "https://")) else urljoin(self.base_url, path.lstrip("/"))
+
+    def fetch(self, path: str, method: str = "GET", **kwargs) -> APIResponse:
+        """`context.request.fetch` against the base URL, timed and logged on the HTTP logger."""
+        url = self.url(path)
+        kwargs.setdefault("timeout", float(gc.API_TIMEOUT) * 1000)
+        started = time.perf_counter()
+        response = self.request.fetch(url, method=method, **kwargs)
+        duration_ms = round((time.perf_counter() - started) * 1000, 2)
+        HTTP_LOGGER.info(
+            "%s %s -> %s in %.0fms (browser context)",
+            method,
+            url,
+            response.status,
+            duration_ms,
+            extra={
+                "method": method,
+                "url": url,
+                "status": response.status,
+                "duration_ms": duration_ms,
+                "request_headers": scrub_headers(kwargs.get("headers")),
+            },
+        )
+        return response
+
+    def get(self, path: str, **kwargs) -> APIResponse:
+        return self.fetch(path, "GET", **kwargs)
+
+    def post(self, path: str, **kwargs) -> APIResponse:
+        return self.fetch(path, "POST", **kwargs)
+
+    def expect_status(self, path: str, status: int = 200, method: str = "GET", **kwargs) -> APIResponse:
+        response = self.fetch(path, method, **kwargs)
+        if response.status != status:
+            raise AssertionError(f"{method} {self.url(path)} returned {response.status}, expected {status}")
+        return response
+
+    def login(self, username: str = gc.STANDART_USERNAME) -> None:
+        """Authenticate the context by setting the app's session cookie; no login page is loaded."""
+        self.context.add_cookies([{"name": SESSION_COOKIE, "value": username, "url": self.base_url}])
+        HTTP_LOGGER.info("Session cookie set for %s", username, extra={"username": username})
+
+    def session_user(self) -> Optional[str]:
+        for cookie in self.context.cookies(self.base_url):
+            if cookie["name"] == SESSION_COOKIE:
+                return cookie["value"]
+        return None
+
+    def seed_cart(self, product_ids: Iterable[int]) -> List[int]:
+        """
+        Put `product_ids` in the app's cart storage for the next document this context loads.
+        Open a page (see `open`) afterwards; the cart model picks the ids up from storage.
+        """
+        ids = [int(product_id) for product_id in product_ids]
+        self._seed_storage(json.dumps(ids))
+        HTTP_LOGGER.info("Cart seeded via init script", extra={"product_ids": ids})
+        return ids
+
+    def reset(self) -> None:
+        """Log out and empty the cart without loading a page."""
+        self.context.clear_cookies()
+        self._seed_storage(None)
+
+    def _seed_storage(self, value: Optional[str]) -> None:
+        parts = urlsplit(self.base_url)
+        args: List[Any] = [f"{parts.scheme}://{parts.netloc}", CART_STORAGE_KEY, value, next(self._seed_seq)]
+        self.context.add_init_script(_SEED_STORAGE_JS % json.dumps(args))
+
+    def open(self, path: str = "inventory.html", wait_until: str = "domcontentloaded") -> Page:
+        """New page in this context opened directly at `path`."""
+        page = self.context.new_page()
+        page.goto(self.url(path), wait_until=wait_until)
+        return page
+
+    def state(self) -> Dict[str, Any]:
+        """Cookies and origins as Playwright would persist them (for assertions or reuse)."""
+        return self.context.storage_state()
+
+
+__all__ = ["BrowserApi", "SESSION_COOKIE"]
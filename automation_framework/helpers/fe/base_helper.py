@@ -1,5 +1,14 @@
 import logging
-from playwright.sync_api import Page, expect
+import statistics
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple, Union
+
+from playwright.sync_api import Locator, Page, expect
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from automation_framework.config import global_config as gc
+from automation_framework.utils.flags import as_bool
 
 logger = logging.getLogger(__name__)
 
@@ -7,21 +16,190 @@ logger = logging.getLogger(__name__)
 DEFAULT_TIMEOUT = 10000
 SHORT_WAIT = 500
 
+# (mode, action) -> durations in seconds; used for the fast vs strict A/B summary
+ACTION_TIMINGS: Dict[Tuple[str, str], List[float]] = defaultdict(list)
+
+# Resolves every field in the page and returns false (keep polling) until all are present and
+# editable; then sets values through the native setter so React's value tracker sees the change,
+# dispatches input/change, and reports per-field problems instead of failing on the first one.
+_FILL_FORM_JS = """
+(fields) => {
+  const resolve = (selector) => {
+    if (selector.startsWith('xpath=')) selector = selector.slice(6);
+    if (selector.startsWith('/') || selector.startsWith('(')) {
+      return document.evaluate(selector, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    return document.querySelector(selector);
+  };
+  const elements = [];
+  for (const field of fields) {
+    let el;
+    try { el = resolve(field.selector); } catch (e) { return {errors: {[field.key]: 'invalid selector: ' + e.message}}; }
+    if (!el || !el.isConnected || el.disabled || el.readOnly || !el.getClientRects().length) return false;
+    elements.push(el);
+  }
+  const errors = {};
+  fields.forEach((field, idx) => {
+    const el = elements[idx];
+    const proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+    const setter = Object.getOwnPropertyDescriptor(proto, 'value').set;
+    el.focus();
+    setter.call(el, field.value);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    if (el.value !== field.value) errors[field.key] = 'value not applied (got ' + JSON.stringify(el.value) + ')';
+  });
+  if (elements.length) elements[elements.length - 1].blur();
+  return {errors};
+}
+"""
+
+_FORM_STATUS_JS = """
+(fields) => fields.map((field) => {
+  let selector = field.selector;
+  if (selector.startsWith('xpath=')) selector = selector.slice(6);
+  let el;
+  try {
+    el = (selector.startsWith('/') || selector.startsWith('('))
+      ? document.evaluate(selector, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+      : document.querySelector(selector);
+  } catch (e) { return 'invalid selector'; }
+  if (!el) return 'not found';
+  if (el.disabled) return 'disabled';
+  if (el.readOnly) return 'read-only';
+  if (!el.getClientRects().length) return 'not visible';
+  return '';
+})
+"""
+
+
+def _strict_default() -> bool:
+    return as_bool(gc.PW_STRICT_WAITS)
+
+
+def timing_summary() -> Dict[str, Dict[str, float]]:
+    """Aggregate recorded helper action timings per `<mode>.<action>`."""
+    summary: Dict[str, Dict[str, float]] = {}
+    for (mode, action), samples in sorted(ACTION_TIMINGS.items()):
+        if not samples:
+            continue
+        summary[f"{mode}.{action}"] = {
+            "count": len(samples),
+            "mean_ms": round(statistics.fmean(samples) * 1000, 2),
+            "p50_ms": round(statistics.median(samples) * 1000, 2),
+            "max_ms": round(max(samples) * 1000, 2),
+        }
+    return summary
+
+
+def log_timing_summary() -> None:
+    for key, stats in timing_summary().items():
+        logger.info(
+            "BaseHelper timing | %s | n=%s mean=%.2fms p50=%.2fms max=%.2fms",
+            key,
+            stats["count"],
+            stats["mean_ms"],
+            stats["p50_ms"],
+            stats["max_ms"],
+            extra={"helper_timing": key, **stats},
+        )
+
+# Returns false (keep polling) until at least `minRows` containers exist, then one row per
+# container with each field's trimmed innerText (or attribute). XPath fields are evaluated
+# relative to the container.
+_READ_ROWS_JS = """
+([container, fields, minRows]) => {
+  const isXPath = (s) => s.startsWith('/') || s.startsWith('(');
+  const strip = (s) => s.startsWith('xpath=') ? s.slice(6) : s;
+  const findAll = (root, selector) => {
+    selector = strip(selector);
+    if (!isXPath(selector)) return Array.from(root.querySelectorAll(selector));
+    if (root !== document && selector.startsWith('/')) selector = '.' + selector;
+    const result = document.evaluate(selector, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    return Array.from({length: result.snapshotLength}, (_, i) => result.snapshotItem(i));
+  };
+  const roots = container ? findAll(document, container) : [document];
+  if (roots.length < minRows) return false;
+  return roots.map((root) => {
+    const row = {};
+    for (const [key, [selector, attr]] of Object.entries(fields)) {
+      const el = findAll(root, selector)[0];
+      row[key] = !el ? null : attr ? el.getAttribute(attr) : el.innerText.trim();
+    }
+    return row;
+  });
+}
+"""
+
+# Clicks every element in `els` (or only `indices`), optionally the first `within` match inside
+# each, in one pass. Elements are captured up front, so index shifting from removals does not
+# matter; anything detached by an earlier click is reported as skipped.
+_CLICK_ALL_JS = """
+(els, [indices, within]) => {
+  const pick = (root) => {
+    if (!within) return root;
+    let selector = within.startsWith('xpath=') ? within.slice(6) : within;
+    if (selector.startsWith('/') || selector.startsWith('(')) {
+      if (selector.startsWith('/')) selector = '.' + selector;
+      return document.evaluate(selector, root, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    return root.querySelector(selector);
+  };
+  const targets = (indices === null ? els : indices.map((i) => els[i])).map((el) => el && pick(el));
+  let clicked = 0;
+  const skipped = [];
+  targets.forEach((el, n) => {
+    if (el && el.isConnected) { el.click(); clicked += 1; } else { skipped.push(indices === null ? n : indices[n]); }
+  });
+  return {clicked, skipped};
+}
+"""
+
 
 class BaseHelper:
     """
         Lightweight helper wrapper for common frontend interactions.
         Keeps routine waits and interactions centralized so keyword classes can compose them.
+
+        Default (fast) mode relies on Playwright's actionability auto-waits and issues a single
+        call per interaction. strict=True (or PW_STRICT_WAITS=true) restores the explicit
+        visibility assertion before each action and the separate clear before fill.
     """
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, strict: Optional[bool] = None):
+        # Imported here: the pages package imports keyword classes built on this helper
+        from automation_framework.pages.locators.registry import get_registry
+
         self.page = page
+        self.locators = get_registry()
+        self.strict = _strict_default() if strict is None else strict
+
+    @property
+    def mode(self) -> str:
+        return "strict" if self.strict else "fast"
+
+    def locator(self, selector: str) -> Locator:
+        """Cached page-level Locator; registered XPath constants resolve via their CSS form."""
+        return self.locators.locator(self.page, selector)
+
+    def _record(self, action: str, started: float) -> float:
+        elapsed = time.perf_counter() - started
+        ACTION_TIMINGS[(self.mode, action)].append(elapsed)
+        return elapsed * 1000
 
     def click(self, selector: str, timeout: int = DEFAULT_TIMEOUT) -> None:
         logger.info(f"Clicking selector: {selector}", extra={"selector": selector, "timeout": timeout})
-        locator = self.page.locator(selector).first
-        expect(locator).to_be_visible(timeout=timeout)
-        locator.click()
-        logger.info(f"Clicked selector: {selector}", extra={"selector": selector})
+        started = time.perf_counter()
+        locator = self.locator(selector).first
+        if self.strict:
+            expect(locator).to_be_visible(timeout=timeout)
+            locator.click()
+        else:
+            locator.click(timeout=timeout)
+        duration_ms = self._record("click", started)
+        logger.info(
+            f"Clicked selector: {selector}",
+            extra={"selector": selector, "mode": self.mode, "duration_ms": round(duration_ms, 2)},
+        )
 
     def input_text(
         self,
@@ -36,26 +214,161 @@ class BaseHelper:
             f"Inputting text into {selector} | preview={preview or '(empty)'}",
             extra={"selector": selector, "clear": clear, "timeout": timeout, "value_preview": preview},
         )
-        locator = self.page.locator(selector).first
-        expect(locator).to_be_visible(timeout=timeout)
-        if clear:
-            try:
-                locator.fill("")
-            except Exception:
-                logger.debug("Clear failed; continuing fill", exc_info=True)
-        locator.fill(value or "")
+        started = time.perf_counter()
+        locator = self.locator(selector).first
+        if self.strict:
+            expect(locator).to_be_visible(timeout=timeout)
+            if clear:
+                try:
+                    locator.fill("")
+                except Exception:
+                    logger.debug("Clear failed; continuing fill", exc_info=True)
+            locator.fill(value or "")
+        else:
+            # fill() already replaces the current value, so no separate clear round-trip
+            locator.fill(value or "", timeout=timeout)
+        duration_ms = self._record("input_text", started)
         logger.info(
             f"Input completed for {selector} | preview={preview or '(empty)'}",
-            extra={"selector": selector, "value_preview": preview},
+            extra={
+                "selector": selector,
+                "value_preview": preview,
+                "mode": self.mode,
+                "duration_ms": round(duration_ms, 2),
+            },
+        )
+
+    def fill_form(self, fields: Dict[str, str], timeout: int = DEFAULT_TIMEOUT) -> None:
+        """
+        Fill several inputs in one in-page call. `fields` maps selector -> value.
+
+        All fields are waited for together (present, visible, editable), filled in mapping order
+        with input/change events, and any field that could not be filled is reported in a single
+        AssertionError. Strict mode keeps the per-field `input_text` path.
+        """
+        if self.strict:
+            for selector, value in fields.items():
+                self.input_text(selector, value, timeout=timeout)
+            return
+
+        payload = []
+        for selector, value in fields.items():
+            spec = self.locators.spec(selector)
+            payload.append({
+                "key": spec.names[0] if spec else selector,
+                "selector": self.locators.compile(selector),
+                "value": value or "",
+            })
+        logger.info(
+            f"Filling form | fields={[field['key'] for field in payload]}",
+            extra={"fields": [field["key"] for field in payload], "timeout": timeout},
+        )
+        started = time.perf_counter()
+        try:
+            handle = self.page.wait_for_function(_FILL_FORM_JS, arg=payload, timeout=timeout)
+        except PlaywrightTimeoutError:
+            statuses = self.page.evaluate(_FORM_STATUS_JS, payload)
+            problems = {
+                field["key"]: status or "not ready"
+                for field, status in zip(payload, statuses)
+                if status
+            } or {field["key"]: "not ready" for field in payload}
+            raise AssertionError(f"fill_form timed out after {timeout}ms: {problems}") from None
+        result = handle.json_value()
+        errors = (result or {}).get("errors") or {}
+        duration_ms = self._record("fill_form", started)
+        if errors:
+            logger.error(f"Form fill failed | {errors}", extra={"field_errors": errors})
+            raise AssertionError(f"Could not fill form field(s): {errors}")
+        logger.info(
+            f"Form filled | {len(payload)} field(s)",
+            extra={"fields": len(payload), "mode": self.mode, "duration_ms": round(duration_ms, 2)},
+        )
+
+    def click_all(
+        self,
+        selector: str,
+        indices: Optional[List[int]] = None,
+        *,
+        within: Optional[str] = None,
+    ) -> int:
+        """
+        Click all matches of `selector` (or those at `indices`) in a single in-page script.
+        With `within`, clicks the first match of that selector inside each element instead.
+        Raises AssertionError if any target was missing or detached; returns the click count.
+        """
+        logger.info(
+            f"Bulk clicking {selector}",
+            extra={"selector": selector, "indices": indices, "within": within},
+        )
+        started = time.perf_counter()
+        result = self.locator(selector).evaluate_all(
+            _CLICK_ALL_JS, [indices, self.locators.compile(within) if within else None]
+        )
+        duration_ms = self._record("click_all", started)
+        if result["skipped"]:
+            raise AssertionError(f"Bulk click on {selector} could not click index(es) {result['skipped']}")
+        logger.info(
+            f"Bulk clicked {result['clicked']} element(s) for {selector}",
+            extra={"selector": selector, "clicked": result["clicked"], "duration_ms": round(duration_ms, 2)},
+        )
+        return result["clicked"]
+
+    def read_rows(
+        self,
+        fields: Dict[str, Union[str, Tuple[str, str]]],
+        container: Optional[str] = None,
+        *,
+        min_rows: int = 1,
+        timeout: int = DEFAULT_TIMEOUT,
+    ) -> List[Dict[str, Optional[str]]]:
+        """
+        Read several fields from every `container` match (or the whole page) in one call.
+
+        `fields` maps key -> selector, or key -> (selector, attribute) to read an attribute
+        instead of text. Waits until at least `min_rows` containers exist; missing fields are None.
+        """
+        spec = {
+            key: [self.locators.compile(value), None] if isinstance(value, str)
+            else [self.locators.compile(value[0]), value[1]]
+            for key, value in fields.items()
+        }
+        compiled_container = self.locators.compile(container) if container else None
+        started = time.perf_counter()
+        try:
+            handle = self.page.wait_for_function(
+                _READ_ROWS_JS, arg=[compiled_container, spec, min_rows], timeout=timeout
+            )
+        except PlaywrightTimeoutError:
+            raise AssertionError(
+                f"Expected at least {min_rows} match(es) for {container or 'page'} within {timeout}ms"
+            ) from None
+        rows = handle.json_value()
+        duration_ms = self._record("read_rows", started)
+        logger.info(
+            f"Read {len(rows)} row(s) from {container or 'page'}",
+            extra={"container": container, "rows": len(rows), "duration_ms": round(duration_ms, 2)},
         )
+        return rows
 
     def get_text(self, selector: str, timeout: int = DEFAULT_TIMEOUT) -> str:
         logger.info(f"Getting text from {selector}", extra={"selector": selector, "timeout": timeout})
-        locator = self.page.locator(selector).first
-        expect(locator).to_be_visible(timeout=timeout)
-        text = locator.inner_text().strip()
+        started = time.perf_counter()
+        locator = self.locator(selector).first
+        if self.strict:
+            expect(locator).to_be_visible(timeout=timeout)
+            text = locator.inner_text().strip()
+        else:
+            text = locator.inner_text(timeout=timeout).strip()
+        duration_ms = self._record("get_text", started)
         logger.info(
             f"Got text from {selector} | len={len(text)} | preview={text[:20]}",
-            extra={"selector": selector, "length": len(text), "text_preview": text[:20]},
+            extra={
+                "selector": selector,
+                "length": len(text),
+                "text_preview": text[:20],
+                "mode": self.mode,
+                "duration_ms": round(duration_ms, 2),
+            },
         )
         return text
@@ -1,14 +1,37 @@
 import logging
-from typing import Optional
-from urllib.parse import urljoin
+from typing import Dict, Optional
+from urllib.parse import urljoin, urlsplit
 
 from playwright.sync_api import Page
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
-from automation_framework.helpers.fe import BaseHelper
+from automation_framework.helpers.fe import BaseHelper, DEFAULT_TIMEOUT
+from automation_framework.pages.locators import products_locators
+from automation_framework.pages.models import CartModel, Catalog, cached_catalog
 
 
 logger = logging.getLogger(__name__)
 
+CART_STORAGE_KEY = "cart-contents"
+SESSION_COOKIE = "session-username"
+
+# Badge text (null when hidden/absent) plus the app's persisted cart ids, in one call. With an
+# expected count it returns false until the badge agrees, so callers get expect()-style retries.
+_CART_STATE_JS = """
+([badgeSelector, storageKey, expected]) => {
+  if (badgeSelector.startsWith('xpath=')) badgeSelector = badgeSelector.slice(6);
+  const badge = (badgeSelector.startsWith('/') || badgeSelector.startsWith('('))
+    ? document.evaluate(badgeSelector, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+    : document.querySelector(badgeSelector);
+  const text = badge && badge.getClientRects().length ? badge.innerText.trim() : null;
+  let ids = [];
+  try { ids = JSON.parse(window.localStorage.getItem(storageKey) || '[]'); } catch (e) {}
+  const count = text === null ? 0 : parseInt(text, 10);
+  if (expected !== null && count !== expected) return false;
+  return {badge: text, count, ids};
+}
+"""
+
 
 class BaseKeywords(BaseHelper):
     """
@@ -21,3 +44,58 @@ class BaseKeywords(BaseHelper):
         full_url = urljoin(base_url or self.page.context.base_url or "", url)
         logger.info(f"Navigating to URL: {full_url}")
         self.page.goto(full_url)
+
+    @property
+    def origin(self) -> str:
+        parts = urlsplit(self.page.url or "")
+        return f"{parts.scheme}://{parts.netloc}"
+
+    @property
+    def catalog_key(self) -> str:
+        """Origin plus the logged-in user: users such as visual_user render other prices and images."""
+        origin = self.origin
+        cookies = self.page.context.cookies(origin) if urlsplit(origin).netloc else []
+        user = next((cookie["value"] for cookie in cookies if cookie["name"] == SESSION_COOKIE), "")
+        return f"{origin}#{user}"
+
+    @property
+    def cached_catalog(self) -> Optional[Catalog]:
+        return cached_catalog(self.catalog_key)
+
+    @property
+    def cart(self) -> CartModel:
+        """Cart model shared by every keyword class on this page (i.e. per test)."""
+        model = getattr(self.page, "_cart_model", None)
+        if model is None:
+            model = CartModel(self.cart_state()["ids"])
+            setattr(self.page, "_cart_model", model)
+        return model
+
+    def cart_state(self, expected_count: Optional[int] = None, timeout: int = DEFAULT_TIMEOUT) -> Dict:
+        """
+        Snapshot of the cart badge and persisted cart ids. With `expected_count`, waits until
+        the badge shows that count and raises AssertionError with the last state otherwise.
+        """
+        badge = self.locators.compile(products_locators.CART_BADGE)
+        if expected_count is None:
+            return self.page.evaluate(_CART_STATE_JS, [badge, CART_STORAGE_KEY, None])
+        try:
+            handle = self.page.wait_for_function(
+                _CART_STATE_JS, arg=[badge, CART_STORAGE_KEY, expected_count], timeout=timeout
+            )
+        except PlaywrightTimeoutError:
+            state = self.page.evaluate(_CART_STATE_JS, [badge, CART_STORAGE_KEY, None])
+            raise AssertionError(
+                f"Cart badge expected {expected_count}, found {state['badge'] or '(hidden)'} "
+                f"| stored ids={state['ids']}"
+            ) from None
+        return handle.json_value()
+
+    def verify_cart_model(self, state: Optional[Dict] = None) -> Dict:
+        """Assert the page's cart ids match the shared model; returns the state used."""
+        state = state or self.cart_state()
+        mismatch = self.cart.mismatch(state["ids"])
+        if mismatch:
+            logger.error(mismatch)
+        assert mismatch is None, mismatch
+        return state
@@ -1,13 +1,66 @@
+import json
 import logging
+from typing import Iterable, Optional
+from urllib.parse import urljoin
+
 from playwright.sync_api import Page, expect
 import re
 
-from automation_framework.pages.keywords.base_keywords import BaseKeywords
+from automation_framework.config import global_config as gc
+from automation_framework.pages.keywords.base_keywords import CART_STORAGE_KEY, BaseKeywords
 from automation_framework.pages.locators import cart_and_checkout_locators as locators
 from automation_framework.pages.locators import products_locators
+from automation_framework.pages.models import order_summary, parse_price_cents
 
 logger = logging.getLogger(__name__)
 
+CART_ITEM_FIELDS = {
+    "name": locators.INVENTORY_ITEM_NAME,
+    "desc": locators.INVENTORY_ITEM_DESC,
+    "price": locators.INVENTORY_ITEM_PRICE,
+}
+SUMMARY_FIELDS = {
+    "payment": locators.PAYMENT_INFO,
+    "shipping": locators.SHIPPING_INFO,
+    "item_total": locators.ITEM_TOTAL,
+    "tax": locators.TAX_TOTAL,
+    "total": locators.TOTAL_PRICE,
+}
+
+# step -> (path, title locator proving the page rendered)
+SEED_STEPS = {
+    "inventory": ("inventory.html", products_locators.PRODUCTS_TITLE),
+    "cart": ("cart.html", locators.CART_TITLE),
+    "checkout-step-one": ("checkout-step-one.html", locators.CHECKOUT_INFO_TITLE),
+    "checkout-step-two": ("checkout-step-two.html", locators.CHECKOUT_OVERVIEW_TITLE),
+}
+
+
+def seed_cart(page: Page, product_ids: Iterable[int], step: str = "cart") -> "CartKeywords":
+    """
+    Put `product_ids` in the cart by writing the app's cart storage, then open `step` directly
+    (cart, checkout-step-one, checkout-step-two or inventory). For flows that do not test
+    add-to-cart itself; the shared cart model is updated to match.
+    """
+    if step not in SEED_STEPS:
+        raise ValueError(f"Unknown seed step {step!r}; expected one of {sorted(SEED_STEPS)}")
+    ids = [int(product_id) for product_id in product_ids]
+    path, title = SEED_STEPS[step]
+    base_url = gc.SAUCE_DEMO_URL
+    logger.info("Seeding cart", extra={"product_ids": ids, "step": step})
+    if not (page.url or "").startswith(base_url.rstrip("/")):
+        # localStorage is per origin, so the page must be on the app before writing it
+        page.goto(base_url, wait_until="domcontentloaded")
+    page.evaluate(
+        "([key, value]) => window.localStorage.setItem(key, value)",
+        [CART_STORAGE_KEY, json.dumps(ids)],
+    )
+    page.goto(urljoin(base_url, path), wait_until="domcontentloaded")
+    cart = CartKeywords(page)
+    expect(cart.locator(title)).to_be_visible()
+    cart.cart.replace(ids)
+    logger.info("Cart seeded and %s opened", step, extra={"product_ids": ids, "url": page.url})
+    return cart
 
 
 class CartKeywords(BaseKeywords):
@@ -16,156 +69,176 @@ class CartKeywords(BaseKeywords):
 
     def navigate_to_cart(self) -> None:
         logger.info("Opening cart")
-        self.page.locator(products_locators.CART_LINK).click()
-        expect(self.page.locator(locators.CART_TITLE)).to_be_visible()
-        expect(self.page.locator(locators.CART_QTY_LABEL)).to_be_visible()
-        expect(self.page.locator(locators.CART_DESC_LABEL)).to_be_visible()
-        expect(self.page.locator(locators.CONTINUE_SHOPPING_BUTTON)).to_be_visible()
-        expect(self.page.locator(locators.CHECKOUT_BUTTON)).to_be_visible()
+        self.locator(products_locators.CART_LINK).click()
+        expect(self.locator(locators.CART_TITLE)).to_be_visible()
+        expect(self.locator(locators.CART_QTY_LABEL)).to_be_visible()
+        expect(self.locator(locators.CART_DESC_LABEL)).to_be_visible()
+        expect(self.locator(locators.CONTINUE_SHOPPING_BUTTON)).to_be_visible()
+        expect(self.locator(locators.CHECKOUT_BUTTON)).to_be_visible()
         logger.info("Cart opened and default locators visible")
 
     def validate_cart_items(self, expected_items: list[dict]) -> None:
-        """Validate cart items match expected details."""
+        """Validate cart items match expected details (see `expected_cart_items` for catalog rows)."""
         logger.info("Validating cart items")
-        cart_items = self.page.locator(locators.CART_ITEM)
-        expect(cart_items.first).to_be_visible()
-        count = cart_items.count()
+        actual_items = self.read_rows(CART_ITEM_FIELDS, locators.CART_ITEM)
+        count = len(actual_items)
         if count != len(expected_items):
             logger.error(f"Cart item count mismatch: expected {len(expected_items)}, found {count}")
         assert count == len(expected_items), f"Expected {len(expected_items)} items, found {count}"
-        for i, item in enumerate(expected_items):
-            item_locator = cart_items.nth(i)
-            expect(item_locator.locator(locators.INVENTORY_ITEM_NAME)).to_have_text(item["name"])
-            expect(item_locator.locator(locators.INVENTORY_ITEM_DESC)).to_have_text(item["desc"])
-            expect(item_locator.locator(locators.INVENTORY_ITEM_PRICE)).to_have_text(item["price"])
+        for i, (item, actual) in enumerate(zip(expected_items, actual_items)):
+            expected = {key: item[key] for key in CART_ITEM_FIELDS}
+            assert actual == expected, f"Cart item {i+1} mismatch: expected {expected}, found {actual}"
             logger.info("Validated cart item %d: name='%s', desc='%s', price='%s'", i+1, item["name"], item["desc"][:100], item["price"])
         logger.info("All %d cart items validated successfully", len(expected_items))
 
     def click_checkout(self) -> None:
         logger.info("Clicking checkout button")
-        self.page.locator(locators.CHECKOUT_BUTTON).click()
-        expect(self.page.locator(locators.CHECKOUT_INFO_TITLE)).to_be_visible()
+        self.locator(locators.CHECKOUT_BUTTON).click()
+        expect(self.locator(locators.CHECKOUT_INFO_TITLE)).to_be_visible()
         logger.info("Navigated to checkout information page")
 
     def fill_checkout_info(self, first_name: str, last_name: str, zip_code: str) -> None:
         logger.info("Filling checkout information")
-        self.page.locator(locators.CHECKOUT_FIRST_NAME_INPUT).fill(first_name)
-        self.page.locator(locators.CHECKOUT_LAST_NAME_INPUT).fill(last_name)
-        self.page.locator(locators.CHECKOUT_ZIP_INPUT).fill(zip_code)
+        self.fill_form({
+            locators.CHECKOUT_FIRST_NAME_INPUT: first_name,
+            locators.CHECKOUT_LAST_NAME_INPUT: last_name,
+            locators.CHECKOUT_ZIP_INPUT: zip_code,
+        })
         logger.info("Filled checkout info: first_name='%s', last_name='%s', zip_code='%s'", first_name, last_name, zip_code)
         logger.info("Checkout information filled")
 
     def proceed_to_overview(self) -> None:
         logger.info("Proceeding to checkout overview")
-        self.page.locator(locators.CHECKOUT_CONTINUE_BUTTON).click()
-        expect(self.page.locator(locators.CHECKOUT_OVERVIEW_TITLE)).to_be_visible()
+        self.locator(locators.CHECKOUT_CONTINUE_BUTTON).click()
+        expect(self.locator(locators.CHECKOUT_OVERVIEW_TITLE)).to_be_visible()
         logger.info("Navigated to checkout overview")
 
     def verify_overview(self, expected_items: list[dict], payment: str, shipping: str) -> None:
         logger.info("Verifying checkout overview")
         # Verify items
         self.validate_cart_items(expected_items)
-        # Verify payment
-        expect(self.page.locator(locators.PAYMENT_INFO)).to_have_text(payment)
+        # Payment, shipping and totals are read in one call (items above already waited for render)
+        summary = self.read_rows(SUMMARY_FIELDS)[0]
+        assert summary["payment"] == payment, f"Payment info {summary['payment']!r} != {payment!r}"
         logger.info("Verified payment information: '%s'", payment)
-        # Verify shipping
-        expect(self.page.locator(locators.SHIPPING_INFO)).to_have_text(shipping)
+        assert summary["shipping"] == shipping, f"Shipping info {summary['shipping']!r} != {shipping!r}"
         logger.info("Verified shipping information: '%s'", shipping)
-        # Calculate totals
-        item_total = sum(float(item["price"].replace("$", "")) for item in expected_items)
-        tax = round(item_total * 0.08, 2)  # Assuming 8% tax
-        total = item_total + tax
-        logger.info("Calculated totals: item_total=%.2f, tax=%.2f, total=%.2f", item_total, tax, total)
-        # Verify totals
-        expect(self.page.locator(locators.ITEM_TOTAL)).to_have_text(f"Item total: ${item_total}")
-        expect(self.page.locator(locators.TAX_TOTAL)).to_have_text(f"Tax: ${tax:.2f}")
-        expect(self.page.locator(locators.TOTAL_PRICE)).to_have_text(f"Total: ${total:.2f}")
+        # Expected totals are computed from the item prices
+        expected = order_summary(parse_price_cents(item["price"]) for item in expected_items)
+        logger.info("Calculated totals: %s | %s | %s", *expected)
+        assert summary["item_total"] == expected.item_total, f"{summary['item_total']!r} != {expected.item_total!r}"
+        assert summary["tax"] == expected.tax, f"{summary['tax']!r} != {expected.tax!r}"
+        assert summary["total"] == expected.total, f"{summary['total']!r} != {expected.total!r}"
         logger.info("All totals verified successfully")
         logger.info("Checkout overview verified")
 
     def finish_checkout(self) -> None:
         logger.info("Finishing checkout")
-        self.page.locator(locators.FINISH_BUTTON).click()
-        expect(self.page.locator(locators.CHECKOUT_COMPLETE_TITLE)).to_be_visible()
-        expect(self.page.locator(locators.COMPLETE_TEXT)).to_have_text("Thank you for your order!")
-        expect(self.page.locator(locators.BACK_HOME_BUTTON)).to_be_visible()
+        self.locator(locators.FINISH_BUTTON).click()
+        expect(self.locator(locators.CHECKOUT_COMPLETE_TITLE)).to_be_visible()
+        expect(self.locator(locators.COMPLETE_TEXT)).to_have_text("Thank you for your order!")
+        expect(self.locator(locators.BACK_HOME_BUTTON)).to_be_visible()
+        self.cart.clear()  # the app empties the cart on a completed order
         logger.info("Checkout completed successfully")
         # Click Back Home and verify navigation to inventory
-        self.page.locator(locators.BACK_HOME_BUTTON).click()
-        expect(self.page.locator(products_locators.PRODUCTS_TITLE)).to_be_visible()
+        self.locator(locators.BACK_HOME_BUTTON).click()
+        expect(self.locator(products_locators.PRODUCTS_TITLE)).to_be_visible()
         expect(self.page).to_have_url(re.compile(r"inventory\.html"))
         logger.info("Navigated back to inventory from checkout complete")
 
     def cancel_checkout(self) -> None:
         logger.info("Canceling checkout")
-        is_on_overview = self.page.locator(locators.CHECKOUT_OVERVIEW_TITLE).is_visible()
-        self.page.locator(locators.CHECKOUT_CANCEL_BUTTON).click()
+        is_on_overview = self.locator(locators.CHECKOUT_OVERVIEW_TITLE).is_visible()
+        self.locator(locators.CHECKOUT_CANCEL_BUTTON).click()
         if is_on_overview:
-            expect(self.page.locator(products_locators.PRODUCTS_TITLE)).to_be_visible()
+            expect(self.locator(products_locators.PRODUCTS_TITLE)).to_be_visible()
             logger.info("Returned to products page from overview")
         else:
-            expect(self.page.locator(locators.CART_TITLE)).to_be_visible()
+            expect(self.locator(locators.CART_TITLE)).to_be_visible()
             logger.info("Returned to cart")
 
     def continue_shopping_from_cart(self) -> None:
         logger.info("Continuing shopping from cart")
-        self.page.locator(locators.CONTINUE_SHOPPING_BUTTON).click()
-        expect(self.page.locator(products_locators.PRODUCTS_TITLE)).to_be_visible()
+        self.locator(locators.CONTINUE_SHOPPING_BUTTON).click()
+        expect(self.locator(products_locators.PRODUCTS_TITLE)).to_be_visible()
         expect(self.page).to_have_url(re.compile(r"inventory\.html"))
         logger.info("Returned to products page")
 
+    def expected_cart_items(self, ids: Optional[Iterable[int]] = None) -> list[dict]:
+        """
+        Expected cart rows for `ids` (default: the shared cart model) from the cached catalog.
+        Raises RuntimeError when the catalog was not loaded for this user, rather than falling
+        back to the cart page that is being verified.
+        """
+        catalog = self.cached_catalog
+        if catalog is None:
+            raise RuntimeError(f"Product catalog not cached for {self.catalog_key}; load the inventory page first")
+        ids = list(self.cart.ids if ids is None else ids)
+        unknown = [product_id for product_id in ids if product_id not in catalog.by_id]
+        if unknown:
+            raise RuntimeError(f"Product ids {unknown} are not in the cached catalog")
+        return [catalog.by_id[product_id].as_dict() for product_id in ids]
+
     def get_cart_items(self) -> list[dict]:
-        """Get list of items in cart."""
+        """Get list of items in cart: from the cart model when the catalog is loaded, else the page."""
         logger.info("Getting cart items")
-        items = []
-        cart_items = self.page.locator(locators.CART_ITEM)
-        count = cart_items.count()
-        for i in range(count):
-            item_locator = cart_items.nth(i)
-            name = item_locator.locator(locators.INVENTORY_ITEM_NAME).inner_text().strip()
-            desc = item_locator.locator(locators.INVENTORY_ITEM_DESC).inner_text().strip()
-            price = item_locator.locator(locators.INVENTORY_ITEM_PRICE).inner_text().strip()
-            items.append({"name": name, "desc": desc, "price": price})
-            logger.info("Retrieved cart item %d: name='%s', desc='%s', price='%s'", i+1, name, desc[:100], price)
+        catalog = self.cached_catalog
+        if catalog is not None and all(product_id in catalog.by_id for product_id in self.cart.ids):
+            items = self.cart.items(catalog)
+            logger.info("Retrieved %d cart items from cart model", len(items), extra={"ids": list(self.cart.ids)})
+            return items
+        items = self.read_rows(CART_ITEM_FIELDS, locators.CART_ITEM, min_rows=0)
+        for i, item in enumerate(items):
+            logger.info("Retrieved cart item %d: name='%s', desc='%s', price='%s'", i+1, item["name"], (item["desc"] or "")[:100], item["price"])
         logger.info("Retrieved %d cart items", len(items))
         return items
 
     def continue_shopping_from_overview(self) -> None:
         logger.info("Continuing shopping from overview")
-        self.page.locator(locators.CONTINUE_SHOPPING_BUTTON).click()
-        expect(self.page.locator(products_locators.PRODUCTS_TITLE)).to_be_visible()
+        self.locator(locators.CONTINUE_SHOPPING_BUTTON).click()
+        expect(self.locator(products_locators.PRODUCTS_TITLE)).to_be_visible()
         expect(self.page).to_have_url(re.compile(r"inventory\.html"))
         logger.info("Returned to products page from overview")
 
     def remove_item_from_cart(self, index: int = 0) -> None:
         """Remove an item from cart by index (default first)."""
         logger.info("Removing item from cart at index %s", index)
-        cart_items = self.page.locator(locators.CART_ITEM)
+        cart_items = self.locator(locators.CART_ITEM)
         if cart_items.count() > index:
             remove_btn = cart_items.nth(index).locator("button[data-test*='remove']")
             expect(remove_btn).to_be_visible()
             remove_btn.click()
+            self.cart.remove_at(index)
             logger.info("Item removed from cart")
         else:
             logger.warning("No item at index %s to remove", index)
 
-    def remove_all_items_from_cart(self) -> None:
-        """Remove all items from cart."""
+    def remove_all_items_from_cart(self, verify_each: bool = False) -> None:
+        """
+        Remove all items from cart: one in-page pass over every Remove button, then a single
+        cart/badge check. verify_each=True removes one at a time and checks the badge after each.
+        """
         logger.info("Removing all items from cart")
-        while True:
-            cart_items = self.page.locator(locators.CART_ITEM)
-            count = cart_items.count()
-            if count == 0:
-                break
-            self.remove_item_from_cart(index=0)
+        if verify_each:
+            for _ in range(self.locator(locators.CART_ITEM).count()):
+                self.remove_item_from_cart(index=0)
+                self.verify_cart_model(self.cart_state(len(self.cart)))
+        else:
+            self.click_all(locators.CART_ITEM, within="button[data-test*='remove']")
+        self.cart.clear()
+        expect(self.locator(locators.CART_ITEM)).to_have_count(0)
+        self.verify_cart_model(self.cart_state(0))
         logger.info("All items removed from cart")
 
     def validate_empty_cart(self) -> None:
         """Validate that the cart is empty."""
         logger.info("Validating cart is empty")
-        cart_items = self.page.locator(locators.CART_ITEM)
+        cart_items = self.locator(locators.CART_ITEM)
         count = cart_items.count()
         if count != 0:
             logger.error(f"Cart is not empty: found {count} items")
         expect(cart_items).to_have_count(0)
         logger.info("Cart is empty")
+
+
+__all__ = ["CartKeywords", "SEED_STEPS", "seed_cart"]
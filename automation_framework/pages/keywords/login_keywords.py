@@ -1,4 +1,3 @@
-import csv
 import logging
 import re
 from pathlib import Path
@@ -8,11 +7,40 @@ import pytest
 from _pytest.mark.structures import ParameterSet
 from playwright.sync_api import expect, Page
 
+from automation_framework.helpers.fe import BaseHelper
 from automation_framework.pages.keywords.base_keywords import BaseKeywords
 from automation_framework.pages.locators import login_locators, products_locators
+from automation_framework.utils.data_providers import Column, DataProvider, Schema, optional_bool, stripped, text
 
 logger = logging.getLogger(__name__)
 
+# Shared with the concurrent login batch (utils/login_batch.py), so both flows check the same things
+LOGIN_FORM = {
+    "username": login_locators.USERNAME_INPUT,
+    "password": login_locators.PASSWORD_INPUT,
+    "submit": login_locators.LOGIN_BUTTON,
+    "error": login_locators.ERROR_MESSAGE,
+}
+INVENTORY_URL_RE = re.compile(r"/inventory\.html/?$")
+# Visible after a successful login, checked in this order (the last one is the item list)
+LOGIN_SUCCESS_LOCATORS = (
+    products_locators.APP_LOGO,
+    products_locators.PRODUCTS_TITLE,
+    products_locators.INVENTORY_ITEM_NAME,
+)
+LOGIN_TIMEOUT_MS = 15000
+LOGIN_CHECK_TIMEOUT_MS = 10000
+
+
+def login_expectation(validation: Optional[dict]) -> tuple[Optional[bool], str]:
+    """(isValid, expected error message) for a validation dict; a failing case must name its message."""
+    is_valid = validation.get("isValid") if isinstance(validation, dict) else None
+    message = ""
+    if is_valid is False:
+        message = validation.get("validationMessage", "") or ""
+        assert message, "validationMessage is required when isValid is False."
+    return is_valid, message
+
 
 def _first_existing(page: Page, selectors):
     for selector in selectors:
@@ -33,7 +61,7 @@ def _is_logged_in(page: Page) -> bool:
 
     # Consider user logged in if already on inventory page or inventory elements visible
     url = page.url or ""
-    if re.search(r"/inventory\.html/?$", url):
+    if INVENTORY_URL_RE.search(url):
         return True
     try:
         if page.locator(products_locators.APP_LOGO).first.is_visible():
@@ -55,46 +83,37 @@ def perform_login(
     logger.info(f"Arrived at URL: {page.url}")
     page.wait_for_load_state("networkidle")
 
-    logger.info("Waiting for login form")
-    expect(page.locator(login_locators.USERNAME_INPUT).first).to_be_visible(timeout=15000)
-    expect(page.locator(login_locators.PASSWORD_INPUT).first).to_be_visible(timeout=15000)
-
-    user_candidates = [login_locators.USERNAME_INPUT]
-    pass_candidates = [login_locators.PASSWORD_INPUT]
-    submit_candidates = [login_locators.LOGIN_BUTTON]
-
-    user_input = _first_existing(page, user_candidates) or page.get_by_role("textbox").first
-    password_input = _first_existing(page, pass_candidates)
-    submit_btn = _first_existing(page, submit_candidates)
-
-    assert user_input is not None, "Could not find username/email input on the page."
-    assert password_input is not None, "Could not find password input on the page."
-    assert submit_btn is not None, "Could not find submit button on the page."
-
     user_preview = username or "(empty)"
     pass_preview = "***" if password else "(empty)"
-    logger.info(f"Filling username: {user_preview}")
-    user_input.fill(username or "")
-    logger.info(f"Filling password: {pass_preview}")
-    password_input.fill(password or "")
+    logger.info(f"Filling login form | username={user_preview} | password={pass_preview}")
+    # Waits for both inputs together and fills them in one in-page call
+    BaseHelper(page).fill_form(
+        {
+            LOGIN_FORM["username"]: username or "",
+            LOGIN_FORM["password"]: password or "",
+        },
+        timeout=LOGIN_TIMEOUT_MS,
+    )
+
+    submit_btn = _first_existing(page, [LOGIN_FORM["submit"]])
+    assert submit_btn is not None, "Could not find submit button on the page."
     logger.info("Clicking submit")
     submit_btn.click()
 
     logger.info("Waiting for post-login state")
-    page.wait_for_load_state("networkidle", timeout=15000)
+    page.wait_for_load_state("networkidle", timeout=LOGIN_TIMEOUT_MS)
     logger.info(f"Current URL after submit: {page.url}")
 
     if validation is None:
         return _is_logged_in(page)
 
-    is_valid = validation.get("isValid") if isinstance(validation, dict) else None
+    is_valid, validation_message = login_expectation(validation)
     if is_valid is True:
         logger.info("Asserting successful login state")
-        expect(page).to_have_url(re.compile(r"https://www\.saucedemo\.com/inventory\.html/?"), timeout=15000)
-        expect(page.locator(products_locators.APP_LOGO)).to_be_visible(timeout=10000)
-        expect(page.locator(products_locators.PRODUCTS_TITLE)).to_be_visible(timeout=10000)
-        items = page.locator(products_locators.INVENTORY_ITEM_NAME)
-        expect(items.first).to_be_visible(timeout=10000)
+        expect(page).to_have_url(INVENTORY_URL_RE, timeout=LOGIN_TIMEOUT_MS)
+        for selector in LOGIN_SUCCESS_LOCATORS:
+            expect(page.locator(selector).first).to_be_visible(timeout=LOGIN_CHECK_TIMEOUT_MS)
+        items = page.locator(LOGIN_SUCCESS_LOCATORS[-1])
         assert items.count() >= 1, "Expected at least one inventory item to be listed."
         if not _is_logged_in(page):
             logger.error("Login failed: not on inventory page or elements not visible")
@@ -103,68 +122,58 @@ def perform_login(
         return True
 
     if is_valid is False:
-        validation_message = ""
-        if isinstance(validation, dict):
-            validation_message = validation.get("validationMessage", "") or ""
-        assert validation_message, "validationMessage is required when isValid is False."
         logger.info(f"Asserting expected error message: {validation_message}")
-        error_locator = page.locator(login_locators.ERROR_MESSAGE)
-        expect(error_locator).to_be_visible(timeout=10000)
-        expect(error_locator).to_contain_text(validation_message, timeout=10000)
+        error_locator = page.locator(LOGIN_FORM["error"])
+        expect(error_locator).to_be_visible(timeout=LOGIN_CHECK_TIMEOUT_MS)
+        expect(error_locator).to_contain_text(validation_message, timeout=LOGIN_CHECK_TIMEOUT_MS)
         return False
 
     return _is_logged_in(page)
 
 
-def load_login_cases(data_file: Path) -> list[ParameterSet]:
-    if not data_file.exists():
-        raise FileNotFoundError(f"Login data file not found: {data_file}")
-
-    def _parse_is_valid(raw_value: str, row_num: int) -> Optional[bool]:
-        value = raw_value.strip().lower()
-        if value in {"", "none"}:
-            return None
-        if value in {"true", "1", "yes"}:
-            return True
-        if value in {"false", "0", "no"}:
-            return False
-        raise ValueError(
-            f"Row {row_num}: isValid must be true/false/blank, got '{raw_value}'."
-        )
+def _severity(value) -> str:
+    return stripped(value).lower()
+
+
+def _check_login_row(row: dict) -> Optional[str]:
+    if row["isValid"] is False and not row["validationMessage"]:
+        return "validationMessage is required when isValid is false."
+    return None
+
+
+LOGIN_SCHEMA = Schema(
+    Column("id", stripped, required=False),
+    Column("username", stripped),
+    Column("password", text),
+    Column("isValid", optional_bool),
+    Column("validationMessage", stripped, required=False),
+    Column("severity", _severity, required=False, default="minor"),
+    check=_check_login_row,
+)
+LOGIN_ARGNAMES = "username,password,validation"
+
+
+def login_case_param(row: dict, index: int) -> ParameterSet:
+    """Build the (username, password, validation) param for one validated login row."""
+    validation = None
+    if row["isValid"] is not None:
+        validation = {"isValid": row["isValid"]}
+        if row["validationMessage"]:
+            validation["validationMessage"] = row["validationMessage"]
+
+    marker = getattr(pytest.mark, row["severity"], None)
+    return pytest.param(
+        row["username"],
+        row["password"],
+        validation,
+        id=row["id"] or f"row{index}",
+        marks=[marker] if marker else [],
+    )
 
-    cases: list[ParameterSet] = []
-    with data_file.open(newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for idx, row in enumerate(reader, start=2):
-            username = (row.get("username") or "").strip()
-            password = row.get("password") or ""
-            is_valid = _parse_is_valid(row.get("isValid", ""), idx)
-            validation_message = (row.get("validationMessage") or "").strip()
-            severity = (row.get("severity") or "minor").strip().lower()
-
-            validation = None
-            if is_valid is not None:
-                validation = {"isValid": is_valid}
-                if validation_message:
-                    validation["validationMessage"] = validation_message
-            if is_valid is False and not validation_message:
-                raise ValueError(
-                    f"Row {idx}: validationMessage is required when isValid is false."
-                )
-
-            label = row.get("id") or f"row{idx-1}"
-            marker = getattr(pytest.mark, severity, None)
-            marks = [marker] if marker else []
-            cases.append(
-                pytest.param(
-                    username,
-                    password,
-                    validation,
-                    id=label,
-                    marks=marks,
-                )
-            )
-    return cases
+
+def load_login_cases(data_file: Path) -> list[ParameterSet]:
+    provider = DataProvider(data_file, LOGIN_SCHEMA)
+    return list(provider.params(LOGIN_ARGNAMES.split(","), login_case_param))
 
 
 class LoginPage(BaseKeywords):
@@ -193,4 +202,15 @@ class LoginPage(BaseKeywords):
         return perform_login(self.page, base_url, username, password, validation)
 
 
-__all__ = ["LoginPage", "perform_login", "load_login_cases"]
+__all__ = [
+    "INVENTORY_URL_RE",
+    "LOGIN_ARGNAMES",
+    "LOGIN_FORM",
+    "LOGIN_SCHEMA",
+    "LOGIN_SUCCESS_LOCATORS",
+    "LoginPage",
+    "load_login_cases",
+    "login_case_param",
+    "login_expectation",
+    "perform_login",
+]
@@ -1,16 +1,32 @@
 import logging
 import random
 import re
-from typing import Iterable
-from urllib.parse import urljoin
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import parse_qs, urljoin, urlsplit
 
 from playwright.sync_api import expect
 
 from automation_framework.pages.keywords.base_keywords import BaseKeywords
 from automation_framework.pages.locators import products_locators as locators
+from automation_framework.pages.models import Catalog, get_catalog, parse_price_cents
 
 logger = logging.getLogger(__name__)
 
+PRODUCT_ID_LINK = "a[id$='_title_link']"
+CARD_FIELDS = {
+    "link_id": (PRODUCT_ID_LINK, "id"),
+    "name": locators.PRODUCT_NAME,
+    "desc": locators.PRODUCT_DESC,
+    "price": locators.PRODUCT_PRICE,
+    "image": (locators.PRODUCT_IMG, "src"),
+    "button": ("button", "data-test"),
+}
+DETAIL_FIELDS = {
+    "name": locators.PRODUCT_DETAIL_NAME,
+    "desc": locators.PRODUCT_DETAIL_DESC,
+    "price": locators.PRODUCT_DETAIL_PRICE,
+}
+
 
 class ProductsKeywords(BaseKeywords):
     """Products/Inventory page interactions."""
@@ -22,15 +38,15 @@ class ProductsKeywords(BaseKeywords):
     def assert_inventory_loaded(self):
         logger.info("Verifying inventory page is loaded")
         expect(self.page).to_have_url(re.compile(r"inventory\.html/?"))
-        expect(self.page.locator(locators.PRODUCTS_TITLE)).to_be_visible()
-        cards = self.page.locator(locators.PRODUCT_CARD)
+        expect(self.locator(locators.PRODUCTS_TITLE)).to_be_visible()
+        cards = self.locator(locators.PRODUCT_CARD)
         expect(cards.first).to_be_visible()
         assert cards.count() >= 1, "Expected at least one product card on inventory page"
         logger.info("Inventory page loaded with at least one product")
 
     def verify_product_cards_have_core_fields(self):
         logger.info("Verifying product cards have name, description, price, and image")
-        cards = self.page.locator(locators.PRODUCT_CARD)
+        cards = self.locator(locators.PRODUCT_CARD)
         total = cards.count()
         assert total >= 1, "No product cards found on inventory page"
         for idx in range(total):
@@ -64,11 +80,9 @@ class ProductsKeywords(BaseKeywords):
 
     def verify_price_format_for_all_products(self):
         logger.info("Validating product price format ($, decimal, two-digit precision)")
-        cards = self.page.locator(locators.PRODUCT_CARD)
-        expect(cards.first).to_be_visible()
         price_re = re.compile(r"^\$\d+\.\d{2}$")
-        for idx in range(cards.count()):
-            price_text = cards.nth(idx).locator(locators.PRODUCT_PRICE).inner_text().strip()
+        for idx, card in enumerate(self._read_cards()):
+            price_text = card["price"] or ""
             logger.info("Price format check | index=%s | raw=%s", idx + 1, price_text)
             assert price_re.match(price_text), f"Invalid price format on card {idx+1}: {price_text}"
             logger.info("Price validated | index=%s | price=%s", idx + 1, price_text)
@@ -76,73 +90,94 @@ class ProductsKeywords(BaseKeywords):
 
     def get_product_count(self) -> int:
         logger.info("Getting total product card count on inventory page")
-        cards = self.page.locator(locators.PRODUCT_CARD)
+        cards = self.locator(locators.PRODUCT_CARD)
         expect(cards.first).to_be_visible()
         total = cards.count()
         assert total > 0, "No product cards found on inventory page"
         logger.info("Total product cards found: %s", total)
         return total
 
-    def _clear_cart_and_return(self):
+    def _clear_cart_and_return(self, verify_each: bool = False):
         logger.info("Clearing cart before add-to-cart test")
-        self.page.locator(locators.CART_LINK).click()
-        remove_buttons = self.page.locator(locators.CART_REMOVE_BTN)
-        for i in range(remove_buttons.count()):
-            remove_buttons.nth(i).click()
-        self.page.locator(locators.CART_CONTINUE_BTN).click()
-        expect(self.page).to_have_url(re.compile(r"inventory\.html/?"))
-        badge = self.page.locator(locators.CART_BADGE)
-        if badge.count() > 0:
-            expect(badge).not_to_be_visible()
+        on_inventory = bool(re.search(r"inventory\.html/?$", self.page.url or ""))
+        if on_inventory and not self.cart_state()["ids"]:
+            self.cart.clear()
+            logger.info("Cart already empty on inventory page")
+            return
+        if on_inventory and not verify_each:
+            # Every cart item has a Remove button on its inventory card: one pass, no navigation
+            self.click_all(locators.REMOVE_BTN)
+        else:
+            self.locator(locators.CART_LINK).click()
+            expect(self.page).to_have_url(re.compile(r"cart\.html/?"))
+            if verify_each:
+                remove_buttons = self.locator(locators.CART_REMOVE_BTN)
+                for remaining in range(remove_buttons.count() - 1, -1, -1):
+                    remove_buttons.first.click()
+                    self.cart_state(remaining)
+            else:
+                self.click_all(locators.CART_REMOVE_BTN)
+            self.locator(locators.CART_CONTINUE_BTN).click()
+            expect(self.page).to_have_url(re.compile(r"inventory\.html/?"))
+        self.cart.clear()
+        self.verify_cart_model(self.cart_state(0))
         logger.info("Cart cleared and back on inventory page")
 
-    def clear_cart(self):
+    def clear_cart(self, verify_each: bool = False):
         """Public wrapper to clear cart and stay on inventory page."""
-        self._clear_cart_and_return()
-
-    def add_random_items(self, count: int, clear_cart: bool = True) -> None:
-        """Add random products to cart and verify badge updates."""
+        self._clear_cart_and_return(verify_each=verify_each)
+
+    def add_random_items(self, count: int, clear_cart: bool = True, verify_each: bool = False) -> None:
+        """
+        Add random products to cart. By default all chosen buttons are clicked in one pass and
+        the final badge/cart is verified once; verify_each=True checks the button toggle and
+        badge after every click (for tests covering incremental updates).
+        """
         if clear_cart:
             self._clear_cart_and_return()
 
-        cards = self.page.locator(locators.PRODUCT_CARD)
-        total = cards.count()
+        # One read gives names/prices and which cards still offer "Add to cart"
+        rows = self._read_cards()
+        total = len(rows)
         if count > total:
             raise ValueError(f"Requested {count} items but only {total} available")
 
-        badge = self.page.locator(locators.CART_BADGE)
-        current_badge = 0
-        if badge.count() > 0 and badge.first.is_visible():
-            current_badge = int(badge.inner_text().strip())
+        cart = self.cart
+        current_badge = len(cart)
         logger.info("Current badge count before adding: %s", current_badge)
 
-        # Get list of available products (those with "Add to cart" button)
-        available_indices = []
-        for i in range(total):
-            card = cards.nth(i)
-            if card.locator(locators.ADD_TO_CART_BTN).count() > 0:
-                available_indices.append(i)
+        available_indices = [
+            i for i, row in enumerate(rows) if "add-to-cart" in (row["button"] or "")
+        ]
 
         if len(available_indices) < count:
             raise ValueError(f"Requested {count} items but only {len(available_indices)} available to add")
 
         selected_indices = random.sample(available_indices, count)
-        for idx, sel in enumerate(selected_indices, start=1):
-            card = cards.nth(sel)
-            name_text = card.locator(locators.PRODUCT_NAME).inner_text().strip()
-            desc_text = card.locator(locators.PRODUCT_DESC).inner_text().strip()
-            price_text = card.locator(locators.PRODUCT_PRICE).inner_text().strip()
-
+        selected = [self.catalog.product(rows[sel]["name"]) for sel in selected_indices]
+        for idx, (sel, product) in enumerate(zip(selected_indices, selected), start=1):
             logger.info(
                 "Adding product to cart | selection=%s/%s | index=%s | name=%s | price=%s | desc=%s",
                 idx,
                 count,
                 sel + 1,
-                name_text,
-                price_text,
-                desc_text[:300].replace("\n", " "),
+                product.name,
+                product.price,
+                product.desc[:300].replace("\n", " "),
             )
 
+        if not verify_each:
+            self.click_all(locators.PRODUCT_CARD, selected_indices, within=locators.ADD_TO_CART_BTN)
+            for product in selected:
+                cart.add(product.id)
+            self.verify_cart_model(self.cart_state(current_badge + count))
+            logger.info("Badge updated correctly to %s after adding %s items", current_badge + count, count)
+            return
+
+        cards = self.locator(locators.PRODUCT_CARD)
+        badge = self.locator(locators.CART_BADGE)
+        for idx, (sel, product) in enumerate(zip(selected_indices, selected), start=1):
+            card = cards.nth(sel)
             card.locator(locators.ADD_TO_CART_BTN).click()
             # Validate button toggled to Remove after add
             expect(card.locator(locators.REMOVE_BTN)).to_be_visible()
@@ -150,13 +185,14 @@ class ProductsKeywords(BaseKeywords):
 
             expect(badge).to_be_visible()
             expect(badge).to_have_text(str(current_badge + idx))
+            cart.add(product.id)
 
         logger.info("Badge updated correctly to %s after adding %s items", current_badge + count, count)
 
     def verify_add_remove_toggle_on_card(self, idx: int):
         logger.info("Verifying Add→Remove→Add toggle for card index=%s", idx + 1)
         self._clear_cart_and_return()
-        cards = self.page.locator(locators.PRODUCT_CARD)
+        cards = self.locator(locators.PRODUCT_CARD)
         total = cards.count()
         assert 0 <= idx < total, f"Index {idx} out of range for {total} products"
         button = cards.nth(idx).locator(locators.ADD_TO_CART_BTN)
@@ -171,61 +207,45 @@ class ProductsKeywords(BaseKeywords):
 
     def verify_badge_count(self, expected_count: int):
         logger.info("Verifying cart badge equals %s", expected_count)
-        badge = self.page.locator(locators.CART_BADGE)
-        if expected_count <= 0:
-            actual_visible = badge.count() > 0 and badge.first.is_visible()
-            logger.info(
-                "Badge visibility check for expected=%s | visible=%s",
-                expected_count,
-                actual_visible,
-            )
-            if badge.count() > 0:
-                expect(badge).not_to_be_visible()
-            logger.info("Badge hidden/absent as expected for count %s", expected_count)
-            return
-
-        expect(badge).to_be_visible()
-        actual_text = badge.inner_text().strip()
-        if actual_text != str(expected_count):
-            logger.error(f"Badge count mismatch: expected {expected_count}, actual {actual_text}")
+        # One snapshot (badge + persisted cart ids), compared with the expected count and the cart model
+        state = self.cart_state(expected_count)
         logger.info(
-            "Badge text verification | expected=%s | actual=%s",
+            "Badge text verification | expected=%s | actual=%s | model=%s",
             expected_count,
-            actual_text,
+            state["badge"] or "(hidden)",
+            list(self.cart.ids),
         )
-        expect(badge).to_have_text(str(expected_count))
-        logger.info("Badge text matches expected count %s", expected_count)
+        self.verify_cart_model(state)
+        logger.info("Badge matches expected count %s and cart model", expected_count)
 
     def remove_one_item_and_verify_badge_cleared(self):
         logger.info("Removing one item and verifying badge is cleared")
-        remove_buttons = self.page.locator(locators.REMOVE_BTN)
-        assert remove_buttons.count() > 0, "No Remove buttons available to click"
-        remove_buttons.first.click()
+        in_cart = [row for row in self._read_cards() if "remove" in (row["button"] or "")]
+        assert in_cart, "No Remove buttons available to click"
+        self.locator(locators.REMOVE_BTN).first.click()
+        self.cart.remove(self.catalog.product(in_cart[0]["name"]).id)
         # Validate button toggled back to Add to cart after removal
-        expect(self.page.locator(locators.ADD_TO_CART_BTN).first).to_be_visible()
+        expect(self.locator(locators.ADD_TO_CART_BTN).first).to_be_visible()
 
-        badge = self.page.locator(locators.CART_BADGE)
-        if badge.count() > 0:
-            expect(badge).not_to_be_visible()
+        self.verify_cart_model(self.cart_state(len(self.cart)))
         logger.info("Badge cleared after removal")
 
+    def _read_cards(self) -> List[Dict[str, Optional[str]]]:
+        """All inventory cards in display order, read in a single DOM call."""
+        return self.read_rows(CARD_FIELDS, locators.PRODUCT_CARD)
+
+    @property
+    def catalog(self) -> Catalog:
+        """Session-cached product catalog, snapshotted from the inventory page on first use."""
+        return get_catalog(self.catalog_key, lambda: Catalog.from_rows(self._read_cards()))
+
     def _get_product_names(self):
-        items = self.page.locator(locators.PRODUCT_NAME)
-        expect(items.first).to_be_visible()
-        names = [t.strip() for t in items.all_text_contents()]
+        names = [card["name"] for card in self._read_cards()]
         logger.info("Collected product names", extra={"count": len(names)})
         return names
 
     def _get_product_prices(self):
-        prices = self.page.locator(locators.PRODUCT_PRICE)
-        expect(prices.first).to_be_visible()
-        values = []
-        for text in prices.all_text_contents():
-            cleaned = text.strip().replace("$", "")
-            try:
-                values.append(float(cleaned))
-            except ValueError:
-                raise AssertionError(f"Invalid price format: {text}")
+        values = [parse_price_cents(card["price"] or "") / 100 for card in self._read_cards()]
         logger.info("Collected product prices", extra={"count": len(values)})
         return values
 
@@ -239,13 +259,13 @@ class ProductsKeywords(BaseKeywords):
 
         option_value, label = option_map[order_normalized]
         logger.info("Selecting sort option: Name (%s)", label)
-        selects = self.page.locator(locators.SORT_SELECT)
+        selects = self.locator(locators.SORT_SELECT)
         assert selects.count() >= 1, "Sort select not found"
         sort_select = selects.first
         sort_select.scroll_into_view_if_needed()
         expect(sort_select).to_be_visible()
         sort_select.select_option(option_value)
-        active = self.page.locator(locators.SORT_ACTIVE_OPTION)
+        active = self.locator(locators.SORT_ACTIVE_OPTION)
         expect(active).to_be_visible()
         expect(active).to_contain_text(label)
         logger.info("Sort option Name (%s) selected", label)
@@ -255,7 +275,7 @@ class ProductsKeywords(BaseKeywords):
         assert order_normalized in {"asc", "desc"}, f"Unsupported sort order: {order}"
         logger.info("Verifying products are sorted by name (%s)", order_normalized)
         names = self._get_product_names()
-        expected = sorted(names, key=str.lower, reverse=(order_normalized == "desc"))
+        expected = self.catalog.sorted_names(order_normalized)
         logger.info(
             "Name sort verification | order=%s | actual=%s | expected=%s",
             order_normalized,
@@ -275,13 +295,13 @@ class ProductsKeywords(BaseKeywords):
 
         option_value, label = option_map[order_normalized]
         logger.info("Selecting sort option: Price (%s)", label)
-        selects = self.page.locator(locators.SORT_SELECT)
+        selects = self.locator(locators.SORT_SELECT)
         assert selects.count() >= 1, "Sort select not found"
         sort_select = selects.first
         sort_select.scroll_into_view_if_needed()
         expect(sort_select).to_be_visible()
         sort_select.select_option(option_value)
-        active = self.page.locator(locators.SORT_ACTIVE_OPTION)
+        active = self.locator(locators.SORT_ACTIVE_OPTION)
         expect(active).to_be_visible()
         expect(active).to_contain_text(label)
         logger.info("Sort option Price (%s) selected", label)
@@ -290,8 +310,8 @@ class ProductsKeywords(BaseKeywords):
         order_normalized = order.lower()
         assert order_normalized in {"low_high", "high_low"}, f"Unsupported price sort order: {order}"
         logger.info("Verifying products are sorted by price (%s)", order_normalized)
-        prices = self._get_product_prices()
-        expected = sorted(prices, reverse=(order_normalized == "high_low"))
+        prices = [parse_price_cents(card["price"] or "") for card in self._read_cards()]
+        expected = self.catalog.sorted_prices(order_normalized)
         logger.info(
             "Price sort verification | order=%s | actual=%s | expected=%s",
             order_normalized,
@@ -303,13 +323,13 @@ class ProductsKeywords(BaseKeywords):
 
     def verify_sort_option_label(self, expected_label: str):
         logger.info("Verifying sort dropdown displays: %s", expected_label)
-        active = self.page.locator(locators.SORT_ACTIVE_OPTION)
+        active = self.locator(locators.SORT_ACTIVE_OPTION)
         expect(active).to_be_visible()
         expect(active).to_contain_text(expected_label)
         logger.info("Sort dropdown label matches: %s", expected_label)
 
     def select_random_product_card(self):
-        cards = self.page.locator(locators.PRODUCT_CARD)
+        cards = self.locator(locators.PRODUCT_CARD)
         total = cards.count()
         assert total >= 1, "No product cards available to open"
         idx = random.randrange(total)
@@ -317,42 +337,28 @@ class ProductsKeywords(BaseKeywords):
         return idx
 
     def extract_card_info(self, idx: int):
-        card = self.page.locator(locators.PRODUCT_CARD).nth(idx)
-        name_el = card.locator(locators.PRODUCT_NAME)
-        desc_el = card.locator(locators.PRODUCT_DESC)
-        price_el = card.locator(locators.PRODUCT_PRICE)
-        name_text = name_el.inner_text().strip()
-        desc_text = desc_el.inner_text().strip()
-        price_text = price_el.inner_text().strip()
+        cards = self._read_cards()
+        assert 0 <= idx < len(cards), f"Index {idx} out of range for {len(cards)} products"
+        product = self.catalog.product(cards[idx]["name"])
         logger.info(
             "Card values | index=%s | name=%s | price=%s | desc=%s",
             idx + 1,
-            name_text,
-            price_text,
-            desc_text[:300].replace("\n", " "),
+            product.name,
+            product.price,
+            product.desc[:300].replace("\n", " "),
         )
-        return {
-            "index": idx,
-            "name": name_text,
-            "desc": desc_text,
-            "price": price_text,
-        }
+        return {"index": idx, "id": product.id, **product.as_dict()}
 
     def open_detail_from_card(self, idx: int):
-        card = self.page.locator(locators.PRODUCT_CARD).nth(idx)
+        card = self.locator(locators.PRODUCT_CARD).nth(idx)
         card.locator(locators.PRODUCT_NAME).click()
         logger.info("Opened detail page from card index=%s", idx + 1)
 
     def get_detail_info(self):
-        detail_name = self.page.locator(locators.PRODUCT_DETAIL_NAME).first
-        detail_desc = self.page.locator(locators.PRODUCT_DETAIL_DESC).first
-        detail_price = self.page.locator(locators.PRODUCT_DETAIL_PRICE).first
-        expect(detail_name).to_be_visible()
-        expect(detail_desc).to_be_visible()
-        expect(detail_price).to_be_visible()
-        name_text = detail_name.inner_text().strip()
-        desc_text = detail_desc.inner_text().strip()
-        price_text = detail_price.inner_text().strip()
+        detail = self.read_rows(DETAIL_FIELDS, locators.PRODUCT_DETAIL_CONTAINER)[0]
+        name_text = detail["name"] or ""
+        desc_text = detail["desc"] or ""
+        price_text = detail["price"] or ""
         logger.info(
             "Detail values | name=%s | price=%s | desc=%s",
             name_text,
@@ -377,17 +383,17 @@ class ProductsKeywords(BaseKeywords):
         logger.info("Detail page matches list card values")
 
     def return_to_inventory_from_detail(self):
-        back_btn = self.page.locator(locators.PRODUCT_DETAIL_BACK_BTN)
+        back_btn = self.locator(locators.PRODUCT_DETAIL_BACK_BTN)
         expect(back_btn).to_be_visible()
         back_btn.click()
-        expect(self.page.locator(locators.PRODUCTS_TITLE)).to_be_visible()
+        expect(self.locator(locators.PRODUCTS_TITLE)).to_be_visible()
         logger.info("Returned to inventory page after detail verification")
 
     def add_item_to_cart_by_index(self, idx: int, clear_cart: bool = True):
         logger.info("Adding product by index=%s", idx + 1)
         if clear_cart:
             self._clear_cart_and_return()
-        cards = self.page.locator(locators.PRODUCT_CARD)
+        cards = self.locator(locators.PRODUCT_CARD)
         total = cards.count()
         assert 0 <= idx < total, f"Index {idx} out of range for {total} products"
         card_info = self.extract_card_info(idx)
@@ -396,6 +402,7 @@ class ProductsKeywords(BaseKeywords):
         add_btn.click()
         # Validate button toggled to Remove after add
         expect(cards.nth(idx).locator(locators.REMOVE_BTN)).to_be_visible()
+        self.cart.add(card_info["id"])
         logger.info("Button toggled to Remove after adding | index=%s", idx + 1)
         logger.info(
             "Added product to cart | index=%s | name=%s | price=%s",
@@ -408,16 +415,17 @@ class ProductsKeywords(BaseKeywords):
         logger.info("Adding product to cart from detail page | index=%s", idx + 1)
         if clear_cart:
             self._clear_cart_and_return()
-        cards = self.page.locator(locators.PRODUCT_CARD)
+        cards = self.locator(locators.PRODUCT_CARD)
         total = cards.count()
         assert 0 <= idx < total, f"Index {idx} out of range for {total} products"
         card_info = self.extract_card_info(idx)
         self.open_detail_from_card(idx)
-        add_btn = self.page.locator(locators.ADD_TO_CART_BTN).first
+        add_btn = self.locator(locators.ADD_TO_CART_BTN).first
         expect(add_btn).to_be_visible()
         add_btn.click()
         # Validate button toggled to Remove after add on detail page
-        expect(self.page.locator(locators.REMOVE_BTN).first).to_be_visible()
+        expect(self.locator(locators.REMOVE_BTN).first).to_be_visible()
+        self.cart.add(card_info["id"])
         logger.info("Button toggled to Remove on detail after adding | index=%s", idx + 1)
         logger.info(
             "Added from detail | name=%s | price=%s | desc=%s",
@@ -428,31 +436,38 @@ class ProductsKeywords(BaseKeywords):
 
     def remove_item_from_detail_and_verify_badge_cleared(self):
         logger.info("Removing item from detail page and verifying badge cleared")
-        remove_btn = self.page.locator(locators.REMOVE_BTN).first
+        remove_btn = self.locator(locators.REMOVE_BTN).first
         expect(remove_btn).to_be_visible()
         remove_btn.click()
         # Validate button toggled back to Add to cart after removal on detail page
-        expect(self.page.locator(locators.ADD_TO_CART_BTN).first).to_be_visible()
-        badge = self.page.locator(locators.CART_BADGE)
-        if badge.count() > 0:
-            expect(badge).not_to_be_visible()
+        expect(self.locator(locators.ADD_TO_CART_BTN).first).to_be_visible()
+        self._remove_detail_product_from_model()
+        self.verify_cart_model(self.cart_state(len(self.cart)))
         logger.info("Badge cleared after removal on detail page")
 
+    def _remove_detail_product_from_model(self):
+        # Detail URLs carry the product id (inventory-item.html?id=4), so no DOM read is needed
+        ids = parse_qs(urlsplit(self.page.url or "").query).get("id")
+        if ids:
+            self.cart.remove(int(ids[0]))
+        else:
+            self.cart.remove(self.catalog.product(self.get_detail_info()["name"]).id)
+
     def open_cart(self):
         logger.info("Opening cart from inventory")
-        self.page.locator(locators.CART_LINK).click()
+        self.locator(locators.CART_LINK).click()
         expect(self.page).to_have_url(re.compile(r"cart\.html/?"))
-        continue_btn = self.page.locator(locators.CART_CONTINUE_BTN)
+        continue_btn = self.locator(locators.CART_CONTINUE_BTN)
         expect(continue_btn).to_be_visible()
         logger.info("Cart page opened; continue button visible")
 
     def return_to_inventory_from_cart(self):
         logger.info("Returning to inventory from cart")
-        continue_btn = self.page.locator(locators.CART_CONTINUE_BTN)
+        continue_btn = self.locator(locators.CART_CONTINUE_BTN)
         expect(continue_btn).to_be_visible()
         continue_btn.click()
         expect(self.page).to_have_url(re.compile(r"inventory\.html/?"))
-        expect(self.page.locator(locators.PRODUCTS_TITLE)).to_be_visible()
+        expect(self.locator(locators.PRODUCTS_TITLE)).to_be_visible()
         logger.info("Returned to inventory page from cart")
 
 
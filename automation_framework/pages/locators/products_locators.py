@@ -36,6 +36,7 @@ CART_REMOVE_BTN: Final[str] = "//div[contains(@class,'cart_item')]//button[conta
 CART_CONTINUE_BTN: Final[str] = "//button[@data-test='continue-shopping']"
 
 # Product detail page
+PRODUCT_DETAIL_CONTAINER: Final[str] = "//div[@class='inventory_details']"
 PRODUCT_DETAIL_NAME: Final[str] = "//div[@data-test='inventory-item-name']"
 PRODUCT_DETAIL_DESC: Final[str] = "//div[@data-test='inventory-item-desc']"
 PRODUCT_DETAIL_PRICE: Final[str] = "//div[@data-test='inventory-item-price']"
@@ -68,6 +69,7 @@ __all__ = [
     'CART_ITEM_PRICE',
     'CART_REMOVE_BTN',
     'CART_CONTINUE_BTN',
+    'PRODUCT_DETAIL_CONTAINER',
     'PRODUCT_DETAIL_NAME',
     'PRODUCT_DETAIL_DESC',
     'PRODUCT_DETAIL_PRICE',
@@ -0,0 +1,278 @@
+import logging
+import re
+from importlib import import_module
+from types import ModuleType
+from typing import Dict, Iterable, List, Optional
+
+from playwright.sync_api import Locator, Page
+
+from automation_framework.config import global_config as gc
+
+logger = logging.getLogger(__name__)
+
+
+LOCATOR_MODULES = (
+    "automation_framework.pages.locators.login_locators",
+    "automation_framework.pages.locators.products_locators",
+    "automation_framework.pages.locators.burger_menu_locators",
+    "automation_framework.pages.locators.cart_and_checkout_locators",
+)
+
+_STEP_RE = re.compile(r"^(?P<tag>[a-zA-Z][\w-]*|\*)(?:\[(?P<predicate>.+)\])?$")
+_ATTR_EQ_RE = re.compile(r"""^@(?P<attr>[\w-]+)\s*=\s*(?P<q>['"])(?P<value>[^'"]*)(?P=q)$""")
+_ATTR_CONTAINS_RE = re.compile(
+    r"""^contains\(\s*@(?P<attr>[\w-]+)\s*,\s*(?P<q>['"])(?P<value>[^'"]*)(?P=q)\s*\)$"""
+)
+_CSS_IDENT_RE = re.compile(r"^-?[_a-zA-Z][\w-]*$")
+
+
+class LocatorSpecError(ValueError):
+    """Raised when a locator constant fails validation."""
+
+
+def is_xpath(selector: str) -> bool:
+    return selector.startswith(("/", "(", "xpath="))
+
+
+def _split_steps(xpath: str) -> Optional[List[str]]:
+    """Split `//a[..]//b[..]` into steps; None for anything but descendant-only paths."""
+    steps: List[str] = []
+    depth = 0
+    quote = ""
+    current = ""
+    i = 0
+    while i < len(xpath):
+        ch = xpath[i]
+        if quote:
+            if ch == quote:
+                quote = ""
+            current += ch
+        elif ch in "'\"":
+            quote = ch
+            current += ch
+        elif ch == "[":
+            depth += 1
+            current += ch
+        elif ch == "]":
+            depth -= 1
+            current += ch
+        elif depth == 0 and xpath.startswith("//", i):
+            if current:
+                steps.append(current)
+            current = ""
+            i += 2
+            continue
+        elif depth == 0 and ch == "/":
+            return None  # child axis or other path syntax: keep XPath
+        else:
+            current += ch
+        i += 1
+    if current:
+        steps.append(current)
+    return steps
+
+
+def _split_and(predicate: str) -> List[str]:
+    """Split a predicate on top-level `and` (ignoring quoted text and function arguments)."""
+    parts: List[str] = []
+    quote = ""
+    depth = 0
+    last = 0
+    for idx, ch in enumerate(predicate):
+        if quote:
+            quote = "" if ch == quote else quote
+        elif ch in "'\"":
+            quote = ch
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif depth == 0 and ch.isspace():
+            match = re.match(r"\s+and\s+", predicate[idx:])
+            if match and idx >= last:
+                parts.append(predicate[last:idx].strip())
+                last = idx + match.end()
+    parts.append(predicate[last:].strip())
+    return parts
+
+
+def _css_string(value: str) -> str:
+    return "'" + value.replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+
+def xpath_to_css(xpath: str) -> Optional[str]:
+    """
+    Translate the XPath subset used by the locator modules into an equivalent CSS selector.
+
+    Supported: descendant steps (`//tag`), `@attr='v'` (exact match, so `[attr='v']`),
+    `contains(@attr,'v')` (`[attr*='v']`) and `and`. Anything matching on text() or using
+    other axes returns None and stays XPath.
+    """
+    if xpath.startswith("xpath="):
+        xpath = xpath[len("xpath="):]
+    if not xpath.startswith("//"):
+        return None
+    steps = _split_steps(xpath)
+    if not steps:
+        return None
+
+    css_steps: List[str] = []
+    for step in steps:
+        match = _STEP_RE.match(step)
+        if not match:
+            return None
+        tag = match.group("tag")
+        css = "" if tag == "*" else tag
+        predicate = match.group("predicate")
+        if predicate:
+            for clause in _split_and(predicate):
+                eq = _ATTR_EQ_RE.match(clause)
+                contains = _ATTR_CONTAINS_RE.match(clause)
+                if eq:
+                    attr, value = eq.group("attr"), eq.group("value")
+                    if attr == "id" and _CSS_IDENT_RE.match(value):
+                        css += f"#{value}"
+                    else:
+                        css += f"[{attr}={_css_string(value)}]"
+                elif contains:
+                    css += f"[{contains.group('attr')}*={_css_string(contains.group('value'))}]"
+                else:
+                    return None
+        css_steps.append(css or "*")
+    return " ".join(css_steps)
+
+
+def _validate(name: str, selector: str) -> None:
+    if not isinstance(selector, str) or not selector.strip():
+        raise LocatorSpecError(f"{name}: selector must be a non-empty string")
+    quote = ""
+    brackets = parens = 0
+    for ch in selector:
+        if quote:
+            quote = "" if ch == quote else quote
+            continue
+        if ch in "'\"":
+            quote = ch
+        elif ch == "[":
+            brackets += 1
+        elif ch == "]":
+            brackets -= 1
+        elif ch == "(":
+            parens += 1
+        elif ch == ")":
+            parens -= 1
+        if brackets < 0 or parens < 0:
+            break
+    if quote or brackets or parens:
+        raise LocatorSpecError(f"{name}: unbalanced quotes/brackets in selector {selector!r}")
+
+
+class LocatorSpec:
+    """A registered locator constant with its original and compiled selector forms."""
+
+    __slots__ = ("names", "xpath", "css")
+
+    def __init__(self, name: str, selector: str):
+        self.names: List[str] = [name]
+        if is_xpath(selector):
+            self.xpath: Optional[str] = selector
+            self.css: Optional[str] = xpath_to_css(selector)
+        else:
+            self.xpath = None
+            self.css = selector
+
+    @property
+    def raw(self) -> str:
+        return self.xpath or self.css  # type: ignore[return-value]
+
+    def preferred(self, engine: str = "css") -> str:
+        if engine == "css" and self.css:
+            return self.css
+        return self.raw
+
+    def __repr__(self) -> str:
+        return f"LocatorSpec({', '.join(self.names)}, xpath={self.xpath!r}, css={self.css!r})"
+
+
+class LocatorRegistry:
+    """
+    Loads every `*_locators` module once, validates the constants and compiles CSS forms.
+    Lookups are keyed by the raw selector string, so keywords keep passing module constants.
+    """
+
+    def __init__(self, modules: Iterable[str] = LOCATOR_MODULES, engine: Optional[str] = None):
+        self.engine = (engine or gc.LOCATOR_ENGINE or "css").lower()
+        self._specs: Dict[str, LocatorSpec] = {}
+        for module_name in modules:
+            self._register_module(import_module(module_name))
+        translated = sum(1 for spec in self._specs.values() if spec.xpath and spec.css)
+        logger.debug(
+            "Locator registry loaded",
+            extra={"selectors": len(self._specs), "css_translated": translated, "engine": self.engine},
+        )
+
+    def _register_module(self, module: ModuleType) -> None:
+        short = module.__name__.rsplit(".", 1)[-1]
+        for name in getattr(module, "__all__", None) or dir(module):
+            if not name.isupper():
+                continue
+            selector = getattr(module, name)
+            qualified = f"{short}.{name}"
+            _validate(qualified, selector)
+            spec = self._specs.get(selector)
+            if spec is None:
+                self._specs[selector] = LocatorSpec(qualified, selector)
+            elif qualified not in spec.names:
+                spec.names.append(qualified)
+
+    def __iter__(self):
+        return iter(self._specs.values())
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+    def spec(self, selector: str) -> Optional[LocatorSpec]:
+        return self._specs.get(selector)
+
+    def compile(self, selector: str) -> str:
+        """Return the selector the configured engine should use; unknown selectors pass through."""
+        spec = self._specs.get(selector)
+        return spec.preferred(self.engine) if spec else selector
+
+    def locator(self, page: Page, selector: str) -> Locator:
+        """Per-page cached `Locator` for a selector (Locators are lazy, so reuse is safe)."""
+        cache = getattr(page, "_locator_cache", None)
+        if cache is None:
+            cache = {}
+            setattr(page, "_locator_cache", cache)
+        locator = cache.get(selector)
+        if locator is None:
+            locator = page.locator(self.compile(selector))
+            cache[selector] = locator
+        return locator
+
+
+_REGISTRY: Optional[LocatorRegistry] = None
+
+
+def get_registry() -> LocatorRegistry:
+    global _REGISTRY
+    if _REGISTRY is None:
+        _REGISTRY = LocatorRegistry()
+    return _REGISTRY
+
+
+def get_locator(page: Page, selector: str) -> Locator:
+    return get_registry().locator(page, selector)
+
+
+__all__ = [
+    "LOCATOR_MODULES",
+    "LocatorRegistry",
+    "LocatorSpec",
+    "LocatorSpecError",
+    "get_locator",
+    "get_registry",
+    "is_xpath",
+    "xpath_to_css",
+]
@@ -0,0 +1,23 @@
+from automation_framework.pages.models.cart import CartModel
+from automation_framework.pages.models.catalog import (
+    Catalog,
+    OrderSummary,
+    Product,
+    cached_catalog,
+    format_price,
+    get_catalog,
+    order_summary,
+    parse_price_cents,
+)
+
+__all__ = [
+    "CartModel",
+    "Catalog",
+    "OrderSummary",
+    "Product",
+    "cached_catalog",
+    "format_price",
+    "get_catalog",
+    "order_summary",
+    "parse_price_cents",
+]
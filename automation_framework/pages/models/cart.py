@@ -0,0 +1,80 @@
+import logging
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from automation_framework.pages.models.catalog import Catalog
+
+logger = logging.getLogger(__name__)
+
+
+class CartModel:
+    """
+    Expected cart contents (product ids, in add order) for one test's page.
+
+    Keywords that change the cart update it, so assertions compare a single DOM snapshot
+    against the model instead of scraping the cart again. `touched` records whether any
+    keyword changed the cart during the test.
+    """
+
+    __slots__ = ("_ids", "touched")
+
+    def __init__(self, ids: Iterable[int] = ()):
+        self._ids: List[int] = []
+        for product_id in ids:
+            if product_id not in self._ids:
+                self._ids.append(int(product_id))
+        self.touched = False
+
+    @property
+    def ids(self) -> tuple:
+        return tuple(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, product_id: int) -> bool:
+        return product_id in self._ids
+
+    def add(self, product_id: int) -> None:
+        if product_id not in self._ids:
+            self._ids.append(product_id)
+            self.touched = True
+
+    def remove(self, product_id: int) -> None:
+        if product_id in self._ids:
+            self._ids.remove(product_id)
+            self.touched = True
+
+    def remove_at(self, index: int) -> Optional[int]:
+        if 0 <= index < len(self._ids):
+            self.touched = True
+            return self._ids.pop(index)
+        return None
+
+    def clear(self) -> None:
+        if self._ids:
+            self._ids.clear()
+            self.touched = True
+
+    def replace(self, ids: Iterable[int]) -> None:
+        """Adopt cart contents set outside the keywords (seeded storage, restored state)."""
+        self._ids = [int(product_id) for product_id in ids]
+        self.touched = True
+
+    def items(self, catalog: Catalog) -> List[Dict[str, str]]:
+        """Expected cart rows (name/desc/price) in display order."""
+        return [catalog.by_id[product_id].as_dict() for product_id in self._ids]
+
+    def mismatch(self, ids: Sequence[int]) -> Optional[str]:
+        """None when the page's cart ids match the model, else a description of the difference."""
+        actual = [int(product_id) for product_id in ids]
+        if actual == self._ids:
+            return None
+        missing = [product_id for product_id in self._ids if product_id not in actual]
+        unexpected = [product_id for product_id in actual if product_id not in self._ids]
+        return f"cart model {self._ids} != page {actual} (missing={missing}, unexpected={unexpected})"
+
+    def __repr__(self) -> str:
+        return f"CartModel(ids={self._ids}, touched={self.touched})"
+
+
+__all__ = ["CartModel"]
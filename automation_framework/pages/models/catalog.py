@@ -0,0 +1,169 @@
+import logging
+import re
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+
+TAX_RATE = 0.08
+_ITEM_ID_RE = re.compile(r"item_(\d+)_")
+_PRICE_RE = re.compile(r"^\$?\s*(\d+)(?:\.(\d{1,2}))?$")
+
+
+def parse_price_cents(text: str) -> int:
+    """'$29.99' -> 2999. Raises AssertionError for anything that is not a plain price."""
+    match = _PRICE_RE.match((text or "").strip())
+    if not match:
+        raise AssertionError(f"Invalid price format: {text}")
+    dollars, cents = match.group(1), (match.group(2) or "0").ljust(2, "0")
+    return int(dollars) * 100 + int(cents)
+
+
+def format_price(cents: int) -> str:
+    return f"${cents // 100}.{cents % 100:02d}"
+
+
+def _to_fixed(value: float) -> str:
+    # Number.prototype.toFixed(2): rounds the exact binary value, ties away from zero
+    return str(Decimal(value).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP))
+
+
+def _js_number(value: float) -> str:
+    # String(number) for the values the app prints: shortest round-trip form, no trailing ".0"
+    text = repr(value)
+    return text[:-2] if text.endswith(".0") else text
+
+
+class OrderSummary(NamedTuple):
+    item_total: str
+    tax: str
+    total: str
+
+
+def order_summary(prices_cents: Iterable[int]) -> OrderSummary:
+    """
+    Expected overview labels for the given item prices.
+
+    The app sums prices as floats and prints the raw sum, then uses toFixed(2) for tax and
+    total, so the same float arithmetic is reproduced here rather than exact decimal math.
+    """
+    item_total = 0.0
+    for cents in prices_cents:
+        item_total += cents / 100
+    tax = _to_fixed(item_total * TAX_RATE)
+    total = _to_fixed(item_total + float(tax))
+    return OrderSummary(
+        item_total=f"Item total: ${_js_number(item_total)}",
+        tax=f"Tax: ${tax}",
+        total=f"Total: ${total}",
+    )
+
+
+class Product:
+    """One inventory product as rendered on the inventory page."""
+
+    __slots__ = ("id", "name", "desc", "price_cents", "image")
+
+    def __init__(self, id: int, name: str, desc: str, price_cents: int, image: str = ""):
+        self.id = id
+        self.name = name
+        self.desc = desc
+        self.price_cents = price_cents
+        self.image = image
+
+    @property
+    def price(self) -> str:
+        return format_price(self.price_cents)
+
+    def as_dict(self) -> Dict[str, str]:
+        """Card/detail/cart representation used by the keyword verifications."""
+        return {"name": self.name, "desc": self.desc, "price": self.price}
+
+    def __repr__(self) -> str:
+        return f"Product({self.id}, {self.name!r}, {self.price})"
+
+
+class Catalog:
+    """
+    Immutable set of products built from a single inventory snapshot.
+    Expected sort orders, detail contents and order totals are derived from it in Python.
+    """
+
+    def __init__(self, products: Iterable[Product]):
+        self._products: List[Product] = list(products)
+        self.by_id: Dict[int, Product] = {product.id: product for product in self._products}
+        self.by_name: Dict[str, Product] = {product.name: product for product in self._products}
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Dict[str, Optional[str]]]) -> "Catalog":
+        """Build from inventory card rows with keys link_id, name, desc, price, image."""
+        products = []
+        for idx, row in enumerate(rows):
+            match = _ITEM_ID_RE.search(row.get("link_id") or "")
+            products.append(
+                Product(
+                    id=int(match.group(1)) if match else idx,
+                    name=(row.get("name") or "").strip(),
+                    desc=(row.get("desc") or "").strip(),
+                    price_cents=parse_price_cents(row.get("price") or ""),
+                    image=row.get("image") or "",
+                )
+            )
+        return cls(products)
+
+    def __len__(self) -> int:
+        return len(self._products)
+
+    def __iter__(self):
+        return iter(self._products)
+
+    def product(self, name: str) -> Product:
+        try:
+            return self.by_name[name]
+        except KeyError:
+            raise AssertionError(f"Product not in catalog: {name!r}") from None
+
+    def sorted_names(self, order: str) -> List[str]:
+        names = [product.name for product in self._products]
+        return sorted(names, key=str.lower, reverse=(order == "desc"))
+
+    def sorted_prices(self, order: str) -> List[int]:
+        prices = [product.price_cents for product in self._products]
+        return sorted(prices, reverse=(order == "high_low"))
+
+    def detail(self, name: str) -> Dict[str, str]:
+        return self.product(name).as_dict()
+
+    def summary(self, names: Iterable[str]) -> OrderSummary:
+        return order_summary(self.product(name).price_cents for name in names)
+
+
+_CATALOGS: Dict[str, Catalog] = {}
+
+
+def get_catalog(key: str, loader: Callable[[], Catalog]) -> Catalog:
+    """Session (process) cache of catalogs keyed by app origin and user; `loader` runs once per key."""
+    catalog = _CATALOGS.get(key)
+    if catalog is None:
+        catalog = loader()
+        _CATALOGS[key] = catalog
+        logger.info("Product catalog cached", extra={"catalog": key, "products": len(catalog)})
+    return catalog
+
+
+def cached_catalog(key: str) -> Optional[Catalog]:
+    """The cached catalog for `key`, without loading one."""
+    return _CATALOGS.get(key)
+
+
+__all__ = [
+    "Catalog",
+    "OrderSummary",
+    "Product",
+    "cached_catalog",
+    "format_price",
+    "get_catalog",
+    "order_summary",
+    "parse_price_cents",
+]
@@ -0,0 +1,124 @@
+import json
+import logging
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import pytest
+
+from automation_framework.helpers.api import ApiClient, assert_batch
+
+logger = logging.getLogger(__name__)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Tiny JSON backend: /items/<n> echoes n, /flaky fails with 503 on every other call, /missing is 404."""
+
+    protocol_version = "HTTP/1.1"  # keep-alive, so the client's pooled connections are reused
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == "/flaky":
+            with self.server.lock:
+                self.server.flaky_calls += 1
+                failing = self.server.flaky_calls % 2 == 1
+            self._reply(503 if failing else 200, {"call": self.server.flaky_calls})
+        elif path.startswith("/items/"):
+            self._reply(200, {"id": int(path.rsplit("/", 1)[1])})
+        else:
+            self._reply(404, {"error": "not found"})
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)) or 0)
+        self._reply(201, {"received": json.loads(body or b"null")})
+
+    def _reply(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, fmt, *args):
+        logger.debug("local server: " + fmt, *args)
+
+
+@pytest.fixture(scope="module")
+def local_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.flaky_calls = 0
+    thread = threading.Thread(target=server.serve_forever, name="local-api", daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture()
+def local_api(local_server):
+    client = ApiClient(local_server, retries=2, backoff=0.01, timeout=5, attach=False)
+    yield client
+    client.close()
+
+
+def _closed_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.mark.api
+class TestApiClient:
+
+    def test_relative_paths_and_timing(self, local_api):
+        """Critical: relative paths join the base URL; responses carry duration and attempts."""
+        response = local_api.get("/items/7", params={"q": 1})
+        assert response.status_code == 200
+        assert response.json() == {"id": 7}
+        assert response.url.endswith("/items/7?q=1")
+        assert response.attempts == 1
+        assert response.duration_ms >= 0
+
+    def test_idempotent_request_retried_on_503(self, local_api):
+        """Major: a GET answered with 503 is retried and the retry's response is returned."""
+        response = local_api.get("flaky")
+        assert response.status_code == 200
+        assert response.attempts == 2
+
+    def test_post_is_not_retried(self, local_api):
+        """Major: non-idempotent requests are sent once."""
+        response = local_api.post("echo", json={"a": 1})
+        assert response.status_code == 201
+        assert response.attempts == 1
+        assert response.json() == {"received": {"a": 1}}
+
+    def test_batch_results_in_order_within_budget(self, local_api):
+        """Critical: a concurrent batch returns results in input order and passes assert_batch."""
+        results = local_api.request_batch([("GET", f"items/{index}") for index in range(20)], max_workers=4)
+        assert [result.response.json()["id"] for result in results] == list(range(20))
+        summary = assert_batch(results, p95_ms=5000, name="local_items")
+        assert summary["requests"] == 20
+        assert summary["failed"] == 0
+
+    def test_batch_collects_failures_per_item(self, local_api):
+        """Major: failing items come back with status or error; assert_batch reports them."""
+        dead = f"http://127.0.0.1:{_closed_port()}/items/1"
+        results = local_api.request_batch(
+            [
+                ("GET", "items/1"),
+                {"method": "GET", "url": "missing"},
+                ("GET", dead, {"timeout": 1}),
+                ("GET", "items/2", {"no_such_kwarg": True}),
+            ]
+        )
+        assert [result.ok for result in results] == [True, False, False, False]
+        assert results[1].response.status_code == 404
+        assert results[2].response is None and results[2].error is not None
+        assert isinstance(results[3].error, TypeError)
+        with pytest.raises(AssertionError, match="3 of 4 requests failed"):
+            assert_batch(results, name="local_failures")
+        assert assert_batch(results, expect_ok=False, name="local_failures")["failed"] == 3
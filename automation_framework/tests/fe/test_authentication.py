@@ -1,31 +1,76 @@
 import logging
 import re
+import allure
 import pytest
+from allure_commons.types import AttachmentType
 from playwright.sync_api import expect
 
 from automation_framework.config import global_config as gc
 from automation_framework.pages import LoginPage
 from automation_framework.pages.keywords.burger_menu_keywords import BurgerMenuKeywords, ensure_logged_out
-from automation_framework.pages.keywords.login_keywords import load_login_cases
+from automation_framework.pages.keywords.login_keywords import (
+    LOGIN_ARGNAMES,
+    LOGIN_SCHEMA,
+    login_case_param,
+)
 from automation_framework.pages.locators import login_locators
+from automation_framework.utils.flags import as_bool
+from automation_framework.utils.login_batch import LoginBatch, LoginCase, batch_enabled
 
 logger = logging.getLogger(__name__)
 
 DATA_FILE = gc.DATA_DIR / "login_test_data.csv"
-_LOGIN_CASES = load_login_cases(DATA_FILE)
 
 
-@pytest.mark.parametrize("username,password,validation", _LOGIN_CASES)
-def test_authentication_login(page, creds, username, password, validation):
-    """Major: Authentication login test."""
+def _resolve_credentials(creds, username, password, validation):
     is_valid = validation.get("isValid") if isinstance(validation, dict) else None
     if is_valid is False:
-        resolved_username = username
-        resolved_password = password
-    else:
-        resolved_username = username or creds["username"]
-        resolved_password = password or creds["password"]
+        return username, password
+    return username or creds["username"], password or creds["password"]
+
+
+@pytest.fixture(scope="module")
+def login_batch(request, creds, browser_name):
+    """
+    LOGIN_BATCH=true: start every selected login row for this browser concurrently (one
+    browser, bounded contexts) as soon as the first row runs; each test then waits only for
+    its own row. Off under xdist (see batch_enabled), where session.items is every item, not
+    this worker's.
+    """
+    cases = []
+    for item in request.session.items:
+        callspec = getattr(item, "callspec", None)
+        if getattr(item, "originalname", "") != "test_authentication_login" or callspec is None:
+            continue
+        if callspec.params.get("browser_name", browser_name) != browser_name:
+            continue
+        validation = callspec.params["validation"]
+        username, password = _resolve_credentials(
+            creds, callspec.params["username"], callspec.params["password"], validation
+        )
+        cases.append(LoginCase(callspec.id, username, password, validation))
+    batch = LoginBatch(creds["base_url"], cases, browser_name=browser_name, headless=as_bool(gc.HEADLESS))
+    yield batch.start()
+    batch.join(timeout=60)
+
+
+@pytest.mark.data_provider(DATA_FILE, LOGIN_ARGNAMES, schema=LOGIN_SCHEMA, builder=login_case_param)
+def test_authentication_login(request, creds, browser_name, username, password, validation):
+    """Major: Authentication login test."""
+    resolved_username, resolved_password = _resolve_credentials(creds, username, password, validation)
+
+    if batch_enabled(request.config):
+        result = request.getfixturevalue("login_batch").result(request.node.callspec.id, timeout=300)
+        logger.info(
+            "Batched authentication result",
+            extra={"case": request.node.callspec.id, "passed": result.passed, "duration": result.duration},
+        )
+        if result.screenshot:
+            allure.attach(result.screenshot, name="login_failure", attachment_type=AttachmentType.PNG)
+        result.raise_for_failure()
+        return
 
+    page = request.getfixturevalue("page")
     logger.info(
         "Executing authentication test",
         extra={
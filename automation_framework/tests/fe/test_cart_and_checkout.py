@@ -24,6 +24,28 @@ NUMBERS_LAST_NAME = "Doe456"
 NUMBERS_ZIP_CODE = "12345"
 
 
+def checkout_info_with_first_product(page):
+    """Checkpoint prefix: first inventory product in the cart, on the checkout information step."""
+    products = ProductsKeywords(page)
+    cart = CartKeywords(page)
+    products.add_item_to_cart_by_index(0, clear_cart=False)
+    cart.navigate_to_cart()
+    cart.click_checkout()
+    return {"expected_items": cart.get_cart_items()}
+
+
+def overview_with_first_product(page):
+    """Checkpoint prefix: first inventory product in the cart, default info filled, on the overview."""
+    products = ProductsKeywords(page)
+    cart = CartKeywords(page)
+    products.add_item_to_cart_by_index(0, clear_cart=False)
+    cart.navigate_to_cart()
+    cart.click_checkout()
+    cart.fill_checkout_info(DEFAULT_FIRST_NAME, DEFAULT_LAST_NAME, DEFAULT_ZIP_CODE)
+    cart.proceed_to_overview()
+    return {"expected_items": cart.get_cart_items()}
+
+
 class TestCart:
     @pytest.fixture
     def cart(self, logged_in_page):
@@ -33,11 +55,30 @@ class TestCart:
     def products(self, logged_in_page):
         return ProductsKeywords(logged_in_page)
 
-    def test_invalid_checkout_info_empty_fields(self, products, cart):
+    @pytest.fixture
+    def overview_fork(self, checkpoint_fork):
+        """CartKeywords on a context forked from the `overview_with_first_product` checkpoint."""
+        page, data = checkpoint_fork(
+            "overview_with_first_product",
+            overview_with_first_product,
+            depends=(ProductsKeywords, CartKeywords),
+        )
+        return CartKeywords(page), data["expected_items"]
+
+    @pytest.fixture
+    def checkout_info_fork(self, checkpoint_fork):
+        """CartKeywords on a context forked from the `checkout_info_with_first_product` checkpoint."""
+        page, data = checkpoint_fork(
+            "checkout_info_with_first_product",
+            checkout_info_with_first_product,
+            depends=(ProductsKeywords, CartKeywords),
+        )
+        return CartKeywords(page), data["expected_items"]
+
+    @pytest.mark.parametrize("seeded_cart", [{"products": [4], "step": "checkout-step-one"}], indirect=True)
+    def test_invalid_checkout_info_empty_fields(self, seeded_cart):
         """Critical: Invalid empty fields."""
-        products.add_random_items(count=1)
-        cart.navigate_to_cart()
-        cart.click_checkout()
+        cart = seeded_cart
         cart.fill_checkout_info("", "a", "1")
         cart.page.locator(locators.CHECKOUT_CONTINUE_BUTTON).click()
         expect(cart.page.locator(locators.CHECKOUT_ERROR_MESSAGE)).to_be_visible()
@@ -59,11 +100,10 @@ class TestCart:
         cart.validate_empty_cart()
         cart.click_checkout()
 
-    def test_logout_during_checkout_flow(self, products, cart):
+    def test_logout_during_checkout_flow(self, checkout_info_fork):
         """Critical: Logout during checkout flow."""
-        products.add_random_items(count=1)
-        cart.navigate_to_cart()
-        cart.click_checkout()
+        # Forked on checkout-step-one; form input is page state, so it is filled here
+        cart, _ = checkout_info_fork
         cart.fill_checkout_info(DEFAULT_FIRST_NAME, DEFAULT_LAST_NAME, DEFAULT_ZIP_CODE)
         burger = BurgerMenuKeywords(cart.page)
         burger.open_menu()
@@ -75,7 +115,7 @@ class TestCart:
         page.goto(checkout_url, wait_until="networkidle")
         expect(page.locator(login_locators.USERNAME_INPUT)).to_be_visible()
 
-    def test_add_single_product_and_complete_checkout(self, products, cart):
+    def test_add_single_product_and_complete_checkout(self, products, cart, identity):
         """Major: Add single product and complete checkout."""
         # Ensure cart is empty before starting
         products.verify_badge_count(expected_count=0)
@@ -85,7 +125,7 @@ class TestCart:
         expected_items = cart.get_cart_items()
         cart.validate_cart_items(expected_items)
         cart.click_checkout()
-        cart.fill_checkout_info(DEFAULT_FIRST_NAME, DEFAULT_LAST_NAME, DEFAULT_ZIP_CODE)
+        cart.fill_checkout_info(**identity.checkout_info())
         cart.proceed_to_overview()
         cart.verify_overview(expected_items, PAYMENT_INFO, SHIPPING_INFO)
         cart.finish_checkout()
@@ -205,15 +245,15 @@ class TestCart:
         products.add_random_items(count=3)
         products.verify_badge_count(expected_count=3)
         cart.navigate_to_cart()
-        cart.remove_all_items_from_cart()
+        cart.remove_all_items_from_cart(verify_each=True)
         products.verify_badge_count(expected_count=0)
         cart.validate_empty_cart()
 
-    def test_verify_cart_resets_after_checkout(self, products, cart):
+    @pytest.mark.parametrize("seeded_cart", [{"products": [4], "step": "cart"}], indirect=True)
+    def test_verify_cart_resets_after_checkout(self, products, seeded_cart):
         """Major: Verify cart resets after successful checkout."""
-        products.add_random_items(count=1)
+        cart = seeded_cart
         products.verify_badge_count(expected_count=1)
-        cart.navigate_to_cart()
         cart.click_checkout()
         cart.fill_checkout_info(DEFAULT_FIRST_NAME, DEFAULT_LAST_NAME, DEFAULT_ZIP_CODE)
         cart.proceed_to_overview()
@@ -223,6 +263,28 @@ class TestCart:
         cart.validate_empty_cart()
         products.verify_badge_count(expected_count=0)
 
+    def test_cart_seeded_over_browser_api(self, browser_api):
+        """Major: Login and cart set up over the browser context's API are visible to the UI."""
+        browser_api.expect_status("inventory.html")
+        browser_api.login()
+        # Expected rows come from this user's inventory, not from the cart page under test
+        products = ProductsKeywords(browser_api.open("inventory.html"))
+        products.assert_inventory_loaded()
+        expected_items = [products.catalog.by_id[product_id].as_dict() for product_id in (4, 0)]
+
+        browser_api.seed_cart([4, 0])
+        cart = CartKeywords(browser_api.open("cart.html"))
+        expect(cart.locator(locators.CART_TITLE)).to_be_visible()
+        assert cart.cart.ids == (4, 0), f"Expected seeded ids (4, 0), found {cart.cart.ids}"
+        cart.validate_cart_items(expected_items)
+
+        browser_api.reset()
+        page = browser_api.open("cart.html")
+        expect(page.locator(login_locators.USERNAME_INPUT).first).to_be_visible()
+        expect(page.locator(login_locators.PASSWORD_INPUT).first).to_be_visible()
+        state = CartKeywords(page).cart_state()
+        assert state["ids"] == [] and state["count"] == 0, f"Cart not emptied by reset: {state}"
+
     def test_validate_cart_empty_state(self, products, cart):
         """Minor: Validate empty cart."""
         products.add_random_items(count=1)
@@ -230,21 +292,16 @@ class TestCart:
         cart.remove_item_from_cart(index=0)
         cart.validate_empty_cart()
 
-    def test_cancel_from_checkout_information(self, products, cart):
+    @pytest.mark.parametrize("seeded_cart", [{"products": [0], "step": "checkout-step-one"}], indirect=True)
+    def test_cancel_from_checkout_information(self, seeded_cart):
         """Minor: Cancel from checkout info."""
-        products.add_random_items(count=1)
-        cart.navigate_to_cart()
-        cart.click_checkout()
-        cart.cancel_checkout()
+        seeded_cart.cancel_checkout()
 
-    def test_continue_shopping_from_overview_and_complete_checkout(self, products, cart):
+    def test_continue_shopping_from_overview_and_complete_checkout(self, overview_fork):
         """Minor: Continue shopping from overview and complete checkout."""
-        # Add specific product: index 0
-        products.add_item_to_cart_by_index(0)
-        cart.navigate_to_cart()
-        cart.click_checkout()
-        cart.fill_checkout_info(DEFAULT_FIRST_NAME, DEFAULT_LAST_NAME, DEFAULT_ZIP_CODE)
-        cart.proceed_to_overview()
+        # Forked on the overview with product index 0 in the cart
+        cart, _ = overview_fork
+        products = ProductsKeywords(cart.page)
         cart.cancel_checkout()
         # Add another specific product: index 1
         products.add_item_to_cart_by_index(1, clear_cart=False)
@@ -255,36 +312,27 @@ class TestCart:
         cart.proceed_to_overview()
         cart.finish_checkout()
 
-    def test_refresh_on_checkout_overview(self, products, cart):
+    @pytest.mark.parametrize("seeded_cart", [{"products": [1], "step": "checkout-step-two"}], indirect=True)
+    def test_refresh_on_checkout_overview(self, seeded_cart):
         """Minor: Refresh page on Checkout Overview."""
-        products.add_random_items(count=1)
-        cart.navigate_to_cart()
+        cart = seeded_cart
         expected_items = cart.get_cart_items()
-        cart.click_checkout()
-        cart.fill_checkout_info(DEFAULT_FIRST_NAME, DEFAULT_LAST_NAME, DEFAULT_ZIP_CODE)
-        cart.proceed_to_overview()
         cart.page.reload(wait_until="networkidle")
         expect(cart.page.locator(locators.CHECKOUT_OVERVIEW_TITLE)).to_be_visible()
         cart.verify_overview(expected_items, PAYMENT_INFO, SHIPPING_INFO)
 
-    def test_refresh_on_checkout_complete(self, products, cart):
+    @pytest.mark.parametrize("seeded_cart", [{"products": [5], "step": "checkout-step-two"}], indirect=True)
+    def test_refresh_on_checkout_complete(self, seeded_cart):
         """Minor: Refresh page on Checkout Complete."""
-        products.add_random_items(count=1)
-        cart.navigate_to_cart()
-        cart.click_checkout()
-        cart.fill_checkout_info(DEFAULT_FIRST_NAME, DEFAULT_LAST_NAME, DEFAULT_ZIP_CODE)
-        cart.proceed_to_overview()
+        cart = seeded_cart
         cart.finish_checkout()
         cart.page.reload(wait_until="networkidle")
         expect(cart.page.locator(products_locators.PRODUCTS_TITLE)).to_be_visible()
 
-    def test_navigate_back_after_checkout_completion(self, products, cart):
+    @pytest.mark.parametrize("seeded_cart", [{"products": [2], "step": "checkout-step-two"}], indirect=True)
+    def test_navigate_back_after_checkout_completion(self, seeded_cart):
         """Minor: Navigate browser back after checkout completion."""
-        products.add_random_items(count=1)
-        cart.navigate_to_cart()
-        cart.click_checkout()
-        cart.fill_checkout_info(DEFAULT_FIRST_NAME, DEFAULT_LAST_NAME, DEFAULT_ZIP_CODE)
-        cart.proceed_to_overview()
+        cart = seeded_cart
         cart.finish_checkout()
         cart.page.go_back()
         expect(cart.page.locator(locators.CHECKOUT_COMPLETE_TITLE)).to_be_visible()
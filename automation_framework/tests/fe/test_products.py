@@ -24,7 +24,7 @@ class TestProductsPage:
 
     def test_add_to_cart_updates_badge(self, products):
         """Major: Add to cart updates badge."""
-        products.add_random_items(count=2)
+        products.add_random_items(count=2, verify_each=True)
         products.verify_badge_count(expected_count=2)
 
     def test_remove_from_cart_updates_badge(self, products):
@@ -0,0 +1,48 @@
+import logging
+
+import pytest
+
+from automation_framework.config import global_config as gc
+from automation_framework.pages import LoginPage, ProductsKeywords
+from automation_framework.pages.locators import products_locators
+from automation_framework.utils.browser import ui_context_options
+from automation_framework.utils.visual import compare_images
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.visual
+@pytest.mark.capture(mode="full", format="png")
+class TestVisual:
+
+    def test_inventory_matches_baseline(self, logged_in_page, visual):
+        """Major: Inventory page matches its visual baseline."""
+        ProductsKeywords(logged_in_page).assert_inventory_loaded()
+        visual.check(logged_in_page, "inventory", mask=[products_locators.CART_BADGE])
+        visual.verify()
+
+    def test_visual_user_inventory_differs_from_standard(self, logged_in_page, browser, creds):
+        """Critical: visual_user renders the inventory differently from standard_user."""
+        ProductsKeywords(logged_in_page).assert_inventory_loaded()
+        standard = logged_in_page.screenshot(animations="disabled", caret="hide")
+
+        # Own context: visual_user must not share cookies or storage with the standard_user session
+        context = browser.new_context(**ui_context_options())
+        try:
+            page = context.new_page()
+            LoginPage(page).login(creds["base_url"], gc.VISUAL_USERNAME, gc.PASSWORD, {"isValid": True})
+            ProductsKeywords(page).assert_inventory_loaded()
+            rendered = page.screenshot(animations="disabled", caret="hide")
+        finally:
+            context.close()
+
+        result = compare_images(
+            "visual_user_inventory",
+            rendered,
+            standard,
+            threshold=float(gc.VISUAL_THRESHOLD),
+            max_diff_ratio=float(gc.VISUAL_MAX_DIFF_RATIO),
+            diff_path=gc.VISUAL_DIFFS_DIR / "visual_user_inventory.png",
+        )
+        logger.info("visual_user comparison: %s", result)
+        assert not result.passed, "visual_user inventory unexpectedly matches standard_user"
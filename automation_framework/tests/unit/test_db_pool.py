@@ -0,0 +1,165 @@
+import itertools
+import threading
+import time
+
+import pytest
+
+from automation_framework.utils.dbutils import ConnectionPool
+
+
+class FakeConnection:
+    """Stands in for a PyMySQL connection: ping/rollback/close, optionally slow or dead."""
+
+    ids = itertools.count(1)
+
+    def __init__(self, ping_delay: float = 0.0, tracker: "PingTracker" = None):
+        self.id = next(self.ids)
+        self.alive = True
+        self.closed = False
+        self.rollbacks = 0
+        self.ping_delay = ping_delay
+        self.tracker = tracker
+
+    def ping(self, reconnect=False):
+        if self.tracker is not None:
+            self.tracker.enter()
+        try:
+            time.sleep(self.ping_delay)
+        finally:
+            if self.tracker is not None:
+                self.tracker.leave()
+        if not self.alive:
+            raise ConnectionError("server has gone away")
+
+    def get_autocommit(self):
+        return False
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = True
+
+
+class PingTracker:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def enter(self):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+
+    def leave(self):
+        with self.lock:
+            self.active -= 1
+
+
+class Factory:
+    def __init__(self, **connection_kwargs):
+        self.made = []
+        self.connection_kwargs = connection_kwargs
+
+    def __call__(self):
+        conn = FakeConnection(**self.connection_kwargs)
+        self.made.append(conn)
+        return conn
+
+
+class TestConnectionPool:
+
+    def test_opens_min_size_and_never_exceeds_max_size(self):
+        factory = Factory()
+        pool = ConnectionPool(factory, min_size=2, max_size=3, checkout_timeout=0.2)
+        assert len(factory.made) == 2
+
+        held = [pool.acquire() for _ in range(3)]
+        assert len(factory.made) == 3
+        assert len({conn.id for conn in held}) == 3
+        with pytest.raises(TimeoutError):
+            pool.acquire()
+
+        pool.release(held[0])
+        assert pool.acquire() is held[0], "released connection is reused, not replaced"
+        assert held[0].rollbacks == 1
+        assert pool.stats["created"] == 3
+
+    def test_checkout_waits_for_a_release(self):
+        pool = ConnectionPool(Factory(), min_size=1, max_size=1, checkout_timeout=2)
+        conn = pool.acquire()
+        threading.Timer(0.1, pool.release, args=(conn,)).start()
+        started = time.monotonic()
+        assert pool.acquire() is conn
+        assert 0.05 < time.monotonic() - started < 1.5
+        assert pool.stats["waited"] >= 1
+
+    def test_checkout_timeout(self):
+        pool = ConnectionPool(Factory(), min_size=0, max_size=1, checkout_timeout=0.1)
+        pool.acquire()
+        started = time.monotonic()
+        with pytest.raises(TimeoutError, match="max_size=1"):
+            pool.acquire()
+        assert 0.08 < time.monotonic() - started < 1.0
+
+    def test_idle_connections_expire(self):
+        factory = Factory()
+        pool = ConnectionPool(factory, min_size=1, max_size=2, idle_timeout=0.05)
+        stale = factory.made[0]
+        time.sleep(0.1)
+        fresh = pool.acquire()
+        assert fresh is not stale and stale.closed
+        assert pool.stats["discarded"] == 1
+
+    def test_dead_connection_replaced_on_checkout(self):
+        factory = Factory()
+        pool = ConnectionPool(factory, min_size=1, max_size=1, checkout_timeout=0.2)
+        dead = factory.made[0]
+        dead.alive = False
+        conn = pool.acquire()
+        assert conn is not dead and dead.closed and conn.alive
+        assert pool.stats == {"created": 2, "reused": 0, "discarded": 1, "waited": 0}
+
+    def test_broken_connection_not_returned_to_pool(self):
+        factory = Factory()
+        pool = ConnectionPool(factory, min_size=1, max_size=1)
+
+        class OperationalError(Exception):
+            pass
+
+        with pytest.raises(OperationalError):
+            with pool.connection():
+                raise OperationalError("lost connection")
+        assert factory.made[0].closed
+        assert pool.acquire() is factory.made[1]
+
+    def test_pings_run_outside_the_lock(self):
+        tracker = PingTracker()
+        pool = ConnectionPool(Factory(ping_delay=0.05, tracker=tracker), min_size=4, max_size=4)
+
+        def borrow():
+            for _ in range(3):
+                with pool.connection():
+                    pass
+
+        threads = [threading.Thread(target=borrow) for _ in range(8)]
+        started = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.monotonic() - started
+        assert tracker.peak > 1, "checkouts pinged one at a time"
+        assert elapsed < 24 * 0.05, f"24 checkouts took {elapsed:.2f}s, as long as serial pings"
+
+    def test_close_closes_idle_and_rejects_checkouts(self):
+        factory = Factory()
+        pool = ConnectionPool(factory, min_size=2, max_size=2)
+        held = pool.acquire()
+        pool.close()
+        assert not held.closed and all(conn.closed for conn in factory.made if conn is not held)
+        pool.release(held)
+        assert all(conn.closed for conn in factory.made)
+        with pytest.raises(RuntimeError, match="closed"):
+            pool.acquire()
@@ -0,0 +1,152 @@
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from automation_framework.utils.visual import (
+    BaselineStore,
+    VisualChecker,
+    compare_images,
+    dhash,
+    hamming,
+    png_size,
+)
+
+WIDTH, HEIGHT = 120, 80
+
+
+def _png(pixels: np.ndarray) -> bytes:
+    buffer = io.BytesIO()
+    Image.fromarray(pixels.astype(np.uint8)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def _page_like() -> np.ndarray:
+    """Synthetic 'page': light background, a dark header bar and a grid of grey cards."""
+    pixels = np.full((HEIGHT, WIDTH, 3), 240, dtype=np.uint8)
+    pixels[:12, :] = (30, 30, 60)
+    for top in (20, 50):
+        for left in (10, 45, 80):
+            pixels[top:top + 24, left:left + 30] = (180, 180, 180)
+    return pixels
+
+
+def _ramp(reverse: bool = False) -> np.ndarray:
+    """Left-to-right brightness ramp (right-to-left when reversed): every dHash gradient flips."""
+    row = np.linspace(0, 255, WIDTH)
+    if reverse:
+        row = row[::-1]
+    return np.repeat(np.tile(row, (HEIGHT, 1))[:, :, None], 3, axis=2)
+
+
+class _FakePage:
+    """Just enough of Page for VisualChecker.check: a fixed screenshot and no viewport (headful)."""
+
+    viewport_size = None
+
+    def __init__(self, png: bytes):
+        self.png = png
+
+    def locator(self, selector):
+        return selector
+
+    def screenshot(self, **kwargs):
+        return self.png
+
+
+@pytest.fixture(scope="module")
+def executor():
+    pool = ThreadPoolExecutor(max_workers=2)
+    yield pool
+    pool.shutdown(wait=True)
+
+
+@pytest.mark.visual
+class TestCompareImages:
+
+    def test_identical_bytes_pass_without_decoding(self):
+        png = _png(_page_like())
+        result = compare_images("same", png, png)
+        assert result.passed and result.reason == "identical"
+
+    def test_small_change_within_budget_passes(self):
+        changed = _page_like()
+        changed[40, 60] = (0, 0, 0)
+        result = compare_images("one_pixel", _png(changed), _png(_page_like()), max_diff_ratio=0.001)
+        assert result.passed, result
+        assert result.reason == "1 pixel(s) differ"
+
+    def test_text_sized_change_fails_and_writes_diff(self, tmp_path):
+        changed = _page_like()
+        changed[25:30, 15:35] = (200, 0, 0)  # a "price" changing colour inside one card
+        diff_path = tmp_path / "diff.png"
+        result = compare_images("price", _png(changed), _png(_page_like()), diff_path=diff_path)
+        assert not result.passed
+        assert result.hash_distance <= 12, "small change must reach the pixel diff, not the hash gate"
+        assert result.diff_ratio == pytest.approx(100 / (WIDTH * HEIGHT))
+        assert result.diff_path == diff_path and png_size(diff_path.read_bytes()) == {"width": WIDTH, "height": HEIGHT}
+
+    def test_masked_region_is_ignored(self):
+        changed = _page_like()
+        changed[25:30, 15:35] = (200, 0, 0)
+        result = compare_images("masked", _png(changed), _png(_page_like()), masks=[(10, 20, 30, 24)])
+        assert result.passed, result
+
+    def test_sub_threshold_noise_is_ignored(self):
+        noisy = _page_like().astype(np.int16) + 10  # below threshold 0.1 (25 of 255)
+        result = compare_images("noise", _png(np.clip(noisy, 0, 255)), _png(_page_like()))
+        assert result.passed, result
+
+    def test_size_mismatch_fails(self):
+        smaller = _page_like()[:, :100]
+        result = compare_images("size", _png(smaller), _png(_page_like()))
+        assert not result.passed
+        assert result.reason == f"size 100x{HEIGHT} != {WIDTH}x{HEIGHT}"
+
+    def test_different_layout_fails_on_hash(self):
+        result = compare_images("layout", _png(_ramp(reverse=True)), _png(_ramp()))
+        assert not result.passed
+        assert result.reason.startswith("perceptual hash distance")
+
+    def test_dhash_is_stable_and_distinguishes_layouts(self):
+        pixels = _page_like()
+        assert hamming(dhash(pixels), dhash(pixels.copy())) == 0
+        assert hamming(dhash(_ramp()), dhash(_ramp(reverse=True))) > 12
+
+
+@pytest.mark.visual
+class TestVisualChecker:
+
+    def test_missing_baseline_skips_and_keeps_candidate(self, tmp_path, executor):
+        checker = VisualChecker(BaselineStore(tmp_path / "baselines"), executor, diff_dir=tmp_path / "diffs")
+        checker.check(_FakePage(_png(_page_like())), "inventory")
+        with pytest.raises(pytest.skip.Exception, match="Missing visual baselines"):
+            checker.verify()
+        result = checker.results[0]
+        assert result.missing and result.diff_path.exists()
+        assert not (tmp_path / "baselines" / "chromium" / "inventory" / f"{WIDTH}x{HEIGHT}.png").exists()
+
+    def test_missing_baseline_fails_when_required(self, tmp_path, executor):
+        checker = VisualChecker(
+            BaselineStore(tmp_path / "baselines"), executor, diff_dir=tmp_path / "diffs", require_baselines=True
+        )
+        checker.check(_FakePage(_png(_page_like())), "inventory")
+        with pytest.raises(AssertionError, match="no baseline at"):
+            checker.verify()
+
+    def test_recorded_baseline_is_compared(self, tmp_path, executor):
+        png = _png(_page_like())
+        recorder = VisualChecker(BaselineStore(tmp_path / "b", update=True), executor, diff_dir=tmp_path / "d")
+        recorder.check(_FakePage(png), "inventory")
+        assert recorder.verify()[0].reason == "baseline recorded"
+        # Headful pages have no viewport_size: the baseline is named after the screenshot size
+        assert (tmp_path / "b" / "chromium" / "inventory" / f"{WIDTH}x{HEIGHT}.png").read_bytes() == png
+
+        changed = _page_like()
+        changed[25:30, 15:35] = (200, 0, 0)
+        checker = VisualChecker(BaselineStore(tmp_path / "b"), executor, diff_dir=tmp_path / "d")
+        checker.check(_FakePage(_png(changed)), "inventory")
+        with pytest.raises(AssertionError, match="Visual differences: inventory"):
+            checker.verify()
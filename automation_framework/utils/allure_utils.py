@@ -1,24 +1,165 @@
 # python
+import gzip
 import json
-from typing import Any, Dict, Optional
+import os
+import shutil
+import threading
+from typing import Any, Dict, Iterable, Iterator, Optional
 
 import allure
 from allure_commons.types import AttachmentType
 
+from automation_framework.config import global_config as gc
+from automation_framework.utils.artifact_store import _current_test, get_store
+
+_CHUNK = 64 * 1024
+_GZIP_MIME = "application/gzip"
+
+
+def _kb(value) -> int:
+    return int(float(value) * 1024)
+
+
+# Payloads up to ATTACH_PRETTY_MAX_KB are pretty-printed; larger ones stay compact. Above
+# ATTACH_FILE_MIN_KB they are streamed to a file instead of held in memory, gzipped above
+# ATTACH_GZIP_MIN_KB (0 disables) and cut off at ATTACH_MAX_KB (0 disables).
+PRETTY_MAX_BYTES = _kb(gc.ATTACH_PRETTY_MAX_KB)
+FILE_MIN_BYTES = _kb(gc.ATTACH_FILE_MIN_KB)
+GZIP_MIN_BYTES = _kb(gc.ATTACH_GZIP_MIN_KB)
+MAX_BYTES = _kb(gc.ATTACH_MAX_KB)
+
+_BYTES_PER_TEST: Dict[str, int] = {}
+_BYTES_LOCK = threading.Lock()
+
+
+def _record(size: int) -> None:
+    test = _current_test()
+    with _BYTES_LOCK:
+        _BYTES_PER_TEST[test] = _BYTES_PER_TEST.get(test, 0) + size
+
+
+def pop_attachment_bytes(test: str) -> int:
+    """Bytes attached while `test` was running (read once, at its teardown)."""
+    with _BYTES_LOCK:
+        return _BYTES_PER_TEST.pop(test, 0)
+
+
+def _batched(chunks: Iterable[str], size: int = _CHUNK) -> Iterator[bytes]:
+    """Join many small strings (json.iterencode yields one per token) into ~size byte blocks."""
+    pending, length = [], 0
+    for chunk in chunks:
+        pending.append(chunk)
+        length += len(chunk)
+        if length >= size:
+            yield "".join(pending).encode("utf-8")
+            pending, length = [], 0
+    if pending:
+        yield "".join(pending).encode("utf-8")
+
+
+def _gzip_file(path: str) -> str:
+    target = f"{path}.gz"
+    with open(path, "rb") as source, gzip.open(target, "wb", compresslevel=6) as packed:
+        shutil.copyfileobj(source, packed, _CHUNK)
+    os.unlink(path)
+    return target
+
+
+def _attach_stream(chunks: Iterable[bytes], name: str, mime: str, extension: str, max_bytes: int = MAX_BYTES) -> int:
+    """
+    Attach a payload produced chunk by chunk. Small payloads are attached from memory; once
+    FILE_MIN_BYTES is exceeded the rest is written straight to a temp file, which is gzipped
+    above GZIP_MIN_BYTES and attached through the artifact store. Returns the attached size.
+    """
+    buffer = bytearray()
+    handle = None
+    tmp_path = None
+    total = 0
+    truncated = 0
+    try:
+        for chunk in chunks:
+            if max_bytes and total + len(chunk) > max_bytes:
+                keep = max(max_bytes - total, 0)
+                truncated += len(chunk) - keep
+                chunk = chunk[:keep]
+            if chunk:
+                total += len(chunk)
+                if handle is None:
+                    buffer += chunk
+                    if len(buffer) > FILE_MIN_BYTES:
+                        tmp_dir = get_store().root / "tmp"
+                        tmp_dir.mkdir(parents=True, exist_ok=True)
+                        tmp_path = str(tmp_dir / f"{os.getpid()}-{threading.get_ident()}-{id(buffer)}.{extension}")
+                        handle = open(tmp_path, "wb")
+                        handle.write(buffer)
+                        buffer = bytearray()
+                else:
+                    handle.write(chunk)
+        if max_bytes and truncated:
+            marker = f"\n... [truncated {truncated} bytes above ATTACH_MAX_KB]".encode("utf-8")
+            if handle is None:
+                buffer += marker
+            else:
+                handle.write(marker)
+
+        if handle is None:
+            allure.attach(bytes(buffer), name=name, attachment_type=mime, extension=extension)
+            _record(len(buffer))
+            return len(buffer)
+
+        handle.close()
+        handle = None
+        if GZIP_MIN_BYTES and total > GZIP_MIN_BYTES:
+            tmp_path = _gzip_file(tmp_path)
+            mime, extension = _GZIP_MIME, f"{extension}.gz"
+        blob = get_store().put_file(tmp_path, name=name, link_back=False)
+        tmp_path = None
+        allure.attach.file(str(blob.path), name=name, attachment_type=mime, extension=extension)
+        _record(blob.size)
+        return blob.size
+    finally:
+        if handle is not None:
+            handle.close()
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+
+def _json_chunks(data: Any) -> Iterator[bytes]:
+    """Compact JSON, streamed; re-encoded with indent=2 when it turns out to be small."""
+    encoder = json.JSONEncoder(ensure_ascii=False, default=str, separators=(",", ":"))
+    tokens = encoder.iterencode(data)
+    head, size = [], 0
+    for token in tokens:
+        head.append(token)
+        size += len(token)
+        if size > PRETTY_MAX_BYTES:
+            break
+    else:
+        yield json.dumps(data, indent=2, ensure_ascii=False, default=str).encode("utf-8")
+        return
+    yield "".join(head).encode("utf-8")
+    yield from _batched(tokens)  # the rest of the same iterator, never held as one string
+
+
+def _bytes_chunks(body: bytes) -> Iterator[bytes]:
+    view = memoryview(body)
+    for start in range(0, len(view), _CHUNK):
+        yield bytes(view[start:start + _CHUNK])
+
 
 def attach_json(data: Any, name: str = "data") -> None:
     try:
-        payload = json.dumps(data, indent=2, ensure_ascii=False)
-    except Exception:
-        payload = str(data)
-    allure.attach(payload, name=name, attachment_type=AttachmentType.JSON)
+        _attach_stream(_json_chunks(data), name, AttachmentType.JSON.mime_type, AttachmentType.JSON.extension)
+    except ValueError:  # e.g. circular references
+        attach_text(str(data), name=name)
 
 
 def attach_text(text: str, name: str = "text") -> None:
-    allure.attach(text, name=name, attachment_type=AttachmentType.TEXT)
+    chunks = (text[start:start + _CHUNK].encode("utf-8") for start in range(0, len(text), _CHUNK))
+    _attach_stream(chunks, name, AttachmentType.TEXT.mime_type, AttachmentType.TEXT.extension)
 
 
-def attach_response(resp, name: str = "response") -> None:
+def attach_response(resp, name: str = "response", max_body: Optional[int] = None) -> None:
     try:
         meta = {
             "status_code": resp.status_code,
@@ -26,34 +167,53 @@ def attach_response(resp, name: str = "response") -> None:
             "method": getattr(resp.request, "method", ""),
             "headers": dict(resp.headers or {}),
         }
+        for key in ("duration_ms", "attempts"):
+            if hasattr(resp, key):
+                meta[key] = getattr(resp, key)
         attach_json(meta, name=f"{name}_meta")
     except Exception:
         pass
 
-    # Attach body as JSON if possible, otherwise text
+    # Never read a stream=True body here: it belongs to the caller
+    if getattr(resp, "_content", None) is False:
+        attach_text("<streamed body not captured>", name=f"{name}_body_raw")
+        return
     try:
-        body = resp.json()
-        attach_json(body, name=f"{name}_body")
+        body = resp.content or b""
+        content_type = resp.headers.get("Content-Type", "")
+        if "json" in content_type and len(body) <= PRETTY_MAX_BYTES:
+            attach_json(resp.json(), name=f"{name}_body")
+            return
+        # Large or non-JSON bodies are attached as received: no parse and re-serialize round trip
+        if "json" in content_type:
+            mime, extension = AttachmentType.JSON.mime_type, AttachmentType.JSON.extension
+        else:
+            mime, extension = AttachmentType.TEXT.mime_type, AttachmentType.TEXT.extension
+        limit = MAX_BYTES if max_body is None else max_body
+        _attach_stream(_bytes_chunks(body), f"{name}_body_raw", mime, extension, max_bytes=limit)
     except Exception:
-        try:
-            attach_text(resp.text, name=f"{name}_body_raw")
-        except Exception:
-            pass
+        pass
 
 
 def attach_request(
     method: str, url: str, headers: Optional[Dict[str, str]] = None, body: Any = None
 ) -> None:
-    allure.attach(
-        json.dumps(
-            {"method": method, "url": url, "headers": headers or {}, "body": body},
-            indent=2,
-            ensure_ascii=False,
-        ),
-        name="request",
-        attachment_type=AttachmentType.JSON,
-    )
+    attach_json({"method": method, "url": url, "headers": headers or {}, "body": body}, name="request")
+
+
+def attach_bytes(body: bytes, name: str, mime: str, extension: str) -> None:
+    """Attach through the artifact store: identical bytes are stored once and deduplicated."""
+    blob = get_store().put(body, extension, name=name)
+    allure.attach.file(str(blob.path), name=name, attachment_type=mime, extension=extension)
+    _record(blob.size)
+
+
+def attach_file(path, name: str, mime: Optional[str] = None, extension: Optional[str] = None) -> None:
+    """Attach an existing file (e.g. a trace zip); the original becomes a link to its blob."""
+    blob = get_store().put_file(path, name=name)
+    allure.attach.file(str(blob.path), name=name, attachment_type=mime, extension=extension)
+    _record(blob.size)
 
 
 def attach_screenshot_bytes(png_bytes: bytes, name: str = "screenshot") -> None:
-    allure.attach(png_bytes, name=name, attachment_type=AttachmentType.PNG)
+    attach_bytes(png_bytes, name, AttachmentType.PNG.mime_type, AttachmentType.PNG.extension)
@@ -0,0 +1,276 @@
+# python
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import time
+from pathlib import Path
+from typing import Dict, Iterator, NamedTuple, Optional, Tuple
+
+import allure_commons
+
+from automation_framework.config import global_config as gc
+
+logger = logging.getLogger(__name__)
+
+_CHUNK = 1 << 20
+_ATTACHMENT_RE = re.compile(r"^(?P<prefix>[^.]+)-attachment(?P<ext>\..+)?$")
+_SOURCE_RE = re.compile(r'"([^"/\\]+-attachment(?:\.[^"/\\]*)?)"')
+
+
+class Blob(NamedTuple):
+    sha256: str
+    path: Path
+    size: int
+    created: bool  # False when identical content was already stored
+
+
+def _current_test() -> str:
+    # "tests/fe/test_x.py::test_y (call)" -> "tests/fe/test_x.py::test_y"
+    return os.environ.get("PYTEST_CURRENT_TEST", "").rsplit(" (", 1)[0]
+
+
+def _link_or_copy(source: Path, destination: Path) -> None:
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    tmp = destination.with_name(f".{destination.name}.{os.getpid()}.tmp")
+    try:
+        os.link(source, tmp)
+    except OSError:  # cross-device or filesystem without hard links
+        shutil.copyfile(source, tmp)
+    os.replace(tmp, destination)
+
+
+class ArtifactStore:
+    """
+    Content-addressed storage for failure artifacts (screenshots, DOMs, traces).
+
+    Blobs live under <root>/blobs/<aa>/<sha256><ext> and are written once however many tests
+    or runs produce the same bytes. Every use appends a reference line to the worker's own
+    refs file (<root>/refs/<worker>.jsonl), so xdist workers never contend for a file; the
+    reference count of a blob is the number of retained reference lines naming it. `prune()`
+    drops references older than the retention window and deletes blobs nobody references.
+    """
+
+    def __init__(self, root: Path, worker: Optional[str] = None):
+        self.root = Path(root)
+        self.worker = worker or os.environ.get("PYTEST_XDIST_WORKER", "main")
+        self.blobs_dir = self.root / "blobs"
+        self.refs_dir = self.root / "refs"
+
+    def blob_path(self, sha256: str, extension: str = "") -> Path:
+        suffix = f".{extension.lstrip('.')}" if extension else ""
+        return self.blobs_dir / sha256[:2] / f"{sha256}{suffix}"
+
+    def _reference(self, blob: Blob, name: str, test: Optional[str]) -> None:
+        self.refs_dir.mkdir(parents=True, exist_ok=True)
+        line = {
+            "sha256": blob.sha256,
+            "path": str(blob.path.relative_to(self.root)),
+            "size": blob.size,
+            "name": name,
+            "test": _current_test() if test is None else test,
+            "ts": time.time(),
+        }
+        with (self.refs_dir / f"{self.worker}.jsonl").open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(line) + "\n")
+
+    def put(self, body: bytes, extension: str = "", name: str = "", test: Optional[str] = None) -> Blob:
+        sha256 = hashlib.sha256(body).hexdigest()
+        path = self.blob_path(sha256, extension)
+        created = not path.exists()
+        if created:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            tmp.write_bytes(body)
+            os.replace(tmp, path)
+        blob = Blob(sha256, path, len(body), created)
+        self._reference(blob, name, test)
+        return blob
+
+    def put_file(self, source: Path, name: str = "", test: Optional[str] = None, link_back: bool = True) -> Blob:
+        """
+        Store an existing file (e.g. a trace zip) by content. With `link_back` the original path
+        becomes a hard link to the blob, so it stays readable where tools expect it.
+        """
+        source = Path(source)
+        digest = hashlib.sha256()
+        with source.open("rb") as handle:
+            for chunk in iter(lambda: handle.read(_CHUNK), b""):
+                digest.update(chunk)
+        sha256 = digest.hexdigest()
+        extension = source.suffix.lstrip(".")
+        path = self.blob_path(sha256, extension)
+        created = not path.exists()
+        if created:
+            if link_back:
+                _link_or_copy(source, path)
+            else:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                shutil.move(str(source), path)
+        if link_back and not _same_file(source, path):
+            _link_or_copy(path, source)  # identical content already stored: share its inode
+        elif not link_back and source.exists():
+            source.unlink()
+        blob = Blob(sha256, path, path.stat().st_size, created)
+        self._reference(blob, name, test)
+        return blob
+
+    def references(self) -> Iterator[dict]:
+        if not self.refs_dir.exists():
+            return
+        for refs_file in sorted(self.refs_dir.glob("*.jsonl")):
+            with refs_file.open(encoding="utf-8") as handle:
+                for line in handle:
+                    if line.strip():
+                        yield json.loads(line)
+
+    def refcounts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for ref in self.references():
+            counts[ref["sha256"]] = counts.get(ref["sha256"], 0) + 1
+        return counts
+
+    def prune(self, retention_days: float) -> Tuple[int, int, int]:
+        """
+        Drop references older than `retention_days` and delete unreferenced blobs. Returns
+        (references dropped, blobs deleted, bytes freed). Run it only when no worker is writing.
+        """
+        cutoff = time.time() - retention_days * 86400
+        dropped = 0
+        if self.refs_dir.exists():
+            for refs_file in self.refs_dir.glob("*.jsonl"):
+                kept = []
+                with refs_file.open(encoding="utf-8") as handle:
+                    for line in handle:
+                        if not line.strip():
+                            continue
+                        if json.loads(line).get("ts", 0) >= cutoff:
+                            kept.append(line if line.endswith("\n") else line + "\n")
+                        else:
+                            dropped += 1
+                if kept:
+                    tmp = refs_file.with_suffix(f".{os.getpid()}.tmp")
+                    tmp.write_text("".join(kept), encoding="utf-8")
+                    os.replace(tmp, refs_file)
+                else:
+                    refs_file.unlink()
+
+        live = set(self.refcounts())
+        removed = freed = 0
+        if self.blobs_dir.exists():
+            for blob in self.blobs_dir.glob("*/*"):
+                if blob.name.startswith(".") or blob.name.split(".", 1)[0] in live:
+                    continue
+                freed += blob.stat().st_size
+                blob.unlink()
+                removed += 1
+        logger.info(
+            "Artifact store pruned",
+            extra={"refs_dropped": dropped, "blobs_removed": removed, "bytes_freed": freed},
+        )
+        return dropped, removed, freed
+
+
+def _same_file(a: Path, b: Path) -> bool:
+    try:
+        return os.path.samefile(a, b)
+    except OSError:
+        return False
+
+
+class AllureBlobLinker:
+    """
+    Allure hook plugin: an attachment whose source is a store blob becomes a hard link to that
+    blob in allure-results, so each artifact takes disk space once during the run instead of
+    once in the store and again as Allure's copy.
+    """
+
+    def __init__(self, results_dir: Path, store: "ArtifactStore"):
+        self.results_dir = Path(results_dir)
+        self.store = store
+
+    @allure_commons.hookimpl(trylast=True)  # after AllureFileLogger has written its copy
+    def report_attached_file(self, source, file_name):
+        source = Path(source)
+        if self.store.blobs_dir.resolve() not in source.resolve().parents:
+            return
+        destination = self.results_dir / file_name
+        try:
+            if destination.exists() and not _same_file(source, destination):
+                _link_or_copy(source, destination)
+        except OSError:
+            logger.debug("Keeping Allure's copy of %s", file_name, exc_info=True)
+
+
+def dedupe_allure_results(results_dir: Path, store: Optional[ArtifactStore] = None) -> Tuple[int, int]:
+    """
+    Collapse identical attachments in an allure-results directory.
+
+    Each attachment file is hashed; the first of each content is kept (hard-linked to the
+    store's blob when a store is given) and the `source` of every result/container JSON that
+    pointed at a duplicate is rewritten to it, then the duplicates are deleted. The Allure
+    report reads attachments by `source`, so every test still shows its attachment.
+    Returns (files removed, bytes saved).
+    """
+    results_dir = Path(results_dir)
+    if not results_dir.exists():
+        return 0, 0
+    canonical: Dict[str, str] = {}
+    renames: Dict[str, str] = {}
+    saved = 0
+    for attachment in sorted(results_dir.iterdir()):
+        match = _ATTACHMENT_RE.match(attachment.name)
+        if not match or not attachment.is_file():
+            continue
+        body = attachment.read_bytes()
+        sha256 = hashlib.sha256(body).hexdigest()
+        extension = (match.group("ext") or "").lstrip(".")
+        key = f"{sha256}.{extension}"
+        if key in canonical:
+            renames[attachment.name] = canonical[key]
+            saved += len(body)
+            continue
+        canonical[key] = attachment.name
+        if store is not None:
+            # A reference per run keeps blobs reused by later runs alive through prune()
+            blob = store.put(body, extension, name=attachment.name, test="")
+            if not _same_file(blob.path, attachment):
+                _link_or_copy(blob.path, attachment)
+    if not renames:
+        return 0, 0
+
+    def repoint(match: "re.Match") -> str:
+        kept = renames.get(match.group(1))
+        return match.group(0) if kept is None else f'"{kept}"'
+
+    # One regex pass per file; each attachment name is a dict lookup
+    for result_file in results_dir.glob("*.json"):
+        raw = result_file.read_text(encoding="utf-8")
+        if "-attachment" not in raw:
+            continue
+        rewritten = _SOURCE_RE.sub(repoint, raw)
+        if rewritten != raw:
+            result_file.write_text(rewritten, encoding="utf-8")
+    for duplicate in renames:
+        (results_dir / duplicate).unlink()
+    logger.info(
+        "Allure attachments deduplicated",
+        extra={"files_removed": len(renames), "bytes_saved": saved},
+    )
+    return len(renames), saved
+
+
+_STORE: Optional[ArtifactStore] = None
+
+
+def get_store() -> ArtifactStore:
+    """Process-wide store rooted at ARTIFACT_STORE_DIR."""
+    global _STORE
+    if _STORE is None:
+        _STORE = ArtifactStore(gc.ARTIFACT_STORE_DIR)
+    return _STORE
+
+
+__all__ = ["AllureBlobLinker", "ArtifactStore", "Blob", "dedupe_allure_results", "get_store"]
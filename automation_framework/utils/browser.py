@@ -6,14 +6,19 @@ from typing import Iterator, Optional, Tuple
 from playwright.sync_api import Browser, BrowserContext, Page, sync_playwright
 
 from automation_framework.config import global_config as gc
+from automation_framework.utils.flags import as_bool
 
 
 def _resolve_headless_flag() -> bool:
     """Convert HEADLESS env/config flag to a boolean."""
-    value = gc.HEADLESS
-    if isinstance(value, str):
-        return value.lower() in {"1", "true", "yes", "on"}
-    return bool(value)
+    return as_bool(gc.HEADLESS)
+
+
+def ui_context_options() -> dict:
+    """new_context() kwargs for UI tests: a fixed 1920x1080 viewport headless, the window size headful."""
+    if not _resolve_headless_flag():
+        return {"no_viewport": True}
+    return {"viewport": {"width": 1920, "height": 1080}}
 
 
 def _get_browser_type(pw, browser_type: str):
@@ -0,0 +1,241 @@
+# python
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+from playwright.sync_api import Browser, BrowserContext, Playwright
+
+from automation_framework.config import global_config as gc
+
+logger = logging.getLogger(__name__)
+
+
+def parse_grid_endpoints(raw: Optional[str]) -> List[str]:
+    """
+    Turn PW_GRID_ENDPOINTS into a list of ws:// endpoints.
+
+    A hostname that resolves to several addresses (e.g. a docker-compose service scaled
+    with `--scale browser=N`) is expanded into one endpoint per address.
+    """
+    endpoints: List[str] = []
+    for item in (raw or "").split(","):
+        item = item.strip()
+        if not item:
+            continue
+        if "://" not in item:
+            item = f"ws://{item}"
+        parsed = urlparse(item)
+        port = parsed.port or 3000
+        path = parsed.path or "/"
+        try:
+            infos = socket.getaddrinfo(parsed.hostname, port, type=socket.SOCK_STREAM)
+            addresses = sorted({info[4][0] for info in infos})
+        except socket.gaierror:
+            logger.warning("Grid endpoint %s could not be resolved; keeping as-is", item)
+            addresses = [parsed.hostname]
+        for address in addresses:
+            host = f"[{address}]" if ":" in address else address
+            endpoint = f"{parsed.scheme}://{host}:{port}{path}"
+            if endpoint not in endpoints:
+                endpoints.append(endpoint)
+    return endpoints
+
+
+class GridNode:
+    """One browser-server endpoint plus the browser connection this process holds to it."""
+
+    def __init__(self, endpoint: str):
+        self.endpoint = endpoint
+        parsed = urlparse(endpoint)
+        self.host = parsed.hostname
+        self.port = parsed.port or 3000
+        self.browser: Optional[Browser] = None
+        self.active_contexts = 0
+        self.healthy = True
+        self.last_check = 0.0
+        self.failures = 0
+
+    def probe(self, timeout: float) -> bool:
+        """Cheap TCP health check against the browser server port."""
+        try:
+            with socket.create_connection((self.host, self.port), timeout=timeout):
+                pass
+            healthy = True
+        except OSError:
+            healthy = False
+        self.healthy = healthy
+        self.last_check = time.monotonic()
+        return healthy
+
+    def is_connected(self) -> bool:
+        return self.browser is not None and self.browser.is_connected()
+
+    def __repr__(self) -> str:
+        return (
+            f"GridNode({self.endpoint}, healthy={self.healthy}, "
+            f"active={self.active_contexts}, connected={self.is_connected()})"
+        )
+
+
+class BrowserGrid:
+    """
+    Least-loaded scheduler over several Playwright browser servers.
+
+    Exposes `new_context()` and `close()` so it can stand in for a `Browser` in fixtures.
+    Callers that drive the async API pass `pw=None` and connect themselves through
+    `schedule()`, `connect_options()` and `mark_failed()`.
+    Scheduling is per process: each xdist worker has its own BrowserGrid and only counts the
+    contexts it opened itself, with no view of other workers' load on a node. Ties are broken
+    with a per-worker offset so workers at least start out on different nodes.
+    """
+
+    MAX_ATTEMPTS = 3
+
+    def __init__(
+        self,
+        pw: Optional[Playwright],
+        endpoints: List[str],
+        *,
+        headless: bool = True,
+        health_interval: float = 10.0,
+        connect_timeout: float = 30000,
+        probe_timeout: float = 2.0,
+    ):
+        if not endpoints:
+            raise ValueError("BrowserGrid requires at least one endpoint")
+        self._pw = pw
+        self._headless = headless
+        self._health_interval = health_interval
+        self._connect_timeout = connect_timeout
+        self._probe_timeout = probe_timeout
+        self._lock = threading.Lock()
+        self.nodes = [GridNode(endpoint) for endpoint in endpoints]
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+        offset = int("".join(ch for ch in worker if ch.isdigit()) or 0)
+        self._tiebreak = {
+            node.endpoint: (idx - offset) % len(self.nodes)
+            for idx, node in enumerate(self.nodes)
+        }
+        self._context_nodes: Dict[int, GridNode] = {}
+        logger.info("Browser grid initialised", extra={"endpoints": endpoints})
+
+    def _refresh_health(self) -> None:
+        now = time.monotonic()
+        for node in self.nodes:
+            if now - node.last_check >= self._health_interval or not node.healthy:
+                was_healthy = node.healthy
+                node.probe(self._probe_timeout)
+                if was_healthy and not node.healthy:
+                    logger.warning("Grid node became unhealthy: %s", node.endpoint)
+                elif not was_healthy and node.healthy:
+                    logger.info("Grid node recovered: %s", node.endpoint)
+
+    def _candidates(self) -> List[GridNode]:
+        self._refresh_health()
+        healthy = [node for node in self.nodes if node.healthy]
+        return sorted(
+            healthy,
+            key=lambda node: (node.active_contexts, node.failures, self._tiebreak[node.endpoint]),
+        )
+
+    def connect_options(self) -> dict:
+        """kwargs for `chromium.connect` (sync or async API): timeout plus the grid's launch options."""
+        return {
+            "timeout": self._connect_timeout,
+            "headers": {"x-playwright-launch-options": json.dumps({"headless": self._headless})},
+        }
+
+    def schedule(self) -> List[GridNode]:
+        """Healthy nodes in scheduling order, for callers that connect themselves (e.g. the async login batch)."""
+        with self._lock:
+            return self._candidates()
+
+    def mark_failed(self, node: GridNode, exc: BaseException) -> None:
+        node.failures += 1
+        node.browser = None
+        node.healthy = False
+        logger.warning("Grid node %s failed: %s", node.endpoint, exc)
+
+    def _connect(self, node: GridNode) -> Browser:
+        if node.is_connected():
+            return node.browser  # type: ignore[return-value]
+        if node.browser is not None:
+            logger.warning("Reconnecting to grid node %s", node.endpoint)
+        start = time.perf_counter()
+        browser = self._pw.chromium.connect(node.endpoint, **self.connect_options())
+        browser.on("disconnected", lambda _: self._on_disconnected(node))
+        node.browser = browser
+        node.failures = 0
+        logger.info(
+            "Connected to grid node %s in %.2fs",
+            node.endpoint,
+            time.perf_counter() - start,
+        )
+        return browser
+
+    def _on_disconnected(self, node: GridNode) -> None:
+        logger.warning("Grid node disconnected: %s", node.endpoint)
+        with self._lock:
+            node.browser = None
+            node.active_contexts = 0
+            node.healthy = False
+            # The node's contexts died with the connection; their close events may never fire
+            for context_id in [cid for cid, owner in self._context_nodes.items() if owner is node]:
+                del self._context_nodes[context_id]
+
+    def _release(self, context: BrowserContext) -> None:
+        with self._lock:
+            node = self._context_nodes.pop(id(context), None)
+            if node is not None and node.active_contexts > 0:
+                node.active_contexts -= 1
+
+    def new_context(self, **kwargs) -> BrowserContext:
+        """Open a context on the least-loaded healthy node, failing over to the next one."""
+        last_error: Optional[Exception] = None
+        for attempt in range(1, self.MAX_ATTEMPTS + 1):
+            if attempt > 1:
+                logger.warning("No grid node accepted the context; retrying (attempt %s)", attempt)
+                time.sleep(attempt - 1)
+            with self._lock:
+                candidates = self._candidates()
+            for node in candidates:
+                try:
+                    browser = self._connect(node)
+                    context = browser.new_context(**kwargs)
+                except Exception as exc:
+                    last_error = exc
+                    self.mark_failed(node, exc)
+                    continue
+                with self._lock:
+                    node.active_contexts += 1
+                    self._context_nodes[id(context)] = node
+                context.on("close", lambda ctx: self._release(ctx))
+                logger.debug("Context scheduled on grid node", extra={"node": repr(node)})
+                return context
+        raise RuntimeError(
+            f"No browser grid node could open a context: {self.nodes}"
+        ) from last_error
+
+    def close(self) -> None:
+        for node in self.nodes:
+            if node.browser is not None:
+                try:
+                    node.browser.close()
+                except Exception:
+                    pass
+                node.browser = None
+
+    def is_connected(self) -> bool:
+        return any(node.is_connected() for node in self.nodes)
+
+
+def grid_enabled() -> bool:
+    return bool((gc.PW_GRID_ENDPOINTS or "").strip())
+
+
+__all__ = ["BrowserGrid", "GridNode", "grid_enabled", "parse_grid_endpoints"]
@@ -0,0 +1,177 @@
+# python
+import gzip
+import io
+import logging
+import time
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from playwright.sync_api import Page
+
+from automation_framework.config import global_config as gc
+
+logger = logging.getLogger(__name__)
+
+MODES = ("viewport", "full", "element", "off")
+FORMATS = ("png", "jpeg", "webp")
+DOM_MODES = ("gzip", "html", "off")
+
+
+class Artifact(NamedTuple):
+    name: str
+    body: bytes
+    extension: str
+    mime: str
+    duration: float
+
+    @property
+    def size(self) -> int:
+        return len(self.body)
+
+
+class CapturePolicy:
+    """
+    What to capture when a UI test fails: screenshot extent, encoding and DOM form.
+
+    Defaults come from CAPTURE_* in global_config; `@pytest.mark.capture(...)` on a test, class
+    or module overrides any of them (e.g. `capture(mode="full")` for layout tests, `capture(dom="gzip")` for very large pages).
+    """
+
+    __slots__ = ("mode", "format", "quality", "scale", "element", "dom")
+
+    def __init__(
+        self,
+        mode: str = "viewport",
+        format: str = "jpeg",
+        quality: int = 80,
+        scale: float = 1.0,
+        element: str = "",
+        dom: str = "html",
+    ):
+        if mode not in MODES:
+            raise ValueError(f"Unsupported capture mode: {mode} (expected one of {MODES})")
+        if format not in FORMATS:
+            raise ValueError(f"Unsupported capture format: {format} (expected one of {FORMATS})")
+        if dom not in DOM_MODES:
+            raise ValueError(f"Unsupported DOM capture: {dom} (expected one of {DOM_MODES})")
+        if mode == "element" and not element:
+            raise ValueError("Capture mode 'element' needs an element selector")
+        self.mode = mode
+        self.format = format
+        self.quality = int(quality)
+        self.scale = float(scale)
+        self.element = element
+        self.dom = dom
+
+    @classmethod
+    def from_config(cls, **overrides: Any) -> "CapturePolicy":
+        options: Dict[str, Any] = {
+            "mode": gc.CAPTURE_MODE.lower(),
+            "format": gc.CAPTURE_FORMAT.lower(),
+            "quality": gc.CAPTURE_QUALITY,
+            "scale": gc.CAPTURE_SCALE,
+            "element": gc.CAPTURE_ELEMENT,
+            "dom": gc.CAPTURE_DOM.lower(),
+        }
+        options.update(overrides)
+        return cls(**options)
+
+    @classmethod
+    def for_item(cls, item) -> "CapturePolicy":
+        marker = item.get_closest_marker("capture")
+        return cls.from_config(**(marker.kwargs if marker else {}))
+
+    def __repr__(self) -> str:
+        return "CapturePolicy(" + ", ".join(f"{slot}={getattr(self, slot)!r}" for slot in self.__slots__) + ")"
+
+
+def _reencode(png: bytes, policy: CapturePolicy) -> bytes:
+    """Downscale and/or encode to WebP with Pillow; only needed for what Playwright can't do."""
+    try:
+        from PIL import Image  # type: ignore
+    except ImportError as exc:  # pragma: no cover
+        raise RuntimeError("Pillow is required for WebP or scaled failure screenshots") from exc
+    with Image.open(io.BytesIO(png)) as image:
+        if policy.scale < 1.0:
+            size = (max(1, int(image.width * policy.scale)), max(1, int(image.height * policy.scale)))
+            image = image.resize(size, Image.BILINEAR)
+        output = io.BytesIO()
+        if policy.format == "png":
+            image.save(output, "PNG", optimize=True)
+        else:
+            image.convert("RGB").save(output, policy.format.upper(), quality=policy.quality)
+        return output.getvalue()
+
+
+def _screenshot(page: Page, policy: CapturePolicy) -> Artifact:
+    started = time.perf_counter()
+    needs_pillow = policy.format == "webp" or policy.scale < 1.0
+    kwargs: Dict[str, Any] = {"scale": "css", "animations": "disabled", "caret": "hide"}
+    if needs_pillow:
+        kwargs["type"] = "png"
+    else:
+        kwargs["type"] = policy.format
+        if policy.format == "jpeg":
+            kwargs["quality"] = policy.quality
+
+    if policy.mode == "element":
+        body = page.locator(policy.element).first.screenshot(timeout=2000, **kwargs)
+    else:
+        body = page.screenshot(full_page=policy.mode == "full", **kwargs)
+    if needs_pillow:
+        body = _reencode(body, policy)
+    return Artifact(
+        name="screenshot",
+        body=body,
+        extension="jpg" if policy.format == "jpeg" else policy.format,
+        mime=f"image/{policy.format}",
+        duration=time.perf_counter() - started,
+    )
+
+
+def _dom(page: Page, policy: CapturePolicy) -> Artifact:
+    started = time.perf_counter()
+    html = page.content().encode("utf-8")
+    if policy.dom == "gzip":
+        body, extension, mime = gzip.compress(html, compresslevel=6), "html.gz", "application/gzip"
+    else:
+        body, extension, mime = html, "html", "text/html"
+    return Artifact("page_source", body, extension, mime, time.perf_counter() - started)
+
+
+def capture_failure(page: Page, policy: CapturePolicy) -> List[Artifact]:
+    """
+    Screenshot and DOM for a failed test according to `policy`. A capture that fails (closed
+    page, missing element) is logged and skipped so it never masks the test's own failure.
+    """
+    artifacts: List[Artifact] = []
+    steps = []
+    if policy.mode != "off":
+        steps.append(_screenshot)
+    if policy.dom != "off":
+        steps.append(_dom)
+    for step in steps:
+        try:
+            artifacts.append(step(page, policy))
+        except Exception as exc:
+            logger.warning("Failure capture %s skipped: %s", step.__name__.strip("_"), exc)
+    for artifact in artifacts:
+        logger.info(
+            "Captured %s (%d bytes) in %.0fms",
+            artifact.name,
+            artifact.size,
+            artifact.duration * 1000,
+            extra={"artifact": artifact.name, "bytes": artifact.size, "duration_ms": round(artifact.duration * 1000, 1)},
+        )
+    return artifacts
+
+
+def capture_stats(artifacts: List[Artifact]) -> Optional[Dict[str, Any]]:
+    if not artifacts:
+        return None
+    return {
+        artifact.name: {"bytes": artifact.size, "ms": round(artifact.duration * 1000, 1), "ext": artifact.extension}
+        for artifact in artifacts
+    }
+
+
+__all__ = ["Artifact", "CapturePolicy", "capture_failure", "capture_stats"]
@@ -0,0 +1,178 @@
+# python
+import hashlib
+import inspect
+import json
+import logging
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from playwright.sync_api import Browser, Page
+
+logger = logging.getLogger(__name__)
+
+_SAFE_NAME_RE = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+def _sources(obj: Any) -> Iterable[str]:
+    """Source text that defines `obj`; classes include their framework base classes."""
+    targets = [obj]
+    if inspect.isclass(obj):
+        targets = [klass for klass in obj.__mro__ if klass.__module__.startswith("automation_framework")]
+    for target in targets:
+        try:
+            yield inspect.getsource(target)
+        except (OSError, TypeError):
+            yield repr(target)
+
+
+def fingerprint(*objects: Any) -> str:
+    """Hash of the source of the prefix and everything it depends on (keyword classes, modules)."""
+    digest = hashlib.sha256()
+    for obj in objects:
+        for source in _sources(obj):
+            digest.update(source.encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+class Checkpoint:
+    """Browser-side state captured at the end of a flow prefix: storage state, URL and prefix data."""
+
+    __slots__ = ("name", "fingerprint", "url", "storage_state", "data", "created_at")
+
+    def __init__(
+        self,
+        name: str,
+        fingerprint: str,
+        url: str,
+        storage_state: Dict[str, Any],
+        data: Optional[Dict[str, Any]] = None,
+        created_at: Optional[float] = None,
+    ):
+        self.name = name
+        self.fingerprint = fingerprint
+        self.url = url
+        self.storage_state = storage_state
+        self.data = data or {}
+        self.created_at = created_at or time.time()
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.created_at
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, raw: Dict[str, Any]) -> "Checkpoint":
+        return cls(**{slot: raw.get(slot) for slot in cls.__slots__})
+
+
+class CheckpointStore:
+    """
+    Run a named flow prefix once, then fork fresh contexts from its end state.
+
+    Checkpoints are kept in memory and, when `root` is set, on disk so later sessions (and
+    other xdist workers) reuse them. A checkpoint is rebuilt when the fingerprint of the prefix
+    and its keyword classes changes, or when it is older than `ttl` seconds (the app's login
+    cookie is short-lived).
+    """
+
+    def __init__(self, root: Optional[Path] = None, ttl: float = 600.0):
+        self.root = Path(root) if root else None
+        self.ttl = ttl
+        self._memory: Dict[str, Checkpoint] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, name: str) -> Optional[Path]:
+        if self.root is None:
+            return None
+        return self.root / f"{_SAFE_NAME_RE.sub('_', name)}.json"
+
+    def get(self, name: str, expected_fingerprint: str) -> Optional[Checkpoint]:
+        checkpoint = self._memory.get(name)
+        path = self._path(name)
+        if checkpoint is None and path is not None and path.exists():
+            try:
+                checkpoint = Checkpoint.from_dict(json.loads(path.read_text(encoding="utf-8")))
+            except (OSError, ValueError, TypeError):
+                logger.warning("Unreadable checkpoint %s; rebuilding", path, exc_info=True)
+                checkpoint = None
+        if checkpoint is None:
+            return None
+        if checkpoint.fingerprint != expected_fingerprint:
+            logger.info("Checkpoint %s invalidated: prefix or keywords changed", name)
+            return None
+        if checkpoint.age > self.ttl:
+            logger.info("Checkpoint %s expired after %.0fs", name, checkpoint.age)
+            return None
+        self._memory[name] = checkpoint
+        return checkpoint
+
+    def capture(self, name: str, expected_fingerprint: str, page: Page, data: Optional[Dict] = None) -> Checkpoint:
+        checkpoint = Checkpoint(
+            name=name,
+            fingerprint=expected_fingerprint,
+            url=page.url,
+            storage_state=page.context.storage_state(),
+            data=data,
+        )
+        self._memory[name] = checkpoint
+        path = self._path(name)
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(checkpoint.to_dict()), encoding="utf-8")
+            os.replace(tmp, path)
+        return checkpoint
+
+    def ensure(
+        self,
+        name: str,
+        prefix: Callable[[Page], Optional[Dict]],
+        new_page: Callable[[], Page],
+        depends: Iterable[Any] = (),
+    ) -> Checkpoint:
+        """
+        Return the checkpoint for `name`, running `prefix(page)` on a page from `new_page()`
+        when there is no valid one. Whatever dict the prefix returns is stored as `data`.
+        """
+        expected = fingerprint(prefix, *depends)
+        with self._lock:
+            checkpoint = self.get(name, expected)
+            if checkpoint is not None:
+                return checkpoint
+            started = time.perf_counter()
+            page = new_page()
+            try:
+                data = prefix(page) or {}
+                checkpoint = self.capture(name, expected, page, data)
+            finally:
+                page.context.close()
+            logger.info(
+                "Checkpoint %s built in %.2fs",
+                name,
+                time.perf_counter() - started,
+                extra={"checkpoint": name, "url": checkpoint.url},
+            )
+            return checkpoint
+
+    def fork(self, browser: Browser, checkpoint: Checkpoint, **context_kwargs) -> Page:
+        """New context seeded with the checkpoint's storage state, opened at its URL."""
+        started = time.perf_counter()
+        context = browser.new_context(storage_state=checkpoint.storage_state, **context_kwargs)
+        page = context.new_page()
+        page.goto(checkpoint.url, wait_until="domcontentloaded")
+        logger.info(
+            "Forked checkpoint %s in %.2fs",
+            checkpoint.name,
+            time.perf_counter() - started,
+            extra={"checkpoint": checkpoint.name, "url": checkpoint.url},
+        )
+        return page
+
+
+__all__ = ["Checkpoint", "CheckpointStore", "fingerprint"]
@@ -1,14 +1,182 @@
+import itertools
+import json
+import logging
+import os
 import random
 import string
+import threading
+from pathlib import Path
+from typing import Iterable, List, NamedTuple, Optional
+
+from automation_framework.config import global_config as gc
+
+logger = logging.getLogger(__name__)
 
 
 def random_letters(length: int = 6) -> str:
-    return "".join(random.choice(string.ascii_letters) for _ in range(length))
+    return "".join(random.choices(string.ascii_letters, k=length))
 
 
 def random_digits(length: int = 4) -> str:
-    return "".join(random.choice(string.digits) for _ in range(length))
+    return "".join(random.choices(string.digits, k=length))
+
+
+FIRST_NAMES = (
+    "James", "Mary", "Robert", "Patricia", "John", "Jennifer", "Michael", "Linda", "David",
+    "Elizabeth", "William", "Barbara", "Richard", "Susan", "Joseph", "Jessica", "Thomas", "Sarah",
+    "Carlos", "Karen", "Daniel", "Lisa", "Matthew", "Nancy", "Anthony", "Sofia", "Mark", "Ana",
+    "Wei", "Priya", "Ahmed", "Fatima", "Kenji", "Yuki", "Olga", "Ivan", "Lucas", "Emma",
+)
+LAST_NAMES = (
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Rodriguez",
+    "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson", "Thomas", "Taylor",
+    "Moore", "Jackson", "Martin", "Lee", "Perez", "Thompson", "White", "Harris", "Clark",
+    "Lewis", "Walker", "Young", "Allen", "King", "Wright", "Nguyen", "Chen", "Patel", "Kim",
+)
+
+
+class Identity(NamedTuple):
+    """Checkout identity: the three checkout fields plus a unique username."""
+
+    first_name: str
+    last_name: str
+    zip_code: str
+    username: str
+
+    def checkout_info(self) -> dict:
+        """Keyword arguments for CartKeywords.fill_checkout_info."""
+        return {"first_name": self.first_name, "last_name": self.last_name, "zip_code": self.zip_code}
+
+
+def _draw_indices(count: int, seed: int):
+    """(first, last, zip) index columns for `count` identities, drawn in bulk."""
+    try:
+        import numpy as np  # type: ignore
+    except ImportError:
+        rng = random.Random(seed)
+        return (
+            rng.choices(range(len(FIRST_NAMES)), k=count),
+            rng.choices(range(len(LAST_NAMES)), k=count),
+            rng.choices(range(100000), k=count),
+            "random",
+        )
+    rng = np.random.default_rng(seed)
+    return (
+        rng.integers(0, len(FIRST_NAMES), size=count).tolist(),
+        rng.integers(0, len(LAST_NAMES), size=count).tolist(),
+        rng.integers(0, 100000, size=count).tolist(),
+        "numpy",
+    )
+
+
+def generate_identities(count: int, seed: int) -> List[Identity]:
+    """
+    `count` identities from `seed`. Columns are drawn in one call each (NumPy when installed,
+    otherwise random.choices), and usernames carry the row number so they never repeat.
+    The backend affects which identities a seed yields, so persist pools that must be replayed.
+    """
+    firsts, lasts, zips, backend = _draw_indices(count, seed)
+    width = len(str(max(count - 1, 0)))
+    identities = [
+        Identity(
+            FIRST_NAMES[first],
+            LAST_NAMES[last],
+            f"{zip_code:05d}",
+            f"{FIRST_NAMES[first][0]}{LAST_NAMES[last]}{row:0{width}d}".lower(),
+        )
+        for row, (first, last, zip_code) in enumerate(zip(firsts, lasts, zips))
+    ]
+    logger.info("Generated identity pool", extra={"count": count, "seed": seed, "backend": backend})
+    return identities
+
+
+def _worker_slot() -> tuple:
+    """(index, count) of this xdist worker; (0, 1) outside xdist."""
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "")
+    index = int("".join(ch for ch in worker if ch.isdigit()) or 0)
+    total = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1") or 1)
+    return index, max(total, 1)
+
+
+class DataPool:
+    """
+    Pre-generated identities handed out without repetition.
+
+    Under xdist every worker loads the same pool and takes only its own stride
+    (worker i of n gets rows i, i+n, i+2n, ...), so no two workers ever share an identity and
+    no coordination between processes is needed.
+    """
+
+    def __init__(self, identities: Iterable[Identity], seed: Optional[int] = None):
+        self.identities: List[Identity] = list(identities)
+        self.seed = seed
+        self.worker, self.workers = _worker_slot()
+        self._cursor = itertools.count()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.identities)
+
+    def take(self) -> Identity:
+        with self._lock:
+            row = self.worker + next(self._cursor) * self.workers
+        if row >= len(self.identities):
+            raise RuntimeError(
+                f"Identity pool exhausted ({len(self.identities)} rows, {self.workers} worker(s)); "
+                "raise DATA_POOL_SIZE"
+            )
+        return self.identities[row]
+
+    def take_many(self, count: int) -> List[Identity]:
+        return [self.take() for _ in range(count)]
+
+    def save(self, path: Path) -> Path:
+        """JSONL: a header line with the seed and size, then one identity per line."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with tmp.open("w", encoding="utf-8") as handle:
+            handle.write(json.dumps({"seed": self.seed, "count": len(self.identities)}) + "\n")
+            for identity in self.identities:
+                handle.write(json.dumps(list(identity), ensure_ascii=False) + "\n")
+        os.replace(tmp, path)
+        return path
+
+    @classmethod
+    def load(cls, path: Path) -> "DataPool":
+        with Path(path).open(encoding="utf-8") as handle:
+            header = json.loads(next(handle))
+            identities = [Identity(*json.loads(line)) for line in handle if line.strip()]
+        return cls(identities, seed=header.get("seed"))
+
 
+def identity_pool(
+    count: Optional[int] = None,
+    seed: Optional[int] = None,
+    path: Optional[Path] = None,
+) -> DataPool:
+    """
+    Load the pool at `path` (DATA_POOL_FILE by default), or the cached pool for (count, seed),
+    generating and persisting it on first use so later runs and other workers replay it.
+    """
+    pinned = path or (Path(gc.DATA_POOL_FILE) if gc.DATA_POOL_FILE else None)
+    if pinned is not None:
+        return DataPool.load(pinned)
+    count = count or int(gc.DATA_POOL_SIZE)
+    seed = int(gc.DATA_POOL_SEED) if seed is None else seed
+    cached = Path(gc.DATA_POOLS_DIR) / f"identities-{seed}-{count}.jsonl"
+    if cached.exists():
+        return DataPool.load(cached)
+    pool = DataPool(generate_identities(count, seed), seed=seed)
+    pool.save(cached)
+    return pool
 
 
-__all__ = ["random_letters", "random_digits"]
\ No newline at end of file
+__all__ = [
+    "DataPool",
+    "Identity",
+    "generate_identities",
+    "identity_pool",
+    "random_digits",
+    "random_letters",
+]
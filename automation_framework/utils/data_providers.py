@@ -0,0 +1,354 @@
+# python
+import csv
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import pytest
+from _pytest.mark.structures import ParameterSet
+
+from automation_framework.config import global_config as gc
+from automation_framework.utils.checkpoints import fingerprint as source_fingerprint
+
+logger = logging.getLogger(__name__)
+
+CSV_SUFFIXES = {".csv"}
+JSONL_SUFFIXES = {".jsonl", ".ndjson"}
+PARQUET_SUFFIXES = {".parquet", ".pq"}
+_PARQUET_BATCH_ROWS = 4096
+_HASH_CHUNK = 1 << 20
+_SAFE_NAME_RE = re.compile(r"[^A-Za-z0-9_.-]+")
+
+Row = Dict[str, Any]
+
+
+# --- Column parsers: accept the raw CSV string or the native JSONL/Parquet value -------------
+
+def text(value: Any) -> str:
+    return "" if value is None else str(value)
+
+
+def stripped(value: Any) -> str:
+    return text(value).strip()
+
+
+def optional_bool(value: Any) -> Optional[bool]:
+    if value is None or isinstance(value, bool):
+        return value
+    normalized = str(value).strip().lower()
+    if normalized in {"", "none"}:
+        return None
+    if normalized in {"true", "1", "yes"}:
+        return True
+    if normalized in {"false", "0", "no"}:
+        return False
+    raise ValueError(f"must be true/false/blank, got '{value}'")
+
+
+def integer(value: Any) -> Optional[int]:
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return None
+    return int(value)
+
+
+def _callable_id(func: Callable) -> str:
+    return f"{getattr(func, '__qualname__', repr(func))}@{source_fingerprint(func)}"
+
+
+class Column:
+    """One schema column: a parser for the raw value, whether it must be present, and a default."""
+
+    __slots__ = ("name", "parse", "required", "default")
+
+    def __init__(self, name: str, parse: Callable[[Any], Any] = text, required: bool = True, default: Any = None):
+        self.name = name
+        self.parse = parse
+        self.required = required
+        self.default = default
+
+
+class Schema:
+    """
+    Columns of a data file plus an optional whole-row `check` returning an error message.
+
+    Rows are validated and converted once, when the parsed cache is built; cache hits skip it.
+    Unknown columns are an error unless `allow_extra` is set, which catches unquoted commas in
+    CSV fields early instead of as a confusing assertion at run time.
+    """
+
+    def __init__(
+        self,
+        *columns: Column,
+        check: Optional[Callable[[Row], Optional[str]]] = None,
+        allow_extra: bool = False,
+    ):
+        self.columns: Tuple[Column, ...] = columns
+        self.check = check
+        self.allow_extra = allow_extra
+        self.names = [column.name for column in columns]
+
+    @property
+    def fingerprint(self) -> str:
+        # Parsers and the row check are hashed by source, so editing one invalidates the cache
+        parts = [
+            f"{c.name}:{_callable_id(c.parse)}:{c.required}:{c.default!r}"
+            for c in self.columns
+        ]
+        parts.append(_callable_id(self.check) if self.check else "")
+        parts.append(str(self.allow_extra))
+        return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()[:12]
+
+    def check_header(self, header: Sequence[str], source: str) -> None:
+        missing = [c.name for c in self.columns if c.required and c.name not in header]
+        if missing:
+            raise ValueError(f"{source}: missing required column(s) {missing}")
+        if not self.allow_extra:
+            extra = [name for name in header if name not in self.names]
+            if extra:
+                raise ValueError(f"{source}: unexpected column(s) {extra}")
+
+    def parse(self, raw: Row, label: str) -> Row:
+        if None in raw:  # csv.DictReader puts surplus fields of a row under the None key
+            raise ValueError(f"{label}: more fields than columns: {raw[None]!r}")
+        row: Row = {}
+        for column in self.columns:
+            value = raw.get(column.name)
+            if value is None or value == "":
+                if column.default is not None:
+                    value = column.default
+            try:
+                row[column.name] = column.parse(value)
+            except (TypeError, ValueError) as exc:
+                raise ValueError(f"{label}: {column.name} {exc}") from None
+        if self.allow_extra:
+            row.update({key: value for key, value in raw.items() if key not in row})
+        if self.check is not None:
+            error = self.check(row)
+            if error:
+                raise ValueError(f"{label}: {error}")
+        return row
+
+
+# --- Source readers: yield (label, raw row) lazily ------------------------------------------
+
+def _read_csv(path: Path, schema: Optional[Schema]) -> Iterator[Tuple[str, Row]]:
+    with path.open(newline="", encoding="utf-8") as handle:
+        reader = csv.DictReader(handle)
+        if schema is not None:
+            schema.check_header(reader.fieldnames or [], str(path))
+        for line, raw in enumerate(reader, start=2):
+            yield f"Row {line}", raw
+
+
+def _read_jsonl(path: Path, schema: Optional[Schema]) -> Iterator[Tuple[str, Row]]:
+    with path.open(encoding="utf-8") as handle:
+        for line, raw_line in enumerate(handle, start=1):
+            if not raw_line.strip():
+                continue
+            try:
+                raw = json.loads(raw_line)
+            except ValueError as exc:
+                raise ValueError(f"{path} line {line}: invalid JSON ({exc})") from None
+            if not isinstance(raw, dict):
+                raise ValueError(f"{path} line {line}: expected an object, got {type(raw).__name__}")
+            if schema is not None:
+                schema.check_header(list(raw), f"{path} line {line}")
+            yield f"Line {line}", raw
+
+
+def _read_parquet(path: Path, schema: Optional[Schema]) -> Iterator[Tuple[str, Row]]:
+    try:
+        import pyarrow.parquet as pq  # type: ignore
+    except ImportError as exc:  # pragma: no cover
+        raise RuntimeError("pyarrow is required to read Parquet test data") from exc
+
+    parquet = pq.ParquetFile(path)
+    header = parquet.schema_arrow.names
+    columns = None
+    if schema is not None:
+        schema.check_header(header, str(path))
+        columns = [name for name in schema.names if name in header] if not schema.allow_extra else None
+    number = 0
+    for batch in parquet.iter_batches(batch_size=_PARQUET_BATCH_ROWS, columns=columns):
+        for raw in batch.to_pylist():
+            number += 1
+            yield f"Row {number}", raw
+
+
+def _reader(path: Path) -> Callable[[Path, Optional[Schema]], Iterator[Tuple[str, Row]]]:
+    suffix = path.suffix.lower()
+    if suffix in CSV_SUFFIXES:
+        return _read_csv
+    if suffix in JSONL_SUFFIXES:
+        return _read_jsonl
+    if suffix in PARQUET_SUFFIXES:
+        return _read_parquet
+    raise ValueError(f"Unsupported test data format: {path.name}")
+
+
+def file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(_HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DataProvider:
+    """
+    Lazy, cached rows of one test-data file (CSV, JSONL or Parquet).
+
+    The first read streams the source through the schema and writes the converted rows to a
+    JSONL cache next to a small meta file (source mtime, size, sha256, schema fingerprint, row
+    count). Later reads stream the cache line by line without re-validating. A changed mtime or
+    size triggers a content hash, so a touched-but-identical file (fresh checkout) still hits.
+    Neither path holds the whole data set in memory.
+    """
+
+    def __init__(
+        self,
+        source: Union[str, Path],
+        schema: Optional[Schema] = None,
+        *,
+        cache_dir: Optional[Path] = gc.DATA_CACHE_DIR,
+    ):
+        path = Path(source)
+        self.path = path if path.is_absolute() else gc.DATA_DIR / path
+        self.schema = schema
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._reader = _reader(self.path)
+
+    def __repr__(self) -> str:
+        return f"DataProvider({self.path.name})"
+
+    def __iter__(self) -> Iterator[Row]:
+        return self.rows()
+
+    def _cache_paths(self) -> Tuple[Path, Path]:
+        schema_fp = self.schema.fingerprint if self.schema else "raw"
+        stem = _SAFE_NAME_RE.sub("_", f"{self.path.parent.name}-{self.path.name}-{schema_fp}")
+        return self.cache_dir / f"{stem}.jsonl", self.cache_dir / f"{stem}.meta.json"
+
+    def _parsed(self) -> Iterator[Row]:
+        for label, raw in self._reader(self.path, self.schema):
+            yield self.schema.parse(raw, label) if self.schema else raw
+
+    def _cache_hit(self, stat: os.stat_result, data_path: Path, meta_path: Path) -> bool:
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+        if not data_path.exists():
+            return False
+        if meta.get("mtime_ns") == stat.st_mtime_ns and meta.get("size") == stat.st_size:
+            return True
+        if meta.get("size") != stat.st_size or meta.get("sha256") != file_digest(self.path):
+            return False
+        meta["mtime_ns"] = stat.st_mtime_ns
+        self._write_atomic(meta_path, json.dumps(meta))
+        return True
+
+    @staticmethod
+    def _write_atomic(path: Path, content: str) -> None:
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(content, encoding="utf-8")
+        os.replace(tmp, path)
+
+    def _build_cache(self, stat: os.stat_result, data_path: Path, meta_path: Path) -> None:
+        started = time.perf_counter()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = data_path.with_suffix(f".{os.getpid()}.tmp")
+        count = 0
+        try:
+            with tmp.open("w", encoding="utf-8") as handle:
+                for row in self._parsed():
+                    handle.write(json.dumps(row, ensure_ascii=False))
+                    handle.write("\n")
+                    count += 1
+            os.replace(tmp, data_path)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+        meta = {
+            "source": str(self.path),
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": file_digest(self.path),
+            "schema": self.schema.fingerprint if self.schema else "raw",
+            "rows": count,
+        }
+        self._write_atomic(meta_path, json.dumps(meta))
+        logger.info(
+            "Test data cache built for %s in %.2fs",
+            self.path.name,
+            time.perf_counter() - started,
+            extra={"source": str(self.path), "rows": count},
+        )
+
+    def rows(self) -> Iterator[Row]:
+        """Validated rows in file order, streamed from the parsed cache (built on first use)."""
+        if not self.path.exists():
+            raise FileNotFoundError(f"Test data file not found: {self.path}")
+        if self.cache_dir is None:
+            yield from self._parsed()
+            return
+        stat = self.path.stat()
+        data_path, meta_path = self._cache_paths()
+        if not self._cache_hit(stat, data_path, meta_path):
+            self._build_cache(stat, data_path, meta_path)
+        with data_path.open(encoding="utf-8") as handle:
+            for line in handle:
+                yield json.loads(line)
+
+    def params(
+        self,
+        argnames: Sequence[str],
+        builder: Optional[Callable[[Row, int], ParameterSet]] = None,
+    ) -> Iterator[ParameterSet]:
+        """One pytest.param per row; `builder(row, index)` overrides the default column pick."""
+        for index, row in enumerate(self.rows(), start=1):
+            if builder is not None:
+                yield builder(row, index)
+            else:
+                yield pytest.param(*(row.get(name) for name in argnames), id=str(row.get("id") or f"row{index}"))
+
+
+def _argnames(raw: Union[str, Sequence[str]]) -> List[str]:
+    if isinstance(raw, str):
+        return [name.strip() for name in raw.split(",") if name.strip()]
+    return list(raw)
+
+
+def parametrize_from_marker(metafunc) -> None:
+    """
+    pytest_generate_tests body for `@pytest.mark.data_provider(source, argnames, schema=, builder=)`.
+    Rows are read at collection from the parsed cache instead of being built at module import;
+    pytest itself needs the params as a collection, so only this test's items are materialized.
+    """
+    marker = metafunc.definition.get_closest_marker("data_provider")
+    if marker is None:
+        return
+    if not marker.args:
+        raise ValueError(f"{metafunc.definition.nodeid}: data_provider needs a source file")
+    source = marker.args[0]
+    argnames = _argnames(marker.args[1] if len(marker.args) > 1 else marker.kwargs.get("argnames", ""))
+    provider = DataProvider(source, marker.kwargs.get("schema"))
+    metafunc.parametrize(argnames, list(provider.params(argnames, marker.kwargs.get("builder"))))
+
+
+__all__ = [
+    "Column",
+    "DataProvider",
+    "Schema",
+    "file_digest",
+    "integer",
+    "optional_bool",
+    "parametrize_from_marker",
+    "stripped",
+    "text",
+]
@@ -1,13 +1,18 @@
 import json
+import logging
+import threading
 import time
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Generator, Optional, Union
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Union
 
 from automation_framework.config import global_config as gc
+from automation_framework.utils.flags import as_bool
 
 QueryResult = Union[list[tuple], list[dict[str, Any]], int]
 
+logger = logging.getLogger(__name__)
+
 
 def _resolve_user(default: Optional[str]) -> str:
     return default or getattr(gc, "DB_USERNAME", getattr(gc, "DB_USER", ""))
@@ -56,14 +61,214 @@ def create_db_connection(
     return conn
 
 
+class ConnectionPool:
+    """
+    Thread-safe pool of connections to one database/host/user.
+
+    `min_size` connections are opened up front and at most `max_size` exist at once; callers
+    beyond that wait up to `checkout_timeout` seconds. Idle connections older than
+    `idle_timeout` are closed instead of reused, every checkout pings the connection (a dead
+    one is replaced), and a returned connection is rolled back so no open transaction leaks
+    into the next borrower. The lock only guards the idle list and counters: pings, connects
+    and closes run outside it, so checkouts on different threads overlap their round trips.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        *,
+        min_size: int = 1,
+        max_size: int = 5,
+        idle_timeout: float = 300.0,
+        checkout_timeout: float = 30.0,
+    ):
+        if not 0 <= min_size <= max_size or max_size < 1:
+            raise ValueError(f"Invalid pool size: min_size={min_size}, max_size={max_size}")
+        self._factory = factory
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.checkout_timeout = checkout_timeout
+        self._idle: List[Tuple[Any, float]] = []  # (connection, returned at); reused LIFO
+        self._size = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self.stats = {"created": 0, "reused": 0, "discarded": 0, "waited": 0}
+        for _ in range(min_size):
+            self._idle.append((self._create(), time.monotonic()))
+
+    def _create(self) -> Any:
+        conn = self._factory()
+        self._size += 1
+        self.stats["created"] += 1
+        return conn
+
+    @staticmethod
+    def _close_quietly(conn: Any) -> None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _forget(self, conn: Any) -> None:
+        """Close a checked-out connection and give its slot back (called without the lock)."""
+        self._close_quietly(conn)
+        with self._cond:
+            self._size -= 1
+            self.stats["discarded"] += 1
+            self._cond.notify()
+
+    @staticmethod
+    def _alive(conn: Any) -> bool:
+        try:
+            conn.ping(reconnect=False)
+            return True
+        except Exception:
+            return False
+
+    def acquire(self) -> Any:
+        deadline = time.monotonic() + self.checkout_timeout
+        while True:
+            conn = None
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("Connection pool is closed")
+                    if self._idle:
+                        conn, returned_at = self._idle.pop()  # its slot stays counted while we check it
+                        break
+                    if self._size < self.max_size:
+                        self._size += 1  # reserve the slot; connect outside the lock
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(
+                            f"No DB connection free after {self.checkout_timeout}s (max_size={self.max_size})"
+                        )
+                    self.stats["waited"] += 1
+                    self._cond.wait(remaining)
+            if conn is None:
+                break
+            if time.monotonic() - returned_at > self.idle_timeout or not self._alive(conn):
+                self._forget(conn)
+                continue
+            with self._cond:
+                self.stats["reused"] += 1
+            return conn
+        try:
+            conn = self._factory()
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self.stats["created"] += 1
+        return conn
+
+    def release(self, conn: Any, discard: bool = False) -> None:
+        if not discard:
+            try:
+                if not conn.get_autocommit():
+                    conn.rollback()
+            except Exception:
+                discard = True
+        with self._cond:
+            if not (discard or self._closed):
+                self._idle.append((conn, time.monotonic()))
+                self._cond.notify()
+                return
+        self._forget(conn)
+
+    @contextmanager
+    def connection(self) -> Generator[Any, None, None]:
+        conn = self.acquire()
+        broken = False
+        try:
+            yield conn
+        except Exception as exc:
+            # Connection-level failures (lost link, protocol errors) must not go back to the pool
+            broken = type(exc).__name__ in {"OperationalError", "InterfaceError"} or not self._alive(conn)
+            raise
+        finally:
+            self.release(conn, discard=broken)
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self.stats["discarded"] += len(idle)
+            self._cond.notify_all()
+        for conn, _ in idle:
+            self._close_quietly(conn)
+        logger.info("DB pool closed", extra={"db_pool": dict(self.stats)})
+
+
+_POOLS: Dict[Tuple, ConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def get_pool(
+    *,
+    database: str,
+    user: Optional[str] = gc.DB_USERNAME,
+    password: Optional[str] = gc.DB_PASSWORD,
+    host: Optional[str] = gc.DB_HOST,
+    port: Optional[Union[int, str]] = gc.DB_PORT,
+    autocommit: bool = False,
+    sslmode: Optional[str] = None,
+) -> ConnectionPool:
+    """
+    Process-wide pool for these connection settings, created on first use. Each xdist worker
+    is its own process, so workers never share connections.
+    """
+    key = (database, host or gc.DB_HOST, str(port), _resolve_user(user), autocommit, sslmode)
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            pool = _POOLS[key] = ConnectionPool(
+                lambda: create_db_connection(
+                    database=database,
+                    user=user,
+                    password=password,
+                    host=host,
+                    port=port,
+                    autocommit=autocommit,
+                    sslmode=sslmode,
+                ),
+                min_size=int(gc.DB_POOL_MIN),
+                max_size=int(gc.DB_POOL_MAX),
+                idle_timeout=float(gc.DB_POOL_IDLE_TIMEOUT),
+                checkout_timeout=float(gc.DB_POOL_CHECKOUT_TIMEOUT),
+            )
+        return pool
+
+
+def close_pools() -> None:
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.close()
+
+
 @contextmanager
-def db_connection(**kwargs) -> Generator[Any, None, None]:
+def db_connection(*, pooled: Optional[bool] = None, **kwargs) -> Generator[Any, None, None]:
     """
-    Context manager wrapper for create_db_connection that closes the connection.
+    Context manager yielding a connection. With pooling (DB_POOL=true, the default) it is
+    borrowed from the pool for these settings and returned afterwards; otherwise a new
+    connection is created and closed.
     Usage:
         with db_connection(database="mydb") as conn:
             ...
     """
+    if pooled is None:
+        pooled = as_bool(gc.DB_POOL)
+    if pooled:
+        with get_pool(**kwargs).connection() as conn:
+            yield conn
+        return
     conn = create_db_connection(**kwargs)
     try:
         yield conn
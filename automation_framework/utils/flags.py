@@ -0,0 +1,14 @@
+# python
+from typing import Any
+
+TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
+
+
+def as_bool(value: Any) -> bool:
+    """Read an on/off setting from global_config (env strings such as "true", "1", "on")."""
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in TRUE_VALUES
+
+
+__all__ = ["TRUE_VALUES", "as_bool"]
@@ -0,0 +1,106 @@
+# python
+"""
+Look up structured test logs by test or selector through the per-worker offset index.
+
+Usage:
+    python -m automation_framework.utils.log_index --test test_checkout [--run latest|all|RUN_ID] [--raw]
+    python -m automation_framework.utils.log_index --selector "//button[@id='checkout']" [--test ...]
+
+Only the small index files are scanned; matching records are read by seeking to their byte
+offsets in the rolling <worker>-<n>.jsonl files written by StructuredLogSink.
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from automation_framework.config import global_config as gc
+
+
+def load_index(directory: Path, run: str = "latest") -> List[Dict]:
+    entries: List[Dict] = []
+    for index_file in sorted(Path(directory).glob("*.index.jsonl")):
+        with index_file.open(encoding="utf-8") as handle:
+            entries.extend(json.loads(line) for line in handle if line.strip())
+    if run == "latest" and entries:
+        run = max(entry["run"] for entry in entries)
+    if run != "all":
+        entries = [entry for entry in entries if entry["run"] == run]
+    return entries
+
+
+def _matches(entry: Dict, test: Optional[str]) -> bool:
+    return test is None or entry["test"] == test or test in entry["test"]
+
+
+def records_for_test(directory: Path, entries: List[Dict], test: Optional[str]) -> Iterator[Dict]:
+    """All records of the matching tests, in write order."""
+    for entry in entries:
+        if not _matches(entry, test):
+            continue
+        for name, start, end in entry["segments"]:
+            with (Path(directory) / name).open("rb") as handle:
+                handle.seek(start)
+                for line in handle.read(end - start).splitlines():
+                    yield json.loads(line)
+
+
+def selector_records(directory: Path, entries: List[Dict], selector: str, test: Optional[str] = None) -> Iterator[Dict]:
+    """Records logged with `extra={"selector": selector}`, optionally limited to matching tests."""
+    handles: Dict[str, object] = {}
+    try:
+        for entry in entries:
+            if not _matches(entry, test):
+                continue
+            for name, offset in entry.get("selectors", {}).get(selector, []):
+                handle = handles.get(name)
+                if handle is None:
+                    handle = handles[name] = (Path(directory) / name).open("rb")
+                handle.seek(offset)
+                yield json.loads(handle.readline())
+    finally:
+        for handle in handles.values():
+            handle.close()
+
+
+def _format(record: Dict) -> str:
+    stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(record.get("ts", 0)))
+    extras = {
+        key: value
+        for key, value in record.items()
+        if key not in {"ts", "level", "logger", "msg", "test", "worker", "run"}
+    }
+    suffix = f" {json.dumps(extras, ensure_ascii=False)}" if extras else ""
+    return f"{stamp} [{record.get('level')}] {record.get('logger')}: {record.get('msg')}  <{record.get('test')}>{suffix}"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--test", help="Test node id, or a substring of it")
+    parser.add_argument("--selector", help="Exact selector passed in a helper's log extra")
+    parser.add_argument("--run", default="latest", help="Run id, 'latest' (default) or 'all'")
+    parser.add_argument("--dir", type=Path, default=Path(gc.STRUCTURED_LOGS_DIR))
+    parser.add_argument("--raw", action="store_true", help="Print JSON lines instead of formatted text")
+    args = parser.parse_args(argv)
+
+    if not args.test and not args.selector:
+        parser.error("pass --test and/or --selector")
+    entries = load_index(args.dir, args.run)
+    if args.selector:
+        records = selector_records(args.dir, entries, args.selector, args.test)
+    else:
+        records = records_for_test(args.dir, entries, args.test)
+    found = 0
+    for record in records:
+        found += 1
+        print(json.dumps(record, ensure_ascii=False) if args.raw else _format(record))
+    if not found:
+        print("No matching records", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
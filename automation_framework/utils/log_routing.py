@@ -0,0 +1,343 @@
+# python
+import copy
+import json
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+
+_CLOSE = "_route_close"
+_OPEN = "_route_open"
+_PRIMITIVES = (str, bytes, int, float, bool, type(None))
+# Loggers lowered to the file level at start; test modules are added per test with `watch()`
+FRAMEWORK_LOGGERS = ("automation_framework", "conftest")
+_KEYWORDS_DIR = f"{os.sep}pages{os.sep}keywords{os.sep}"
+# Attributes every LogRecord has; anything else on a record came from `extra=`
+_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "test_log", "test_id"}
+
+
+def _calling_keyword(max_depth: int = 12) -> Optional[str]:
+    """Innermost pages/keywords function on the logging thread's stack, e.g. 'products_keywords.add_random_items'."""
+    frame = sys._getframe(2)
+    for _ in range(max_depth):
+        if frame is None:
+            return None
+        if _KEYWORDS_DIR in frame.f_code.co_filename:
+            return f"{Path(frame.f_code.co_filename).stem}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return None
+
+
+class _RoutingQueueHandler(QueueHandler):
+    """
+    Runs on the logging thread: tags the record with the active test's file and enqueues it.
+    Formatting is left to the listener thread (stock QueueHandler formats eagerly in prepare()),
+    and the time spent here is added to the router's per-test overhead.
+
+    Records whose args are all primitives are queued as they are. A record with exc_info or
+    other args (pages, locators, mutable objects) is copied with its message and traceback
+    rendered here: by the time the listener formats it, those objects may have changed or the
+    traceback frames would be kept alive in the queue.
+    """
+
+    def __init__(self, log_queue: "queue.SimpleQueue", router: "TestLogRouter"):
+        super().__init__(log_queue)
+        self.router = router
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        args = record.args
+        values = args.values() if isinstance(args, dict) else (args or ())
+        if not record.exc_info and all(isinstance(value, _PRIMITIVES) for value in values):
+            return record
+        record = copy.copy(record)  # other handlers still see the original
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        target = self.router.current
+        if target is None:
+            return False
+        started = time.perf_counter()
+        record.test_log = target
+        record.test_id = self.router.current_test
+        if "selector" in record.__dict__ and "keyword" not in record.__dict__:
+            keyword = _calling_keyword()
+            if keyword:
+                record.keyword = keyword
+        handled = super().handle(record)
+        self.router.add_overhead(time.perf_counter() - started)
+        return handled
+
+
+class _PerTestFileHandler(logging.Handler):
+    """Listener-side sink: writes each record to the file it was tagged with."""
+
+    def __init__(self, formatter: logging.Formatter):
+        super().__init__()
+        self.setFormatter(formatter)
+        self._files: Dict[str, object] = {}
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        open_path = getattr(record, _OPEN, None)
+        if open_path is not None:
+            # Truncate here, in queue order, after every record queued for an earlier run of the file
+            previous = self._files.pop(open_path, None)
+            if previous is not None:
+                previous.close()
+            try:
+                self._files[open_path] = open(open_path, "w", encoding="utf-8")
+            except Exception:
+                self.handleError(record)
+            return True
+        close_path = getattr(record, _CLOSE, None)
+        if close_path is not None:
+            handle = self._files.pop(close_path, None)
+            if handle is not None:
+                handle.close()
+            done = getattr(record, "_route_done", None)
+            if done is not None:
+                done.set()
+            return True
+        return super().handle(record)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        path = getattr(record, "test_log", None)
+        if path is None:
+            return
+        try:
+            handle = self._files.get(path)
+            if handle is None:
+                handle = open(path, "a", encoding="utf-8")
+                self._files[path] = handle
+            handle.write(self.format(record) + "\n")
+        except Exception:
+            self.handleError(record)
+
+    def close(self) -> None:
+        for handle in self._files.values():
+            handle.close()
+        self._files.clear()
+        super().close()
+
+
+class StructuredLogSink(logging.Handler):
+    """
+    Listener-side JSONL sink: one rolling file per worker plus an offset index.
+
+    Every record becomes one JSON line (time, level, logger, message, test id, worker and any
+    `extra` fields such as selector, keyword, mode and duration_ms). Files roll at `max_bytes`
+    as <worker>-<n>.jsonl. When a test ends, one index line records the byte ranges holding its
+    records and the offsets of records per selector, so lookups seek instead of scanning.
+    """
+
+    def __init__(self, directory: Path, worker: str, run_id: str, max_bytes: int = 64 * 1024 * 1024):
+        super().__init__()
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.worker = worker
+        self.run_id = run_id
+        self.max_bytes = max_bytes
+        existing = sorted(self.directory.glob(f"{worker}-*.jsonl"))
+        self._seq = int(existing[-1].stem.rsplit("-", 1)[1]) + 1 if existing else 0
+        self._file = None
+        self._name = ""
+        self._index = open(self.directory / f"{worker}.index.jsonl", "a", encoding="utf-8")
+        self._segments: Dict[str, List[List]] = {}
+        self._selectors: Dict[str, Dict[str, List]] = {}
+        self._counts: Dict[str, int] = {}
+
+    def _open_next(self) -> None:
+        if self._file is not None:
+            self._file.close()
+        self._name = f"{self.worker}-{self._seq:04d}.jsonl"
+        self._seq += 1
+        self._file = open(self.directory / self._name, "ab")
+
+    def _serialize(self, record: logging.LogRecord) -> bytes:
+        payload = {
+            "ts": round(record.created, 6),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+            "test": getattr(record, "test_id", None),
+            "worker": self.worker,
+            "run": self.run_id,
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_text:
+            payload["exc"] = record.exc_text
+        elif record.exc_info:
+            payload["exc"] = logging.Formatter().formatException(record.exc_info)
+        return (json.dumps(payload, default=str, ensure_ascii=False) + "\n").encode("utf-8")
+
+    def emit(self, record: logging.LogRecord) -> None:
+        test = getattr(record, "test_id", None)
+        try:
+            line = self._serialize(record)
+            if self._file is None or 0 < self._file.tell() and self._file.tell() + len(line) > self.max_bytes:
+                self._open_next()
+            offset = self._file.tell()
+            self._file.write(line)
+        except Exception:
+            self.handleError(record)
+            return
+        if test is None:
+            return
+        segments = self._segments.setdefault(test, [])
+        if segments and segments[-1][0] == self._name and segments[-1][2] == offset:
+            segments[-1][2] = offset + len(line)
+        else:
+            segments.append([self._name, offset, offset + len(line)])
+        self._counts[test] = self._counts.get(test, 0) + 1
+        selector = record.__dict__.get("selector")
+        if selector:
+            self._selectors.setdefault(test, {}).setdefault(str(selector), []).append([self._name, offset])
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        if _OPEN in record.__dict__:
+            return True
+        if _CLOSE in record.__dict__:
+            test = record.__dict__.get("_route_test")
+            if test:
+                self.finish_test(test)
+            return True
+        return super().handle(record)
+
+    def finish_test(self, test: str) -> None:
+        """Write the index line for `test` (called on the listener thread when the test ends)."""
+        segments = self._segments.pop(test, None)
+        if not segments:
+            return
+        if self._file is not None:
+            self._file.flush()
+        entry = {
+            "test": test,
+            "worker": self.worker,
+            "run": self.run_id,
+            "records": self._counts.pop(test, 0),
+            "segments": segments,
+            "selectors": self._selectors.pop(test, {}),
+        }
+        self._index.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._index.flush()
+
+    def close(self) -> None:
+        for test in list(self._segments):
+            self.finish_test(test)
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._index.close()
+        super().close()
+
+
+class TestLogRouter:
+    """
+    Per-test log files written on a background thread.
+
+    One QueueHandler stays on the root logger for the whole session; `begin(path)` points it at
+    a test's file and `end()` closes that file once the listener has drained the test's records.
+    The file level (LOG_FILE_LEVEL) is independent of the console level used by pytest's
+    live-log handler (LOG_CONSOLE_LEVEL / log_cli_level). The root logger's level is left alone;
+    only the framework loggers and those passed to `watch()` are lowered to the file level.
+    """
+
+    __test__ = False  # not a pytest test class despite the name
+
+    def __init__(
+        self,
+        file_level: int = logging.DEBUG,
+        fmt: str = LOG_FORMAT,
+        structured: Optional[StructuredLogSink] = None,
+    ):
+        self.file_level = file_level
+        self.current: Optional[str] = None
+        self.current_test: Optional[str] = None
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._handler = _RoutingQueueHandler(self._queue, self)
+        self._handler.setLevel(file_level)
+        self._sink = _PerTestFileHandler(logging.Formatter(fmt))
+        self._structured = structured
+        sinks = [self._sink] + ([structured] if structured is not None else [])
+        # Control records must reach the file sink last: it signals `end(wait=True)` callers
+        self._listener = QueueListener(self._queue, *reversed(sinks), respect_handler_level=False)
+        self._lock = threading.Lock()
+        self._overhead = 0.0
+        self._records = 0
+        self._lowered: Dict[str, int] = {}
+
+    def start(self) -> "TestLogRouter":
+        logging.getLogger().addHandler(self._handler)
+        self.watch(*FRAMEWORK_LOGGERS)
+        self._listener.start()
+        return self
+
+    def watch(self, *names: str) -> None:
+        """Let records down to the file level through the named loggers (restored on stop)."""
+        for name in names:
+            if name in self._lowered:
+                continue
+            logger = logging.getLogger(name)
+            if logger.getEffectiveLevel() > self.file_level:
+                self._lowered[name] = logger.level
+                logger.setLevel(self.file_level)
+
+    def stop(self) -> None:
+        logging.getLogger().removeHandler(self._handler)
+        for name, level in self._lowered.items():
+            logging.getLogger(name).setLevel(level)
+        self._lowered.clear()
+        self._listener.stop()
+        self._sink.close()
+        if self._structured is not None:
+            self._structured.close()
+
+    def add_overhead(self, seconds: float) -> None:
+        with self._lock:
+            self._overhead += seconds
+            self._records += 1
+
+    def begin(self, path: Path, test_id: Optional[str] = None) -> None:
+        if self.current is not None:
+            self.end(wait=True)
+        # The listener truncates the file (overwrite on reruns of the same test) once it has
+        # written everything still queued for it
+        self._queue.put(logging.makeLogRecord({_OPEN: str(path)}))
+        with self._lock:
+            self._overhead = 0.0
+            self._records = 0
+        self.current_test = test_id
+        self.current = str(path)
+
+    def end(self, wait: bool = False, timeout: float = 5.0) -> Tuple[int, float]:
+        """
+        Stop routing to the current file and queue its close. Returns (records, seconds spent on
+        the logging threads). With `wait`, blocks until the listener has flushed the file.
+        """
+        path, self.current = self.current, None
+        test, self.current_test = self.current_test, None
+        with self._lock:
+            stats = (self._records, self._overhead)
+        if path is not None:
+            done = threading.Event() if wait else None
+            self._queue.put(logging.makeLogRecord({_CLOSE: path, "_route_test": test, "_route_done": done}))
+            if done is not None:
+                done.wait(timeout)
+        return stats
+
+
+__all__ = ["FRAMEWORK_LOGGERS", "LOG_FORMAT", "StructuredLogSink", "TestLogRouter"]
@@ -0,0 +1,223 @@
+# python
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+from playwright.async_api import async_playwright, expect
+
+from automation_framework.config import global_config as gc
+from automation_framework.pages.keywords.login_keywords import (
+    INVENTORY_URL_RE,
+    LOGIN_CHECK_TIMEOUT_MS,
+    LOGIN_FORM,
+    LOGIN_SUCCESS_LOCATORS,
+    LOGIN_TIMEOUT_MS,
+    login_expectation,
+)
+from automation_framework.pages.locators.registry import get_registry
+from automation_framework.utils.browser_grid import BrowserGrid, grid_enabled, parse_grid_endpoints
+from automation_framework.utils.flags import as_bool
+
+logger = logging.getLogger(__name__)
+
+
+def batch_enabled(config=None) -> bool:
+    """
+    LOGIN_BATCH is on and this is not an xdist worker: every worker collects every item, so a
+    per-process batch would run all rows on each worker instead of its share.
+    """
+    if config is not None and hasattr(config, "workerinput"):
+        return False
+    return as_bool(gc.LOGIN_BATCH)
+
+
+def batch_concurrency() -> int:
+    raw = str(gc.LOGIN_BATCH_CONCURRENCY or "").strip()
+    if raw and raw != "0":
+        return max(1, int(raw))
+    return max(2, os.cpu_count() or 2)
+
+
+class LoginCase:
+    """One resolved CSV row: credentials plus the expected outcome."""
+
+    __slots__ = ("case_id", "username", "password", "validation")
+
+    def __init__(self, case_id: str, username: str, password: str, validation: Optional[dict]):
+        self.case_id = case_id
+        self.username = username
+        self.password = password
+        self.validation = validation
+
+
+class LoginResult:
+    __slots__ = ("case_id", "passed", "logged_in", "error", "url", "duration", "screenshot")
+
+    def __init__(self, case_id: str):
+        self.case_id = case_id
+        self.passed = False
+        self.logged_in = False
+        self.error: Optional[str] = None
+        self.url = ""
+        self.duration = 0.0
+        self.screenshot: Optional[bytes] = None
+
+    def raise_for_failure(self) -> None:
+        if not self.passed:
+            raise AssertionError(f"Login case {self.case_id} failed at {self.url or '(no page)'}: {self.error}")
+
+
+class LoginBatch:
+    """
+    Run login cases concurrently in isolated contexts of one browser.
+
+    Playwright's sync API cannot be shared across threads, so the batch runs the async API on
+    its own thread and event loop with an asyncio.Semaphore bounding open contexts. Results are
+    published per case as soon as they finish; `result(case_id)` blocks only for that case.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        cases: Iterable[LoginCase],
+        *,
+        concurrency: Optional[int] = None,
+        browser_name: str = "chromium",
+        headless: bool = True,
+        timeout: float = 15.0,
+    ):
+        self.base_url = base_url
+        self.cases: List[LoginCase] = list(cases)
+        self.concurrency = concurrency or batch_concurrency()
+        self.browser_name = browser_name
+        self.headless = headless
+        self.timeout_ms = timeout * 1000
+        self.results: Dict[str, LoginResult] = {}
+        self.error: Optional[BaseException] = None
+        self.elapsed = 0.0
+        self._events = {case.case_id: threading.Event() for case in self.cases}
+        self._thread = threading.Thread(target=self._run, name="login-batch", daemon=True)
+        registry = get_registry()
+        self._form = {name: registry.compile(selector) for name, selector in LOGIN_FORM.items()}
+        self._success = [registry.compile(selector) for selector in LOGIN_SUCCESS_LOCATORS]
+
+    def start(self) -> "LoginBatch":
+        logger.info(
+            "Login batch started",
+            extra={"cases": len(self.cases), "concurrency": self.concurrency, "browser": self.browser_name},
+        )
+        self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        started = time.perf_counter()
+        try:
+            asyncio.run(self._main())
+        except BaseException as exc:  # surfaced through result()
+            self.error = exc
+            logger.exception("Login batch aborted")
+        finally:
+            self.elapsed = time.perf_counter() - started
+            for event in self._events.values():
+                event.set()
+            logger.info(
+                "Login batch finished in %.2fs",
+                self.elapsed,
+                extra={"cases": len(self.cases), "concurrency": self.concurrency},
+            )
+
+    async def _main(self) -> None:
+        async with async_playwright() as pw:
+            browser_type = getattr(pw, self.browser_name)
+            browser = await (
+                self._connect_grid(browser_type) if grid_enabled() else browser_type.launch(headless=self.headless)
+            )
+            semaphore = asyncio.Semaphore(self.concurrency)
+            try:
+                await asyncio.gather(*(self._run_case(browser, semaphore, case) for case in self.cases))
+            finally:
+                await browser.close()
+
+    async def _connect_grid(self, browser_type):
+        """Connect through the grid scheduler: least-loaded healthy node first, with its launch options."""
+        grid = BrowserGrid(
+            None,
+            parse_grid_endpoints(gc.PW_GRID_ENDPOINTS),
+            headless=self.headless,
+            health_interval=float(gc.PW_GRID_HEALTH_INTERVAL),
+        )
+        last_error: Optional[BaseException] = None
+        for node in grid.schedule():
+            try:
+                return await browser_type.connect(node.endpoint, **grid.connect_options())
+            except Exception as exc:
+                last_error = exc
+                grid.mark_failed(node, exc)
+        raise RuntimeError(f"No browser grid node accepted the login batch: {grid.nodes}") from last_error
+
+    async def _run_case(self, browser, semaphore: asyncio.Semaphore, case: LoginCase) -> None:
+        result = LoginResult(case.case_id)
+        async with semaphore:
+            started = time.perf_counter()
+            context = await browser.new_context(viewport={"width": 1920, "height": 1080})
+            page = await context.new_page()
+            page.set_default_timeout(self.timeout_ms)
+            try:
+                await self._login(page, case, result)
+                result.passed = True
+            except Exception as exc:
+                result.error = f"{type(exc).__name__}: {exc}"
+                try:
+                    result.screenshot = await page.screenshot(full_page=True)
+                except Exception:
+                    pass
+            finally:
+                result.url = page.url
+                result.duration = time.perf_counter() - started
+                await context.close()
+        self.results[case.case_id] = result
+        self._events[case.case_id].set()
+
+    async def _login(self, page, case: LoginCase, result: LoginResult) -> None:
+        """Async twin of `perform_login`: same selectors, waits and success/error checks."""
+        form = self._form
+        await page.goto(self.base_url, wait_until="domcontentloaded")
+        await page.wait_for_load_state("networkidle")
+        await page.locator(form["username"]).first.fill(case.username or "")
+        await page.locator(form["password"]).first.fill(case.password or "")
+        await page.locator(form["submit"]).first.click()
+        await page.wait_for_load_state("networkidle", timeout=LOGIN_TIMEOUT_MS)
+
+        is_valid, message = login_expectation(case.validation)
+        if is_valid is True:
+            await expect(page).to_have_url(INVENTORY_URL_RE, timeout=LOGIN_TIMEOUT_MS)
+            for selector in self._success:
+                await expect(page.locator(selector).first).to_be_visible(timeout=LOGIN_CHECK_TIMEOUT_MS)
+            assert await page.locator(self._success[-1]).count() >= 1, "Expected at least one inventory item to be listed."
+            result.logged_in = True
+        elif is_valid is False:
+            error = page.locator(form["error"])
+            await expect(error).to_be_visible(timeout=LOGIN_CHECK_TIMEOUT_MS)
+            await expect(error).to_contain_text(message, timeout=LOGIN_CHECK_TIMEOUT_MS)
+        else:
+            result.logged_in = bool(INVENTORY_URL_RE.search(page.url or ""))
+
+    def result(self, case_id: str, timeout: Optional[float] = None) -> LoginResult:
+        event = self._events.get(case_id)
+        if event is None:
+            raise KeyError(f"Login case {case_id!r} is not part of this batch")
+        if not event.wait(timeout):
+            raise AssertionError(f"Login case {case_id} did not finish within {timeout}s")
+        result = self.results.get(case_id)
+        if result is None:
+            raise AssertionError(f"Login case {case_id} did not run: {self.error!r}")
+        return result
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        self._thread.join(timeout)
+
+
+__all__ = ["LoginBatch", "LoginCase", "LoginResult", "batch_concurrency", "batch_enabled"]
@@ -0,0 +1,221 @@
+# python
+"""
+Rank the slowest actions, waits and navigations across recorded Playwright traces.
+
+Usage:
+    python -m automation_framework.utils.trace_analyzer [TRACES_DIR] [--top 20] [--jobs N] [--json out.json]
+
+Trace zips are read in place (no extraction): the event log inside each zip is streamed line by
+line and only call events are decoded; snapshot and screencast lines are skipped unparsed. Zips
+are processed in parallel across cores and each worker returns per-test aggregates only.
+"""
+import argparse
+import heapq
+import json
+import os
+import sys
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from automation_framework.config import global_config as gc
+
+CATEGORIES = ("action", "wait", "navigation")
+_NAVIGATION_METHODS = {
+    "goto", "reload", "goBack", "goForward", "setContent",
+    "waitForNavigation", "waitForURL", "waitForLoadState",
+}
+_CALL_MARKERS = ('"type":"before"', '"type":"after"', '"type":"action"')
+_KEYWORD_DIRS = ("/pages/keywords/",)
+_HELPER_DIRS = ("/helpers/",)
+
+
+def _category(method: str, api_name: str) -> str:
+    if method in _NAVIGATION_METHODS:
+        return "navigation"
+    if method.startswith(("wait", "expect")) or api_name.startswith("expect"):
+        return "wait"
+    return "action"
+
+
+def _is_call_line(line: str) -> bool:
+    head = line[:64]
+    return any(marker in head for marker in _CALL_MARKERS)
+
+
+def _read_lines(archive: zipfile.ZipFile, name: str) -> Iterator[str]:
+    with archive.open(name) as raw:
+        for line in raw:
+            yield line.decode("utf-8", errors="replace")
+
+
+def _keyword_frames(archive: zipfile.ZipFile) -> Dict[str, str]:
+    """
+    callId -> innermost keyword function on its Python stack (from the .stacks entry), or the
+    innermost helper function when no keyword is on the stack.
+    """
+    names = [name for name in archive.namelist() if name.endswith(".stacks")]
+    if not names:
+        return {}
+    with archive.open(names[0]) as raw:
+        data = json.load(raw)
+    files = data.get("files", [])
+    keywords: Dict[str, str] = {}
+    for call_id, frames in data.get("stacks", []):
+        helper = None
+        for frame in frames:  # innermost first
+            file_index, function = frame[0], frame[3] if len(frame) > 3 else ""
+            path = files[file_index].replace("\\", "/") if file_index < len(files) else ""
+            if any(part in path for part in _KEYWORD_DIRS):
+                keywords[f"call@{call_id}"] = f"{Path(path).stem}.{function}"
+                break
+            if helper is None and any(part in path for part in _HELPER_DIRS):
+                helper = f"{Path(path).stem}.{function}"
+        else:
+            if helper is not None:
+                keywords[f"call@{call_id}"] = helper
+    return keywords
+
+
+def _calls(archive: zipfile.ZipFile) -> Iterator[Tuple[str, str, str, float, bool]]:
+    """(callId, api name, method, duration ms, failed) for every finished call in the trace."""
+    pending: Dict[str, Tuple[str, str, float]] = {}
+    for name in archive.namelist():
+        if not name.endswith(".trace"):
+            continue
+        for line in _read_lines(archive, name):
+            if not _is_call_line(line):
+                continue
+            event = json.loads(line)
+            kind = event.get("type")
+            if kind == "before":
+                method = event.get("method", "")
+                api = event.get("apiName") or f"{event.get('class', '')}.{method}"
+                pending[event["callId"]] = (api, method, event.get("startTime", 0.0))
+            elif kind == "after":
+                started = pending.pop(event.get("callId"), None)
+                if started is not None:
+                    api, method, start_time = started
+                    yield event["callId"], api, method, event.get("endTime", start_time) - start_time, bool(event.get("error"))
+            elif kind == "action":  # trace format < v4: one event per call
+                meta = event.get("metadata", {})
+                method = meta.get("method", "")
+                api = meta.get("apiName") or f"{meta.get('type', '')}.{method}"
+                duration = meta.get("endTime", 0.0) - meta.get("startTime", 0.0)
+                yield str(meta.get("id", "")), api, method, duration, bool(meta.get("error"))
+
+
+def analyze_trace(path: str, top: int = 20) -> Dict:
+    """Aggregates for one trace zip: totals per category and keyword, plus its `top` slowest calls."""
+    result = {
+        "test": Path(path).stem,
+        "path": path,
+        "calls": 0,
+        "totals": {category: 0.0 for category in CATEGORIES},
+        "keywords": {},
+        "slowest": [],
+        "error": None,
+    }
+    slowest: List[Tuple[float, int, Dict]] = []
+    try:
+        with zipfile.ZipFile(path) as archive:
+            keywords = _keyword_frames(archive)
+            for seq, (call_id, api, method, duration, failed) in enumerate(_calls(archive)):
+                category = _category(method, api)
+                keyword = keywords.get(call_id, "(test body)")
+                result["calls"] += 1
+                result["totals"][category] += duration
+                stats = result["keywords"].setdefault(keyword, {"calls": 0, "total_ms": 0.0, "max_ms": 0.0})
+                stats["calls"] += 1
+                stats["total_ms"] += duration
+                stats["max_ms"] = max(stats["max_ms"], duration)
+                record = {"api": api, "category": category, "ms": round(duration, 1), "keyword": keyword, "failed": failed}
+                if len(slowest) < top:
+                    heapq.heappush(slowest, (duration, seq, record))
+                else:
+                    heapq.heappushpop(slowest, (duration, seq, record))
+    except (OSError, zipfile.BadZipFile, ValueError, KeyError) as exc:
+        result["error"] = f"{type(exc).__name__}: {exc}"
+    result["slowest"] = [record for _, _, record in sorted(slowest, reverse=True)]
+    return result
+
+
+def _analyze(args: Tuple[str, int]) -> Dict:
+    return analyze_trace(*args)
+
+
+def analyze_dir(traces_dir: Path, top: int = 20, jobs: Optional[int] = None) -> Dict:
+    paths = sorted(str(path) for path in Path(traces_dir).glob("*.zip"))
+    jobs = jobs or os.cpu_count() or 1
+    if jobs > 1 and len(paths) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(paths))) as pool:
+            tests = list(pool.map(_analyze, [(path, top) for path in paths], chunksize=4))
+    else:
+        tests = [analyze_trace(path, top) for path in paths]
+
+    keywords: Dict[str, Dict] = {}
+    slowest: List[Dict] = []
+    for test in tests:
+        for keyword, stats in test["keywords"].items():
+            merged = keywords.setdefault(keyword, {"calls": 0, "total_ms": 0.0, "max_ms": 0.0})
+            merged["calls"] += stats["calls"]
+            merged["total_ms"] += stats["total_ms"]
+            merged["max_ms"] = max(merged["max_ms"], stats["max_ms"])
+        slowest.extend(dict(record, test=test["test"]) for record in test["slowest"])
+    return {
+        "traces": len(tests),
+        "tests": sorted(tests, key=lambda t: sum(t["totals"].values()), reverse=True),
+        "keywords": dict(sorted(keywords.items(), key=lambda kv: kv[1]["total_ms"], reverse=True)),
+        "slowest": heapq.nlargest(top, slowest, key=lambda record: record["ms"]),
+    }
+
+
+def _print_report(report: Dict, top: int) -> None:
+    print(f"Analyzed {report['traces']} trace(s)\n")
+    print(f"Slowest calls (top {top})")
+    print(f"{'ms':>9} {'category':<10} {'api':<32} {'keyword':<40} test")
+    for record in report["slowest"]:
+        flag = " !" if record["failed"] else ""
+        print(f"{record['ms']:>9.1f} {record['category']:<10} {record['api']:<32} {record['keyword']:<40} {record['test']}{flag}")
+
+    print(f"\nPer test (top {top} by total call time)")
+    print(f"{'total ms':>10} {'action':>9} {'wait':>9} {'nav':>9} {'calls':>6} test")
+    for test in report["tests"][:top]:
+        totals = test["totals"]
+        if test["error"]:
+            print(f"{'-':>10} {'':>9} {'':>9} {'':>9} {'':>6} {test['test']}  ({test['error']})")
+            continue
+        print(
+            f"{sum(totals.values()):>10.1f} {totals['action']:>9.1f} {totals['wait']:>9.1f} "
+            f"{totals['navigation']:>9.1f} {test['calls']:>6} {test['test']}"
+        )
+
+    print(f"\nPer keyword (top {top} by total call time)")
+    print(f"{'total ms':>10} {'max ms':>9} {'mean ms':>9} {'calls':>6} keyword")
+    for keyword, stats in list(report["keywords"].items())[:top]:
+        mean = stats["total_ms"] / stats["calls"] if stats["calls"] else 0.0
+        print(f"{stats['total_ms']:>10.1f} {stats['max_ms']:>9.1f} {mean:>9.1f} {stats['calls']:>6} {keyword}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("traces_dir", nargs="?", type=Path, default=Path(gc.PLAYWRIGHT_TRACES_DIR))
+    parser.add_argument("--top", type=int, default=20, help="Rows per section")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--json", type=Path, help="Optional path to write the full report as JSON")
+    args = parser.parse_args(argv)
+
+    if not args.traces_dir.is_dir():
+        print(f"No traces directory: {args.traces_dir}", file=sys.stderr)
+        return 1
+    report = analyze_dir(args.traces_dir, args.top, args.jobs)
+    _print_report(report, args.top)
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
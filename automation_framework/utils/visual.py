@@ -0,0 +1,286 @@
+# python
+import io
+import logging
+import os
+import re
+import struct
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import pytest
+from playwright.sync_api import Page
+
+from automation_framework.config import global_config as gc
+
+logger = logging.getLogger(__name__)
+
+Rect = Tuple[int, int, int, int]  # x, y, width, height in screenshot pixels
+
+_SAFE_NAME_RE = re.compile(r"[^A-Za-z0-9_.-]+")
+_HASH_SIZE = 8
+
+
+def _imaging():
+    try:
+        import numpy as np  # type: ignore
+        from PIL import Image  # type: ignore
+    except ImportError as exc:  # pragma: no cover
+        raise RuntimeError("numpy and Pillow are required for visual comparisons") from exc
+    return np, Image
+
+
+def _masked_pixels(png: bytes, masks: Sequence[Rect]):
+    """RGB pixel array of `png` with every mask rectangle blanked out."""
+    np, Image = _imaging()
+    with Image.open(io.BytesIO(png)) as image:
+        pixels = np.asarray(image.convert("RGB"), dtype=np.int16).copy()
+    for x, y, width, height in masks:
+        pixels[max(y, 0):y + height, max(x, 0):x + width] = 0
+    return pixels
+
+
+def png_size(png: bytes) -> Dict[str, int]:
+    """Width and height from the PNG header, without decoding the image."""
+    width, height = struct.unpack(">II", png[16:24])
+    return {"width": width, "height": height}
+
+
+def dhash(pixels) -> int:
+    """64-bit difference hash: sign of horizontal gradients on a 9x8 grayscale thumbnail."""
+    np, Image = _imaging()
+    gray = Image.fromarray(pixels.astype(np.uint8)).convert("L")
+    thumb = np.asarray(gray.resize((_HASH_SIZE + 1, _HASH_SIZE), Image.BILINEAR), dtype=np.int16)
+    bits = (thumb[:, 1:] > thumb[:, :-1]).flatten()
+    return int(np.packbits(bits).view(">u8")[0])
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+class VisualResult:
+    """Outcome of one comparison; `reason` says which stage decided it."""
+
+    __slots__ = ("name", "passed", "missing", "reason", "diff_ratio", "hash_distance", "diff_path", "duration")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.passed = False
+        self.missing = False
+        self.reason = ""
+        self.diff_ratio = 0.0
+        self.hash_distance = 0
+        self.diff_path: Optional[Path] = None
+        self.duration = 0.0
+
+    def __repr__(self) -> str:
+        state = "passed" if self.passed else "FAILED"
+        return f"VisualResult({self.name}: {state}, {self.reason}, diff={self.diff_ratio:.4%})"
+
+
+def compare_images(
+    name: str,
+    actual: bytes,
+    expected: bytes,
+    *,
+    masks: Sequence[Rect] = (),
+    threshold: float = 0.1,
+    max_diff_ratio: float = 0.0001,
+    hash_fail_distance: int = 12,
+    diff_path: Optional[Path] = None,
+) -> VisualResult:
+    """
+    Compare two PNG screenshots.
+
+    Stages, cheapest first: identical bytes pass without decoding; a dHash distance above
+    `hash_fail_distance` fails without the per-pixel pass (the layout is plainly different);
+    otherwise a vectorized per-pixel diff counts pixels whose largest channel delta exceeds
+    `threshold` (0-1) outside the masks and fails above `max_diff_ratio` of the image. A dHash
+    match alone is not treated as identical: small text or price changes keep the same hash.
+    """
+    result = VisualResult(name)
+    started = time.perf_counter()
+    try:
+        if actual == expected:
+            result.passed, result.reason = True, "identical"
+            return result
+
+        np, Image = _imaging()
+        actual_px = _masked_pixels(actual, masks)
+        expected_px = _masked_pixels(expected, masks)
+        if actual_px.shape != expected_px.shape:
+            result.reason = f"size {actual_px.shape[1]}x{actual_px.shape[0]} != {expected_px.shape[1]}x{expected_px.shape[0]}"
+            result.diff_ratio = 1.0
+            return result
+
+        result.hash_distance = hamming(dhash(actual_px), dhash(expected_px))
+        if result.hash_distance > hash_fail_distance:
+            result.reason = f"perceptual hash distance {result.hash_distance}"
+            result.diff_ratio = 1.0
+            return result
+
+        changed = np.abs(actual_px - expected_px).max(axis=2) > int(threshold * 255)
+        result.diff_ratio = float(changed.mean())
+        result.passed = result.diff_ratio <= max_diff_ratio
+        result.reason = f"{int(changed.sum())} pixel(s) differ"
+        if not result.passed and diff_path is not None:
+            overlay = actual_px.astype(np.uint8)
+            overlay[changed] = (255, 0, 64)
+            diff_path.parent.mkdir(parents=True, exist_ok=True)
+            Image.fromarray(overlay).save(diff_path)
+            result.diff_path = diff_path
+        return result
+    finally:
+        result.duration = time.perf_counter() - started
+
+
+class BaselineStore:
+    """
+    Baseline screenshots laid out as <root>/<browser>/<page>/<width>x<height>.png.
+    Baselines are only written with VISUAL_UPDATE_BASELINES=true, which records missing ones
+    and overwrites existing ones.
+    """
+
+    def __init__(self, root: Path, browser_name: str = "chromium", update: bool = False):
+        self.root = Path(root)
+        self.browser_name = browser_name
+        self.update = update
+        self._lock = threading.Lock()
+
+    def path(self, name: str, viewport: Dict[str, int]) -> Path:
+        folder = _SAFE_NAME_RE.sub("_", name)
+        return self.root / self.browser_name / folder / f"{viewport['width']}x{viewport['height']}.png"
+
+    def load(self, name: str, viewport: Dict[str, int]) -> Optional[bytes]:
+        path = self.path(name, viewport)
+        if self.update or not path.exists():
+            return None
+        return path.read_bytes()
+
+    def record(self, name: str, viewport: Dict[str, int], png: bytes) -> Path:
+        path = self.path(name, viewport)
+        with self._lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_bytes(png)
+            os.replace(tmp, path)
+        logger.info("Visual baseline recorded", extra={"baseline": str(path)})
+        return path
+
+
+class VisualChecker:
+    """
+    Screenshot-and-compare for one test.
+
+    `check()` takes the screenshot on the calling (browser) thread, which Playwright requires,
+    and hands decoding and diffing to a shared thread pool so the test keeps driving the page.
+    `verify()` waits for every pending comparison and raises one AssertionError listing failures.
+    A missing baseline skips the test, or fails it with `require_baselines` (VISUAL_REQUIRE_BASELINES).
+    """
+
+    def __init__(
+        self,
+        baselines: BaselineStore,
+        executor: ThreadPoolExecutor,
+        *,
+        diff_dir: Path = gc.VISUAL_DIFFS_DIR,
+        threshold: float = 0.1,
+        max_diff_ratio: float = 0.0001,
+        require_baselines: bool = False,
+    ):
+        self.baselines = baselines
+        self.executor = executor
+        self.diff_dir = Path(diff_dir)
+        self.threshold = threshold
+        self.max_diff_ratio = max_diff_ratio
+        self.require_baselines = require_baselines
+        self.pending: List[Tuple[str, Future]] = []
+        self.results: List[VisualResult] = []
+
+    def _compare(self, name: str, viewport: Dict[str, int], png: bytes, masks: Sequence[Rect]) -> VisualResult:
+        expected = self.baselines.load(name, viewport)
+        diff_name = _SAFE_NAME_RE.sub("_", f"{name}-{viewport['width']}x{viewport['height']}")
+        if expected is None:
+            result = VisualResult(name)
+            if self.baselines.update:
+                self.baselines.record(name, viewport, png)
+                result.passed, result.reason = True, "baseline recorded"
+                return result
+            # Keep the screenshot next to the diffs so it can be reviewed and promoted
+            candidate = self.diff_dir / f"{diff_name}-candidate.png"
+            candidate.parent.mkdir(parents=True, exist_ok=True)
+            candidate.write_bytes(png)
+            result.missing, result.diff_path = True, candidate
+            result.reason = f"no baseline at {self.baselines.path(name, viewport)}"
+            return result
+        return compare_images(
+            name,
+            png,
+            expected,
+            masks=masks,
+            threshold=self.threshold,
+            max_diff_ratio=self.max_diff_ratio,
+            diff_path=self.diff_dir / f"{diff_name}.png",
+        )
+
+    def check(
+        self,
+        page: Page,
+        name: str,
+        *,
+        mask: Iterable[str] = (),
+        mask_rects: Sequence[Rect] = (),
+        full_page: bool = False,
+    ) -> Future:
+        """
+        Queue a comparison of the current page against the `name` baseline for this viewport.
+        `mask` selectors are painted over by Playwright at capture; `mask_rects` are ignored by
+        the diff. Returns the Future for callers that want the VisualResult immediately.
+        """
+        locators = [page.locator(selector) for selector in mask]
+        png = page.screenshot(full_page=full_page, mask=locators, animations="disabled", caret="hide")
+        # Headful runs use no_viewport, so the screenshot itself gives the window size
+        viewport = page.viewport_size or png_size(png)
+        future = self.executor.submit(self._compare, name, viewport, png, tuple(mask_rects))
+        self.pending.append((name, future))
+        return future
+
+    def verify(self) -> List[VisualResult]:
+        results = [future.result() for _, future in self.pending]
+        self.pending.clear()
+        self.results.extend(results)
+        for result in results:
+            logger.info(
+                "Visual comparison %s: %s",
+                result.name,
+                result.reason,
+                extra={"passed": result.passed, "diff_ratio": result.diff_ratio, "duration": result.duration},
+            )
+        failures = [
+            result for result in results if not result.passed and (self.require_baselines or not result.missing)
+        ]
+        missing = [result for result in results if result.missing]
+        if missing and not failures:
+            pytest.skip(
+                "Missing visual baselines (set VISUAL_UPDATE_BASELINES=true to record): "
+                + "; ".join(result.reason for result in missing)
+            )
+        assert not failures, "Visual differences: " + "; ".join(
+            f"{r.name} ({r.reason}, {r.diff_ratio:.2%}{', diff ' + str(r.diff_path) if r.diff_path else ''})"
+            for r in failures
+        )
+        return results
+
+
+__all__ = [
+    "BaselineStore",
+    "VisualChecker",
+    "VisualResult",
+    "compare_images",
+    "dhash",
+    "hamming",
+    "png_size",
+]
@@ -0,0 +1,138 @@
+# python
+import logging
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from playwright.sync_api import sync_playwright
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserWarmup:
+    """
+    Prepare browser-side session state on a background thread while pytest collects.
+
+    Playwright's sync API is bound to the thread that created it, so the warm-up runs its
+    own driver/browser, which is discarded afterwards (the session `browser` fixture still
+    launches its own). What carries over is the login: once collection shows that a selected
+    test needs it (`set_needed`), the storage state is written to a file that
+    `auth_storage_state` picks up instead of logging in again. Only that login time is
+    reported as saved.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        username: str,
+        password: str,
+        *,
+        headless: bool = True,
+        state_dir: Optional[Path] = None,
+    ):
+        self.base_url = base_url
+        self.username = username
+        self.password = password
+        self.headless = headless
+        self._owns_dir = state_dir is None
+        self.state_dir = Path(state_dir or tempfile.mkdtemp(prefix="pw-warmup-"))
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        self.state_path = self.state_dir / "state.json"
+        self.timings: Dict[str, float] = {}
+        self.error: Optional[BaseException] = None
+        self.needed: Optional[bool] = None
+        self._decided = threading.Event()
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="pw-warmup", daemon=True)
+
+    def start(self) -> "BrowserWarmup":
+        self._started_at = time.perf_counter()
+        self._thread.start()
+        logger.info("Browser warm-up started in background")
+        return self
+
+    def _run(self) -> None:
+        # Imported lazily: pages import helpers that are not needed for configure itself
+        from automation_framework.pages import LoginPage
+
+        start = time.perf_counter()
+        try:
+            with sync_playwright() as pw:
+                self.timings["driver"] = time.perf_counter() - start
+                mark = time.perf_counter()
+                browser = pw.chromium.launch(headless=self.headless)
+                self.timings["browser_launch"] = time.perf_counter() - mark
+                try:
+                    # Collection decides whether any selected test uses the logged-in state
+                    self._decided.wait()
+                    if not self.needed:
+                        logger.info("No selected test needs auth state; warm-up skips the login")
+                        return
+                    mark = time.perf_counter()
+                    context = browser.new_context(viewport={"width": 1920, "height": 1080})
+                    page = context.new_page()
+                    LoginPage(page).login(
+                        self.base_url, self.username, self.password, {"isValid": True}
+                    )
+                    context.storage_state(path=str(self.state_path))
+                    context.close()
+                    self.timings["auth_state"] = time.perf_counter() - mark
+                finally:
+                    browser.close()
+        except BaseException as exc:  # surfaced to the joining fixture
+            self.error = exc
+        finally:
+            self.timings["total"] = time.perf_counter() - start
+            self._done.set()
+
+    def set_needed(self, needed: bool) -> None:
+        """Let the warm-up log in (True) or stop after the browser launch (False)."""
+        self.needed = needed
+        self._decided.set()
+
+    def cleanup(self) -> None:
+        """Release a waiting warm-up thread and remove the temporary state directory."""
+        self.set_needed(bool(self.needed))
+        self._done.wait(10)
+        if self._owns_dir:
+            shutil.rmtree(self.state_dir, ignore_errors=True)
+
+    def join(self, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Block until warm-up finishes; return the storage-state path or None on failure.
+        Logs and prints how much of the warm-up overlapped with collection/imports.
+        """
+        wait_start = time.perf_counter()
+        finished = self._done.wait(timeout)
+        waited = time.perf_counter() - wait_start
+        if not finished:
+            logger.warning("Browser warm-up did not finish within %ss; falling back", timeout)
+            return None
+        if self.error is not None:
+            logger.warning("Browser warm-up failed; falling back to in-session login: %s", self.error)
+            return None
+        if "auth_state" not in self.timings:
+            return None
+
+        # Driver start and browser launch are thrown away, so only the login counts; time spent
+        # waiting here is subtracted (a negative value means the warm-up cost time)
+        saved = self.timings["auth_state"] - waited
+        summary = (
+            f"[warmup] driver={self.timings.get('driver', 0.0):.2f}s "
+            f"browser_launch={self.timings.get('browser_launch', 0.0):.2f}s "
+            f"auth_state={self.timings.get('auth_state', 0.0):.2f}s | "
+            f"waited={waited:.2f}s | saved≈{saved:.2f}s"
+        )
+        print(summary)
+        logger.info(summary, extra={"warmup_timings": dict(self.timings), "warmup_saved": saved})
+        return str(self.state_path)
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+
+__all__ = ["BrowserWarmup"]